@@ -0,0 +1,3 @@
+"""
+Benchmarks for the easytk package. Each `bench_*` module can be run as a script.
+"""
@@ -0,0 +1,66 @@
+"""
+Runs all easytk benchmarks and optionally writes the results to a JSON file.
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --backend tkinter --only bench_show
+
+By default, the benchmarks use the headless backend, so that they
+can be run without a display.
+"""
+
+# ------------------------------
+# Imports
+#
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import importlib
+
+import easytk
+from benchmarks.utils import print_results, write_json
+
+# ------------------------------
+# Globals
+#
+BENCHMARKS = [
+    "bench_window",
+    "bench_layout",
+    "bench_values",
+    "bench_show",
+    "bench_async",
+    "bench_session",
+]
+
+
+# ------------------------------
+# Functions
+#
+def main():
+    """
+    Parses the command line arguments and runs the selected benchmarks.
+    """
+    parser = argparse.ArgumentParser(description="Run the easytk benchmarks.")
+    parser.add_argument("--backend", default="headless", help="backend to run the benchmarks with")
+    parser.add_argument("--output", help="path of the JSON file to write the results to")
+    parser.add_argument("--only", nargs="*", choices=BENCHMARKS, help="names of the benchmarks to run")
+    args = parser.parse_args()
+
+    easytk.set_backend(args.backend)
+
+    results = {}
+    for name in args.only or BENCHMARKS:
+        module = importlib.import_module(f"benchmarks.{name}")
+        results[name] = module.run()
+        print_results(module.TITLE, results[name])
+
+    if args.output:
+        write_json(results, args.output)
+
+
+# ------------------------------
+# Execution
+#
+if __name__ == "__main__":
+    main()
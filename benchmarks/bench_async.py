@@ -0,0 +1,88 @@
+"""
+Benchmark for the latency of `Window.show_async()` compared to the
+blocking `Window.show()`.
+"""
+
+# ------------------------------
+# Imports
+#
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+import time
+from typing import Dict, List
+
+import easytk
+from benchmarks.utils import print_results, summarize
+
+TITLE = "Async show latency"
+
+POLL_INTERVALS = (1, 10)
+
+
+# ------------------------------
+# Functions
+#
+def build_window(durations: List[float]) -> easytk.Window:
+    """
+    Builds a window, which is closed by a callback right after it is shown.
+    The time from showing the window until the callback ran is appended
+    to `durations`.
+    """
+    window = easytk.Window("YesNo")
+    window.add_entry("Entry")
+
+    def close():
+        durations.append(time.perf_counter() - start)
+        window.return_widget.yes_clicked()
+
+    window.master_frame.after(0, close)
+    start = time.perf_counter()
+    return window
+
+
+def run(repeat: int = 20) -> Dict[str, Dict[str, float]]:
+    """
+    Runs the benchmark and returns the summarized results: the time until
+    the first callback runs and until the result is returned to the caller.
+    """
+    results = {}
+    with easytk.Session():
+        durations, totals = [], []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            build_window(durations).show()
+            totals.append(time.perf_counter() - start)
+        results["show() to first callback"] = summarize(durations)
+        results["show() to result"] = summarize(totals)
+
+        for poll_interval in POLL_INTERVALS:
+            durations, totals = [], []
+
+            async def show_all():
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    await build_window(durations).show_async(poll_interval)
+                    totals.append(time.perf_counter() - start)
+
+            asyncio.run(show_all())
+            results[f"show_async({poll_interval}) to first callback"] = summarize(durations)
+            results[f"show_async({poll_interval}) to result"] = summarize(totals)
+
+    return results
+
+
+def main():
+    """
+    Runs the benchmark and prints the results.
+    """
+    print_results(TITLE, run())
+
+
+# ------------------------------
+# Execution
+#
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark for building and laying out windows with 10, 100 and 1000 widgets.
+
+The windows are built in testing mode, so that `show()` applies the
+layout without blocking in the event loop.
+"""
+
+# ------------------------------
+# Imports
+#
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from typing import Dict
+
+import easytk
+from benchmarks.utils import measure, print_results, summarize
+
+TITLE = "Window build and layout"
+
+
+# ------------------------------
+# Functions
+#
+def build_window(widget_count: int):
+    """
+    Builds a window with the given number of entries and applies its layout.
+    """
+    window = easytk.Window("Selection", testing=True)
+    for idx in range(widget_count):
+        window.add_entry(f"Field {idx}", default_value=str(idx))
+    window.show()
+    window.close()
+
+
+def run(widget_counts=(10, 100, 1000), repeat: int = 5) -> Dict[str, Dict[str, float]]:
+    """
+    Runs the benchmark and returns the summarized results.
+    """
+    results = {}
+    with easytk.Session():
+        for widget_count in widget_counts:
+            durations = measure(lambda: build_window(widget_count), repeat=repeat)
+            results[f"{widget_count} widgets"] = summarize(durations)
+
+    return results
+
+
+def main():
+    """
+    Runs the benchmark and prints the results.
+    """
+    print_results(TITLE, run())
+
+
+# ------------------------------
+# Execution
+#
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark comparing the per-dialog latency of windows inside an
+`easytk.Session` with the latency of windows without a session, which
+each start a fresh Tcl interpreter.
+
+Each dialog is built, shown and closed again automatically right after
+it has been mapped. The first dialog of the session includes entering
+the session, which creates the Tk root.
+"""
+
+# ------------------------------
+# Imports
+#
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+from typing import Dict
+
+import easytk
+from benchmarks.utils import print_results, summarize
+
+TITLE = "Session dialog latency"
+
+
+# ------------------------------
+# Functions
+#
+def show_dialog() -> float:
+    """
+    Builds and shows a small dialog, which closes itself as soon as
+    the event loop is running, and returns the elapsed time.
+    """
+    start = time.perf_counter()
+    window = easytk.Window("YesNo")
+    window.add_label("Benchmark dialog")
+    window.master_frame.after(1, lambda: window.return_widget.yes_clicked())
+    window.show()
+    return time.perf_counter() - start
+
+
+def run(dialogs: int = 20) -> Dict[str, Dict[str, float]]:
+    """
+    Runs the benchmark and returns the summarized results.
+    """
+    without_session = [show_dialog() for _ in range(dialogs)]
+
+    start = time.perf_counter()
+    with easytk.Session():
+        startup = time.perf_counter() - start
+        with_session = [show_dialog() for _ in range(dialogs)]
+    with_session[0] += startup
+
+    return {
+        "without session": summarize(without_session),
+        "session: first dialog": summarize(with_session[:1]),
+        "session: following dialogs": summarize(with_session[1:]),
+        "session: all dialogs": summarize(with_session),
+    }
+
+
+def main():
+    """
+    Runs the benchmark and prints the results.
+    """
+    results = run()
+    print_results(TITLE, results)
+    first, following = results["session: first dialog"]["median"], results["session: following dialogs"]["median"]
+    baseline, session = results["without session"]["mean"], results["session: all dialogs"]["mean"]
+    print(f"\nFollowing dialogs take {following / first:.1%} of the first dialog.")
+    print(f"Dialogs in a session take {session / baseline:.1%} of dialogs without a session on average.")
+
+
+# ------------------------------
+# Execution
+#
+if __name__ == "__main__":
+    main()
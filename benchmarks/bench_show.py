@@ -0,0 +1,73 @@
+"""
+Benchmark for the time from calling `Window.show()` until the window
+is mapped on the screen.
+"""
+
+# ------------------------------
+# Imports
+#
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+from typing import Dict, List
+
+import easytk
+from benchmarks.utils import print_results, summarize
+
+TITLE = "Show latency"
+
+
+# ------------------------------
+# Functions
+#
+def time_to_mapped(widget_count: int) -> float:
+    """
+    Shows a window with the given number of entries and returns the
+    time until it is mapped. The window is closed right afterwards.
+    """
+    window = easytk.Window("YesNo")
+    for idx in range(widget_count):
+        window.add_entry(f"Entry {idx}")
+
+    mapped_after: List[float] = []
+
+    def check_mapped():
+        if window.master_frame.winfo_ismapped():
+            mapped_after.append(time.perf_counter() - start)
+            window.return_widget.yes_clicked()
+        else:
+            window.master_frame.after(1, check_mapped)
+
+    window.master_frame.after(0, check_mapped)
+    start = time.perf_counter()
+    window.show()
+    return mapped_after[0]
+
+
+def run(widget_counts=(1, 10, 100), repeat: int = 5) -> Dict[str, Dict[str, float]]:
+    """
+    Runs the benchmark and returns the summarized results.
+    """
+    results = {}
+    with easytk.Session():
+        for widget_count in widget_counts:
+            durations = [time_to_mapped(widget_count) for _ in range(repeat)]
+            results[f"show() to mapped ({widget_count} widgets)"] = summarize(durations)
+
+    return results
+
+
+def main():
+    """
+    Runs the benchmark and prints the results.
+    """
+    print_results(TITLE, run())
+
+
+# ------------------------------
+# Execution
+#
+if __name__ == "__main__":
+    main()
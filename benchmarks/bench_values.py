@@ -0,0 +1,86 @@
+"""
+Benchmark for reading and writing widget values, including large
+listboxes and texts.
+"""
+
+# ------------------------------
+# Imports
+#
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from typing import Dict
+
+import easytk
+from benchmarks.utils import measure, print_results, summarize
+
+TITLE = "Widget values"
+
+LISTBOX_SIZES = (10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+TEXT_SIZES_MB = (1, 4, 16)
+
+
+# ------------------------------
+# Functions
+#
+def build_form(field_count: int = 20) -> easytk.Window:
+    """
+    Builds a window with entries, checkbuttons and an exported text,
+    which are collected by the return widget.
+    """
+    window = easytk.Window("Selection", testing=True)
+    for idx in range(field_count):
+        window.add_entry(f"Entry {idx}", default_value=str(idx))
+        window.add_checkbutton(f"Checkbutton {idx}", on=idx % 2 == 0)
+    window.add_text("Text", export=True)
+    window.show()
+    return window
+
+
+def run(repeat: int = 5) -> Dict[str, Dict[str, float]]:
+    """
+    Runs the benchmark and returns the summarized results.
+    """
+    results = {}
+    with easytk.Session():
+        durations = measure(lambda window: window.return_widget.get_return_values(), repeat=repeat, setup=build_form)
+        results["get_return_values (41 widgets)"] = summarize(durations)
+
+        window = easytk.Window("Selection", testing=True)
+        listbox = window.add_listbox([], "Listbox")
+        virtual_listbox = window.add_virtual_listbox([], description="Virtual listbox")
+        for size in LISTBOX_SIZES:
+            values = [f"Item {idx}" for idx in range(size)]
+            results[f"EasyListbox.set_values ({size})"] = summarize(measure(lambda: listbox.set_values(values), repeat=repeat))
+            results[f"EasyVirtualListbox.set_values ({size})"] = summarize(
+                measure(lambda: virtual_listbox.set_values(values), repeat=repeat)
+            )
+
+        filtered_listbox = window.add_listbox([f"Item {idx}" for idx in range(10 ** 5)], filter_mode="substring")
+        for query in ("Item 1", "Item 12", "Item 123", "Item 1234"):
+            results[f"EasyListbox.apply_filter ('{query}', 100000)"] = summarize(
+                measure(lambda: filtered_listbox.apply_filter(query), repeat=repeat)
+            )
+
+        text = window.add_text()
+        for size in TEXT_SIZES_MB:
+            content = ("x" * 99 + "\n") * (size * 10 ** 4)
+            results[f"EasyText.set ({size} MB)"] = summarize(measure(lambda: text.set(content), repeat=repeat))
+        window.close()
+
+    return results
+
+
+def main():
+    """
+    Runs the benchmark and prints the results.
+    """
+    print_results(TITLE, run())
+
+
+# ------------------------------
+# Execution
+#
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark for building windows and adding each type of widget.
+"""
+
+# ------------------------------
+# Imports
+#
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from typing import Dict
+
+import easytk
+from benchmarks.utils import measure, print_results, summarize
+
+TITLE = "Window construction"
+
+# Arguments used to add one widget of each type to a window
+WIDGET_CALLS = {
+    "add_label": ("Label", ),
+    "add_entry": ("Entry", ),
+    "add_text": ("Text", ),
+    "add_checkbutton": ("Checkbutton", ),
+    "add_combobox": (["a", "b", "c"], "Combobox"),
+    "add_listbox": (["a", "b", "c"], "Listbox"),
+    "add_file_dialog": ("File", ),
+}
+
+
+# ------------------------------
+# Functions
+#
+def new_window() -> easytk.Window:
+    return easytk.Window("Selection", testing=True)
+
+
+def run(repeat: int = 200) -> Dict[str, Dict[str, float]]:
+    """
+    Runs the benchmark and returns the summarized results.
+    """
+    results = {}
+    windows = []
+    with easytk.Session():
+        results["Window.__init__"] = summarize(measure(lambda: windows.append(new_window()), repeat=repeat))
+        for method, args in WIDGET_CALLS.items():
+            durations = measure(lambda window: getattr(window, method)(*args), repeat=repeat, setup=lambda: windows.pop())
+            results[f"Window.{method}"] = summarize(durations)
+            windows.extend(new_window() for _ in range(repeat))
+
+    return results
+
+
+def main():
+    """
+    Runs the benchmark and prints the results.
+    """
+    print_results(TITLE, run())
+
+
+# ------------------------------
+# Execution
+#
+if __name__ == "__main__":
+    main()
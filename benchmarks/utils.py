@@ -0,0 +1,77 @@
+"""
+Helper functions, which are shared by the easytk benchmarks.
+"""
+
+# ------------------------------
+# Imports
+#
+import json
+import platform
+import statistics
+import time
+from typing import Callable, Dict, List
+
+import easytk
+from easytk.root import ROOT_MANAGER
+
+
+# ------------------------------
+# Functions
+#
+def measure(function: Callable, repeat: int = 10, setup: Callable = None) -> List[float]:
+    """
+    Calls the given `function` `repeat` times and returns the
+    measured durations in seconds.
+
+    If a `setup` function is given, it is called before each run without
+    being measured and its return value is passed to `function`.
+    """
+    durations = []
+    for _ in range(repeat):
+        args = (setup(), ) if setup is not None else ()
+        start = time.perf_counter()
+        function(*args)
+        durations.append(time.perf_counter() - start)
+
+    return durations
+
+
+def summarize(durations: List[float]) -> Dict[str, float]:
+    """
+    Returns the minimum, median, mean and maximum of the given durations.
+    """
+    return {
+        "min": min(durations),
+        "median": statistics.median(durations),
+        "mean": statistics.mean(durations),
+        "max": max(durations),
+        "runs": len(durations),
+    }
+
+
+def print_results(title: str, results: Dict[str, Dict[str, float]]):
+    """
+    Prints the summarized results of a benchmark in milliseconds.
+    """
+    print(f"\n{title}")
+    print(f"{'case':<40}{'min':>10}{'median':>10}{'mean':>10}{'max':>10}  [ms]")
+    for case, stats in results.items():
+        print(f"{case:<40}" + "".join(f"{stats[key] * 1000:>10.3f}" for key in ("min", "median", "mean", "max")))
+
+
+def write_json(results: Dict[str, Dict[str, Dict[str, float]]], path: str):
+    """
+    Writes the results of all benchmarks together with information about
+    the environment to a JSON file.
+    """
+    output = {
+        "easytk_version": easytk.__version__,
+        "backend": ROOT_MANAGER.backend.NAME,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "unit": "seconds",
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(output, f, indent=2)
@@ -14,16 +14,44 @@ widgets to it with the corresponding add_* methods.
     window.add_entry("Test", default_value="Default")
     window.show()
 
+Windows, that are built repeatedly, can also be described with a
+declarative spec, which is validated once and then instantiated
+many times:
+
+    template = easytk.compile_spec({"window_type": "YesNo", "widgets": [{"type": "label", "text": "Test"}]})
+    template.instantiate().show()
+
 Additionally, there are a few convenience functions for creating commonly
 used user interfaces, like a simple yes/no dialogue, or a dropdown selection.
 
     yes_or_no = easytk.ask_yes_no("Simple yes/no question.")
 
+To show several windows after one another without starting a new
+Tcl/Tk interpreter for each of them, use a `Session`:
+
+    with easytk.Session():
+        first = easytk.Window("YesNo").show()
+        second = easytk.Window("YesNo").show()
+
+Several windows can also be shown at the same time, e.g. to handle a queue
+of pending requests side by side:
+
+    first, second = easytk.gather(easytk.Window("YesNo"), easytk.Window("YesNo"))
+
 """
 
 __version__ = "0.1.0"
 
+import time as _time
+_IMPORT_START = _time.perf_counter()
+
 # ------------------------------
 # High level imports
 #
-from easytk.window import Window
+from easytk import profiling
+from easytk.root import ROOT_MANAGER as _ROOT_MANAGER, set_backend, startup_timings
+from easytk.session import Session
+from easytk.spec import WidgetSpec, WindowSpec, WindowTemplate, compile_spec
+from easytk.window import Window, WindowFuture, gather
+
+_ROOT_MANAGER.timings["import"] = _time.perf_counter() - _IMPORT_START
@@ -0,0 +1,50 @@
+"""
+The backends, which provide the widget classes used by easytk, are defined
+in this module.
+
+Each backend is a module exposing the same subset of the tkinter API
+(e.g. `Tk`, `Toplevel`, `Frame`, `StringVar`, `Combobox`, `filedialog`),
+so that the easytk widgets can be built without depending on a
+particular implementation:
+
+- "tkinter": The real tkinter widgets, which require a display.
+- "headless": A pure-Python, in-memory widget tree, which can be used to
+  build, drive and check windows without a Tcl interpreter, e.g. in tests.
+
+The default backend is read from the `EASYTK_BACKEND` environment variable
+and can be changed with `easytk.set_backend`.
+"""
+
+# ------------------------------
+# Imports
+#
+import importlib
+import os
+from types import ModuleType
+
+# ------------------------------
+# Globals
+#
+BACKENDS = {
+    "headless": "easytk.backends.headless",
+    "tkinter": "easytk.backends.tkinter_backend",
+}
+DEFAULT_BACKEND = "tkinter"
+
+
+# ------------------------------
+# Functions
+#
+def get_backend(name: str = None) -> ModuleType:
+    """
+    Returns the backend module with the given name. If no name is given,
+    the backend defined by the `EASYTK_BACKEND` environment variable
+    or the default tkinter backend is returned.
+    """
+    if name is None:
+        name = os.environ.get("EASYTK_BACKEND", DEFAULT_BACKEND)
+
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend: {name}. Expecting one of {sorted(BACKENDS)}.")
+
+    return importlib.import_module(BACKENDS[name])
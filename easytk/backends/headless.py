@@ -0,0 +1,1084 @@
+"""
+A pure-Python easytk backend, which keeps all widgets in an in-memory tree.
+
+It implements the subset of the tkinter API, that is used by easytk,
+without requiring a Tcl interpreter or a display. Values, selections and
+texts behave like their tkinter counterparts, so that windows can be built,
+driven and checked in tests:
+
+    easytk.set_backend("headless")
+    window = easytk.Window("Selection")
+    window.add_entry("Name", default_value="Test")
+    window.master_frame.after(0, lambda: window.return_widget.get_return_values())
+    assert window.show() == ("Test", )
+
+Scheduled callbacks (`after`) run on a virtual clock, which is only advanced
+by `Tk.update`, `Tk.advance` or while waiting for a window in `wait_window`.
+"""
+
+# ------------------------------
+# Imports
+#
+import functools
+import heapq
+import itertools
+import re
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# ------------------------------
+# Globals
+#
+NAME = "headless"
+END = "end"
+
+_INDEX_PATTERN = re.compile(r"^(?P<base>end|insert|\d+\.(\d+|end))\s*(?P<offset>[+-]\s*\d+\s*c(hars)?)?$")
+_TRACE_MODES = {"w": "write", "r": "read", "u": "unset"}
+
+# Root of the most recently created widget tree, used by variables without master
+_default_root = None
+
+# Virtual time in milliseconds, after which `wait_window` gives up waiting for
+# input. Recurring callbacks (e.g. the update queue of a window) would
+# otherwise keep a window, that is never closed, waiting forever.
+WAIT_TIMEOUT = 600_000
+
+
+class TclError(Exception):
+    """
+    Raised for invalid operations, where tkinter would raise a `tkinter.TclError`.
+    """
+
+
+# ------------------------------
+# Interpreter
+#
+class _Interpreter:
+    """
+    Stand-in for the Tcl interpreter of a tkinter root. The in-memory widgets
+    report every operation, that would be a Tcl round trip in tkinter,
+    to it, so that the calls can be counted by `easytk.profiling`.
+    """
+
+    def call(self, *args):
+        return None
+
+    def globalsetvar(self, name: str, value):
+        return None
+
+    def globalgetvar(self, name: str):
+        return None
+
+
+def _tcl_command(name: str):
+    """
+    Decorator for widget methods, which reports the method as Tcl
+    command to the interpreter of the widget.
+    """
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            self.tk.call(self._w, name)
+            return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ------------------------------
+# Variables
+#
+class Variable:
+    """
+    In-memory replacement of `tkinter.Variable`.
+    """
+
+    _default: Any = ""
+    _counter = itertools.count()
+
+    def __init__(self, master=None, value=None, name: str = None):
+        master = _default_root if master is None else master
+        self._tk = master.tk if master is not None else _Interpreter()
+        self._name = name if name is not None else f"PY_VAR{next(self._counter)}"
+        self._value = self._default if value is None else value
+        self._traces: Dict[str, Tuple[str, Callable]] = {}
+
+    def __str__(self) -> str:
+        return self._name
+
+    def set(self, value):
+        """
+        Sets the value and calls the registered write traces.
+        """
+        self._tk.globalsetvar(self._name, value)
+        self._value = tuple(value) if isinstance(value, list) else value
+        for mode, callback in list(self._traces.values()):
+            if mode == "write":
+                callback(self._name, "", "write")
+
+    def get(self):
+        self._tk.globalgetvar(self._name)
+        return self._value
+
+    def trace_add(self, mode: str, callback: Callable) -> str:
+        """
+        Registers a callback, which is called with the arguments
+        `(name, index, mode)` whenever the variable is written.
+        """
+        modes = (mode, ) if isinstance(mode, str) else tuple(mode)
+        name = f"trace{next(self._counter)}"
+        for single_mode in modes:
+            self._traces[f"{name}_{single_mode}"] = (single_mode, callback)
+        return name
+
+    def trace_remove(self, mode: str, name: str):
+        modes = (mode, ) if isinstance(mode, str) else tuple(mode)
+        for single_mode in modes:
+            self._traces.pop(f"{name}_{single_mode}", None)
+
+    def trace(self, mode: str, callback: Callable) -> str:
+        return self.trace_add(_TRACE_MODES.get(mode, mode), callback)
+
+    trace_variable = trace
+
+
+class StringVar(Variable):
+    _default = ""
+
+    def get(self) -> str:
+        value = super().get()
+        return value if isinstance(value, str) else str(value)
+
+
+class IntVar(Variable):
+    _default = 0
+
+    def get(self) -> int:
+        return int(super().get())
+
+
+# ------------------------------
+# Events and scheduling
+#
+class Event:
+    """
+    Minimal replacement of `tkinter.Event`.
+    """
+
+    def __init__(self, widget=None, **attributes):
+        self.widget = widget
+        self.x = self.y = 0
+        self.delta = 0
+        self.num = 0
+        self.keysym = ""
+        self.char = ""
+        self.__dict__.update(attributes)
+
+
+class _Scheduler:
+    """
+    Runs `after` callbacks on a virtual clock in milliseconds.
+    """
+
+    def __init__(self):
+        self.clock: float = 0.0
+        self._queue: List[Tuple[float, int, str, Callable, tuple]] = []
+        self._cancelled = set()
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def schedule(self, ms: float, func: Callable, args: tuple) -> str:
+        with self._lock:
+            sequence = next(self._counter)
+            after_id = f"after#{sequence}"
+            heapq.heappush(self._queue, (self.clock + max(ms, 0), sequence, after_id, func, args))
+        return after_id
+
+    def cancel(self, after_id: str):
+        with self._lock:
+            self._cancelled.add(after_id)
+
+    def pending(self) -> int:
+        with self._lock:
+            return sum(1 for entry in self._queue if entry[2] not in self._cancelled)
+
+    def _pop(self, until: Optional[float]):
+        with self._lock:
+            while self._queue:
+                due, _, after_id, func, args = self._queue[0]
+                if until is not None and due > until:
+                    return None
+                heapq.heappop(self._queue)
+                if after_id in self._cancelled:
+                    self._cancelled.discard(after_id)
+                    continue
+                return due, func, args
+        return None
+
+    def run_due(self, until: float = None) -> int:
+        """
+        Runs all callbacks, which are due until the given time, and
+        returns the number of executed callbacks.
+        """
+        until = self.clock if until is None else until
+        count = 0
+        entry = self._pop(until)
+        while entry is not None:
+            due, func, args = entry
+            self.clock = max(self.clock, due)
+            func(*args)
+            count += 1
+            entry = self._pop(until)
+
+        self.clock = max(self.clock, until)
+        return count
+
+    def run_next(self) -> bool:
+        """
+        Advances the clock to the next scheduled callback and runs it.
+        Returns False, if no callback is scheduled.
+        """
+        entry = self._pop(None)
+        if entry is None:
+            return False
+
+        due, func, args = entry
+        self.clock = max(self.clock, due)
+        func(*args)
+        return True
+
+
+# ------------------------------
+# Widgets
+#
+class Widget:
+    """
+    Base class of all in-memory widgets. It stores the widget options,
+    the geometry management state and the event bindings.
+    """
+
+    _counter = itertools.count()
+    _widget_name = "widget"
+
+    def __init__(self, master=None, cnf: Dict[str, Any] = None, **options):
+        self.master = master
+        self.children: Dict[str, "Widget"] = {}
+        self.options: Dict[str, Any] = dict(cnf or {}, **options)
+        self.bindings: Dict[str, List[Callable]] = {}
+        self.manager: Optional[str] = None
+        self.grid_options: Dict[str, Any] = {}
+        self.pack_options: Dict[str, Any] = {}
+        self.propagate: bool = True
+        self.destroyed: bool = False
+
+        self._name = f"!{self._widget_name}{next(self._counter)}"
+        if master is not None:
+            master.children[self._name] = self
+            self._w = f"{master._w.rstrip('.')}.{self._name}"
+            self.tk = master.tk
+            self.tk.call(self._widget_name, self._w)
+        else:
+            self._w = "."
+            self.tk = _Interpreter()
+
+    def __str__(self) -> str:
+        return self._w
+
+    def __getitem__(self, key: str):
+        return self.cget(key)
+
+    def __setitem__(self, key: str, value):
+        self.configure(**{key: value})
+
+    def _root(self) -> "Tk":
+        widget = self
+        while widget.master is not None:
+            widget = widget.master
+        return widget
+
+    # Options
+    @_tcl_command("configure")
+    def configure(self, cnf: Dict[str, Any] = None, **options):
+        options = dict(cnf or {}, **options)
+        if not options:
+            return dict(self.options)
+        self.options.update(options)
+
+    config = configure
+
+    @_tcl_command("cget")
+    def cget(self, key: str):
+        return self.options.get(key, "")
+
+    # Geometry management
+    @_tcl_command("grid")
+    def grid(self, **options):
+        if options or not self.grid_options:
+            self.grid_options = dict(options)
+        self.manager = "grid"
+
+    grid_configure = grid
+
+    @_tcl_command("grid remove")
+    def grid_remove(self):
+        if self.manager == "grid":
+            self.manager = None
+
+    @_tcl_command("grid forget")
+    def grid_forget(self):
+        if self.manager == "grid":
+            self.manager = None
+        self.grid_options = {}
+
+    @_tcl_command("grid info")
+    def grid_info(self) -> Dict[str, Any]:
+        return dict(self.grid_options) if self.manager == "grid" else {}
+
+    def grid_propagate(self, flag: bool = ...):
+        if flag is ...:
+            return self.propagate
+        self.propagate = bool(flag)
+
+    @_tcl_command("grid size")
+    def grid_size(self) -> Tuple[int, int]:
+        columns = rows = 0
+        for child in self.children.values():
+            if child.manager != "grid":
+                continue
+            options = child.grid_options
+            columns = max(columns, options.get("column", 0) + options.get("columnspan", 1))
+            rows = max(rows, options.get("row", 0) + options.get("rowspan", 1))
+        return columns, rows
+
+    @_tcl_command("pack")
+    def pack(self, **options):
+        self.pack_options = dict(options)
+        self.manager = "pack"
+
+    pack_configure = pack
+
+    @_tcl_command("pack forget")
+    def pack_forget(self):
+        if self.manager == "pack":
+            self.manager = None
+
+    @_tcl_command("winfo ismapped")
+    def winfo_ismapped(self) -> bool:
+        widget = self
+        while widget.master is not None:
+            if widget.manager is None or widget.destroyed:
+                return False
+            widget = widget.master
+        return True
+
+    def winfo_exists(self) -> bool:
+        return not self.destroyed
+
+    @_tcl_command("winfo manager")
+    def winfo_manager(self) -> str:
+        return self.manager or ""
+
+    def winfo_children(self) -> List["Widget"]:
+        return list(self.children.values())
+
+    def winfo_toplevel(self) -> "Widget":
+        widget = self
+        while widget.master is not None and not isinstance(widget, Toplevel):
+            widget = widget.master
+        return widget
+
+    def winfo_screenwidth(self) -> int:
+        return 1920
+
+    def winfo_screenheight(self) -> int:
+        return 1080
+
+    def winfo_reqwidth(self) -> int:
+        return int(self.options.get("width") or 1)
+
+    def winfo_reqheight(self) -> int:
+        return int(self.options.get("height") or 1)
+
+    winfo_width = winfo_reqwidth
+    winfo_height = winfo_reqheight
+
+    # Events
+    @_tcl_command("bind")
+    def bind(self, sequence: str, func: Callable = None, add: str = None) -> str:
+        if func is None:
+            return self.bindings.get(sequence, [])
+        if add:
+            self.bindings.setdefault(sequence, []).append(func)
+        else:
+            self.bindings[sequence] = [func]
+        return f"{id(func)}{sequence}"
+
+    def unbind(self, sequence: str, funcid: str = None):
+        self.bindings.pop(sequence, None)
+
+    @_tcl_command("event generate")
+    def event_generate(self, sequence: str, **attributes):
+        """
+        Calls all functions bound to the given event sequence.
+        """
+        event = Event(self, **attributes)
+        for func in list(self.bindings.get(sequence, [])):
+            func(event)
+
+    def focus_set(self):
+        pass
+
+    focus = focus_set
+
+    # Scheduling
+    @_tcl_command("after")
+    def after(self, ms: int, func: Callable = None, *args) -> Optional[str]:
+        scheduler = self._root().scheduler
+        if func is None:
+            scheduler.run_due(scheduler.clock + ms)
+            return None
+        return scheduler.schedule(ms, func, args)
+
+    def after_idle(self, func: Callable, *args) -> str:
+        return self.after(0, func, *args)
+
+    @_tcl_command("after cancel")
+    def after_cancel(self, after_id: str):
+        self._root().scheduler.cancel(after_id)
+
+    @_tcl_command("update")
+    def update(self):
+        self._root().scheduler.run_due()
+
+    update_idletasks = update
+
+    # Lifecycle
+    @_tcl_command("destroy")
+    def destroy(self):
+        for child in list(self.children.values()):
+            child.destroy()
+
+        self.destroyed = True
+        self.manager = None
+        if self.master is not None:
+            self.master.children.pop(self._name, None)
+        for func in list(self.bindings.get("<Destroy>", [])):
+            func(Event(self))
+
+    def wait_window(self, window: "Widget" = None):
+        """
+        Runs the scheduled callbacks until the given window is destroyed.
+
+        Since there is no user interaction, the window has to be closed by
+        a scheduled callback, otherwise a `TclError` is raised, once no
+        callbacks are scheduled or `WAIT_TIMEOUT` has passed.
+        """
+        window = self if window is None else window
+        scheduler = self._root().scheduler
+        timeout = scheduler.clock + WAIT_TIMEOUT
+        while not window.destroyed:
+            if not scheduler.run_next():
+                raise TclError("Headless window is waiting for input, but no callbacks are scheduled.")
+            if scheduler.clock > timeout:
+                raise TclError("Headless window is waiting for input, but was not closed by the scheduled callbacks.")
+
+
+class Tk(Widget):
+    """
+    Root of the in-memory widget tree, which also owns the scheduler.
+    """
+
+    _widget_name = "tk"
+
+    def __init__(self, *_, **options):
+        global _default_root
+        super().__init__(None, **options)
+        self.scheduler = _Scheduler()
+        self.state_value = "normal"
+        self._quit = False
+        if _default_root is None:
+            _default_root = self
+
+    def destroy(self):
+        global _default_root
+        super().destroy()
+        if _default_root is self:
+            _default_root = None
+
+    def withdraw(self):
+        self.state_value = "withdrawn"
+
+    def deiconify(self):
+        self.state_value = "normal"
+
+    def state(self) -> str:
+        return self.state_value
+
+    def title(self, title: str = None):
+        if title is None:
+            return self.options.get("title", "")
+        self.options["title"] = title
+
+    def advance(self, ms: float) -> int:
+        """
+        Advances the virtual clock by `ms` milliseconds and runs all
+        callbacks, which become due in that time.
+        """
+        return self.scheduler.run_due(self.scheduler.clock + ms)
+
+    def mainloop(self, n: int = 0):
+        self._quit = False
+        while not self._quit and not self.destroyed and self.scheduler.run_next():
+            pass
+
+    def quit(self):
+        self._quit = True
+
+
+class Toplevel(Widget):
+    _widget_name = "toplevel"
+
+    def __init__(self, master=None, cnf: Dict[str, Any] = None, **options):
+        super().__init__(master, cnf, **options)
+        self.attributes_values: Dict[str, Any] = {}
+        self.protocols: Dict[str, Callable] = {}
+        self.geometry_value = ""
+        self.state_value = "normal"
+        self.title_value = ""
+
+    @_tcl_command("title")
+    def title(self, title: str = None):
+        if title is None:
+            return self.title_value
+        self.title_value = title
+
+    @_tcl_command("attributes")
+    def attributes(self, *args):
+        for name, value in zip(args[::2], args[1::2]):
+            self.attributes_values[name.lstrip("-")] = value
+
+    wm_attributes = attributes
+
+    @_tcl_command("protocol")
+    def protocol(self, name: str, func: Callable = None):
+        self.protocols[name] = func
+
+    wm_protocol = protocol
+
+    @_tcl_command("geometry")
+    def geometry(self, geometry: str = None):
+        if geometry is None:
+            return self.geometry_value
+        self.geometry_value = geometry
+
+    @_tcl_command("withdraw")
+    def withdraw(self):
+        self.state_value = "withdrawn"
+
+    @_tcl_command("deiconify")
+    def deiconify(self):
+        self.state_value = "normal"
+
+    def state(self) -> str:
+        return self.state_value
+
+    def winfo_ismapped(self) -> bool:
+        return not self.destroyed and self.state_value == "normal"
+
+    def close(self):
+        """
+        Simulates closing the window with the window manager's close button.
+        """
+        handler = self.protocols.get("WM_DELETE_WINDOW")
+        if handler is not None:
+            handler()
+        else:
+            self.destroy()
+
+
+class Frame(Widget):
+    _widget_name = "frame"
+
+
+class Label(Widget):
+    _widget_name = "label"
+
+
+class Button(Widget):
+    _widget_name = "button"
+
+    @_tcl_command("invoke")
+    def invoke(self):
+        """
+        Calls the command of the button, like a click would.
+        """
+        command = self.options.get("command")
+        if command is not None and self.options.get("state") != "disabled":
+            return command()
+
+
+class Scrollbar(Widget):
+    _widget_name = "scrollbar"
+
+    def __init__(self, master=None, cnf: Dict[str, Any] = None, **options):
+        super().__init__(master, cnf, **options)
+        self.position: Tuple[float, float] = (0.0, 1.0)
+
+    @_tcl_command("set")
+    def set(self, first, last):
+        self.position = (float(first), float(last))
+
+    @_tcl_command("get")
+    def get(self) -> Tuple[float, float]:
+        return self.position
+
+
+class Checkbutton(Widget):
+    _widget_name = "checkbutton"
+
+    @_tcl_command("invoke")
+    def invoke(self):
+        """
+        Toggles the checkbutton, like a click would.
+        """
+        variable = self.options.get("variable")
+        if variable is not None:
+            variable.set(0 if variable.get() else 1)
+        command = self.options.get("command")
+        if command is not None:
+            return command()
+
+    def select(self):
+        self.options["variable"].set(1)
+
+    def deselect(self):
+        self.options["variable"].set(0)
+
+
+class Entry(Widget):
+    """
+    In-memory entry field, which stores its text in the given `textvariable`.
+    """
+
+    _widget_name = "entry"
+
+    def __init__(self, master=None, cnf: Dict[str, Any] = None, **options):
+        super().__init__(master, cnf, **options)
+        if self.options.get("textvariable") is None:
+            self.options["textvariable"] = StringVar()
+        self.cursor: int = 0
+        self.selection: Optional[Tuple[int, int]] = None
+        self.view: float = 0.0
+
+    @property
+    def _variable(self) -> StringVar:
+        return self.options["textvariable"]
+
+    def _index(self, index) -> int:
+        text = self.get()
+        if index in (END, "end"):
+            return len(text)
+        if index == "insert":
+            return self.cursor
+        return min(int(index), len(text))
+
+    @_tcl_command("get")
+    def get(self) -> str:
+        return str(self._variable.get())
+
+    @_tcl_command("insert")
+    def insert(self, index, value: str):
+        text, position = self.get(), self._index(index)
+        self._variable.set(text[:position] + value + text[position:])
+        self.cursor = position + len(value)
+
+    @_tcl_command("delete")
+    def delete(self, first, last=None):
+        text = self.get()
+        first = self._index(first)
+        last = first + 1 if last is None else self._index(last)
+        self._variable.set(text[:first] + text[last:])
+        self.cursor = min(self.cursor, first)
+
+    @_tcl_command("index")
+    def index(self, index) -> int:
+        return self._index(index)
+
+    @_tcl_command("icursor")
+    def icursor(self, index):
+        self.cursor = self._index(index)
+
+    @_tcl_command("select range")
+    def select_range(self, first, last):
+        self.selection = (self._index(first), self._index(last))
+
+    selection_range = select_range
+
+    @_tcl_command("select clear")
+    def select_clear(self):
+        self.selection = None
+
+    selection_clear = select_clear
+
+    def selection_present(self) -> bool:
+        return self.selection is not None and self.selection[0] != self.selection[1]
+
+    @_tcl_command("xview moveto")
+    def xview_moveto(self, fraction: float):
+        self.view = float(fraction)
+
+
+class Combobox(Entry):
+    """
+    In-memory replacement of `tkinter.ttk.Combobox`.
+    """
+
+    _widget_name = "combobox"
+
+    def __init__(self, master=None, cnf: Dict[str, Any] = None, **options):
+        super().__init__(master, cnf, **options)
+        self.posted: bool = False
+        self.dropdown_values: tuple = ()
+
+    @_tcl_command("current")
+    def current(self, index: int = None):
+        values = list(self.options.get("values") or ())
+        if index is None:
+            text = self.get()
+            return values.index(text) if text in values else -1
+        self.set(values[index])
+
+    @_tcl_command("set")
+    def set(self, value: str):
+        self._variable.set(value)
+
+    def post(self):
+        """
+        Simulates opening the dropdown list, which calls the `postcommand`.
+        """
+        postcommand = self.options.get("postcommand")
+        if postcommand:
+            postcommand()
+        self.posted = True
+        self.dropdown_values = tuple(self.options.get("values") or ())
+
+    def unpost(self):
+        """
+        Simulates closing the dropdown list.
+        """
+        self.posted = False
+
+
+class Listbox(Widget):
+    """
+    In-memory listbox, which keeps its items in the given `listvariable`
+    and its selection as a set of indices.
+    """
+
+    _widget_name = "listbox"
+
+    def __init__(self, master=None, cnf: Dict[str, Any] = None, **options):
+        super().__init__(master, cnf, **options)
+        if self.options.get("listvariable") is None:
+            self.options["listvariable"] = Variable(value=())
+        self.selected = set()
+        self.active: int = 0
+        self.view: float = 0.0
+
+    @property
+    def _items(self) -> tuple:
+        return self.options["listvariable"]._value or ()
+
+    def _set_items(self, items):
+        self.options["listvariable"].set(tuple(items))
+
+    def _index(self, index) -> int:
+        if index in (END, "end"):
+            return len(self._items)
+        if index == "active":
+            return self.active
+        return int(index)
+
+    @_tcl_command("size")
+    def size(self) -> int:
+        return len(self._items)
+
+    @_tcl_command("insert")
+    def insert(self, index, *elements):
+        items = list(self._items)
+        position = self._index(index)
+        items[position:position] = [str(element) for element in elements]
+        self._set_items(items)
+        self.selected = {idx + len(elements) if idx >= position else idx for idx in self.selected}
+
+    @_tcl_command("delete")
+    def delete(self, first, last=None):
+        items = list(self._items)
+        first = self._index(first)
+        last = first if last is None else min(self._index(last), len(items) - 1)
+        removed = last - first + 1
+        del items[first:last + 1]
+        self._set_items(items)
+        self.selected = {
+            idx - removed if idx > last else idx
+            for idx in self.selected
+            if not first <= idx <= last
+        }
+
+    @_tcl_command("get")
+    def get(self, first, last=None):
+        items = self._items
+        if last is None:
+            position = self._index(first)
+            return str(items[position]) if 0 <= position < len(items) else ""
+        return tuple(str(item) for item in items[self._index(first):self._index(last) + 1])
+
+    @_tcl_command("curselection")
+    def curselection(self) -> Tuple[int, ...]:
+        size = len(self._items)
+        return tuple(sorted(idx for idx in self.selected if idx < size))
+
+    @_tcl_command("selection set")
+    def selection_set(self, first, last=None):
+        first = self._index(first)
+        last = first if last is None else self._index(last)
+        self.selected.update(range(first, min(last, len(self._items) - 1) + 1))
+
+    select_set = selection_set
+
+    @_tcl_command("selection clear")
+    def selection_clear(self, first, last=None):
+        first = self._index(first)
+        last = first if last is None else self._index(last)
+        self.selected.difference_update(range(first, last + 1))
+
+    select_clear = selection_clear
+
+    @_tcl_command("selection includes")
+    def selection_includes(self, index) -> bool:
+        return self._index(index) in self.selected
+
+    @_tcl_command("activate")
+    def activate(self, index):
+        self.active = self._index(index)
+
+    @_tcl_command("index")
+    def index(self, index) -> int:
+        return self._index(index)
+
+    @_tcl_command("see")
+    def see(self, index):
+        pass
+
+    @_tcl_command("nearest")
+    def nearest(self, y: int) -> int:
+        return 0
+
+    @_tcl_command("yview")
+    def yview(self, *args):
+        if not args:
+            return self.view, min(self.view + 1.0, 1.0)
+        if args[0] == "moveto":
+            self.yview_moveto(args[1])
+
+    @_tcl_command("yview moveto")
+    def yview_moveto(self, fraction: float):
+        self.view = float(fraction)
+
+    def xview_moveto(self, fraction: float):
+        pass
+
+
+class Text(Widget):
+    """
+    In-memory text widget. Like in tkinter, the content always ends with
+    an implicit newline, which is excluded by the index "end-1c".
+    """
+
+    _widget_name = "text"
+
+    def __init__(self, master=None, cnf: Dict[str, Any] = None, **options):
+        super().__init__(master, cnf, **options)
+        self.content: str = ""
+        self.marks: Dict[str, int] = {"insert": 0}
+        self.modified: bool = False
+        self.view: Tuple[float, float] = (0.0, 1.0)
+        self.edit_callbacks: List[Callable[[str, str, str, str], None]] = []
+
+    def _line_start(self, line: int) -> int:
+        position = 0
+        for _ in range(line - 1):
+            position = self.content.find("\n", position)
+            if position == -1:
+                return len(self.content) + 1
+            position += 1
+        return position
+
+    def _offset(self, index) -> int:
+        """
+        Converts a tkinter text index (e.g. "1.0", "end-1c", "3.end") into
+        an offset into the content.
+        """
+        if isinstance(index, float):
+            index = f"{index:.1f}" if index == int(index) else str(index)
+        match = _INDEX_PATTERN.match(str(index).strip())
+        if match is None:
+            raise TclError(f'bad text index "{index}"')
+
+        base = match.group("base")
+        if base == "end":
+            position = len(self.content) + 1
+        elif base == "insert":
+            position = self.marks["insert"]
+        else:
+            line, column = base.split(".")
+            position = self._line_start(int(line))
+            if position > len(self.content):
+                position = len(self.content) + 1
+            else:
+                line_end = self.content.find("\n", position)
+                line_end = len(self.content) if line_end == -1 else line_end
+                position = line_end if column == "end" else min(position + int(column), line_end)
+
+        offset = match.group("offset")
+        if offset:
+            position += int(re.sub(r"[^\d+-]", "", offset))
+
+        return max(0, min(position, len(self.content) + 1))
+
+    def _position_index(self, position: int) -> str:
+        """
+        Converts an offset into the content into a "line.column" index.
+        """
+        position = min(position, len(self.content) + 1)
+        text = self.content + "\n"
+        line = text.count("\n", 0, position) + 1
+        column = position - (text.rfind("\n", 0, position) + 1)
+        return f"{line}.{column}"
+
+    @_tcl_command("index")
+    def index(self, index) -> str:
+        return self._position_index(self._offset(index))
+
+    @_tcl_command("insert")
+    def insert(self, index, chars: str, *_):
+        # Like Tk, a disabled text ignores all edits
+        if not chars or self.options.get("state") == "disabled":
+            return
+        position = min(self._offset(index), len(self.content))
+        self.content = self.content[:position] + chars + self.content[position:]
+        self.marks["insert"] = position + len(chars)
+        self._set_modified()
+        self._report_edit("insert", position, position + len(chars), chars)
+
+    @_tcl_command("delete")
+    def delete(self, index1, index2=None):
+        first = min(self._offset(index1), len(self.content))
+        last = first + 1 if index2 is None else min(self._offset(index2), len(self.content))
+        if last <= first or self.options.get("state") == "disabled":
+            return
+        # The indices of a deletion refer to the content before the deletion
+        end = self._position_index(last)
+        self.content = self.content[:first] + self.content[last:]
+        self.marks["insert"] = min(self.marks["insert"], len(self.content))
+        self._set_modified()
+        if self.edit_callbacks:
+            for callback in self.edit_callbacks:
+                callback("delete", self._position_index(first), end, "")
+
+    def _report_edit(self, operation: str, first: int, last: int, chars: str):
+        if self.edit_callbacks:
+            start, end = self._position_index(first), self._position_index(last)
+            for callback in self.edit_callbacks:
+                callback(operation, start, end, chars)
+
+    @_tcl_command("get")
+    def get(self, index1, index2=None) -> str:
+        text = self.content + "\n"
+        first = self._offset(index1)
+        last = first + 1 if index2 is None else self._offset(index2)
+        return text[first:last]
+
+    @_tcl_command("mark set")
+    def mark_set(self, name: str, index):
+        self.marks[name] = self._offset(index)
+
+    @_tcl_command("see")
+    def see(self, index):
+        # Only scrolling to the end is simulated
+        if self._offset(index) >= len(self.content):
+            height = self.view[1] - self.view[0]
+            self.view = (1.0 - height, 1.0)
+
+    @_tcl_command("edit modified")
+    def edit_modified(self, flag: bool = None):
+        if flag is None:
+            return self.modified
+        self.modified = bool(flag)
+
+    def _set_modified(self):
+        if not self.modified:
+            self.modified = True
+            self.event_generate("<<Modified>>")
+
+    @_tcl_command("yview")
+    def yview(self, *args):
+        if not args:
+            return self.view
+        if args[0] == "moveto":
+            self.yview_moveto(args[1])
+
+    @_tcl_command("yview moveto")
+    def yview_moveto(self, fraction: float):
+        fraction = float(fraction)
+        self.view = (fraction, min(fraction + (self.view[1] - self.view[0]), 1.0))
+
+    @_tcl_command("xview moveto")
+    def xview_moveto(self, fraction: float):
+        pass
+
+
+def watch_edits(text: Text, callback: Callable[[str, str, str, str], None]) -> None:
+    """
+    Calls `callback(operation, start, end, chars)` after every insertion
+    or deletion of the content of `text` (see the tkinter backend).
+    """
+    text.edit_callbacks.append(callback)
+
+
+def refresh_dropdown(combobox: Combobox) -> None:
+    """
+    Lists the current values of `combobox` in its dropdown, if it is open
+    (see the tkinter backend).
+    """
+    if combobox.posted:
+        combobox.dropdown_values = tuple(combobox.options.get("values") or ())
+
+
+# ------------------------------
+# Dialogs
+#
+class _FileDialog:
+    """
+    Replacement of `tkinter.filedialog`. Since no dialog can be shown,
+    every request returns the path stored in `response`.
+    """
+
+    def __init__(self):
+        self.response: str = ""
+        self.requests: List[Tuple[str, Dict[str, Any]]] = []
+
+    def _answer(self, kind: str, options: Dict[str, Any]) -> str:
+        self.requests.append((kind, options))
+        return self.response
+
+    def askopenfilename(self, **options) -> str:
+        return self._answer("open", options)
+
+    def askdirectory(self, **options) -> str:
+        return self._answer("directory", options)
+
+    def asksaveasfilename(self, **options) -> str:
+        return self._answer("save", options)
+
+
+filedialog = _FileDialog()
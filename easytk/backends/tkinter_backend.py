@@ -0,0 +1,138 @@
+"""
+The default easytk backend, which uses the real tkinter widgets.
+"""
+
+# ------------------------------
+# Imports
+#
+import tkinter as tk
+from tkinter import filedialog, ttk
+from typing import Callable
+
+# ------------------------------
+# Globals
+#
+NAME = "tkinter"
+END = tk.END
+TclError = tk.TclError
+
+# ------------------------------
+# Widgets and variables
+#
+Tk = tk.Tk
+Toplevel = tk.Toplevel
+Frame = tk.Frame
+Label = tk.Label
+Entry = tk.Entry
+Button = tk.Button
+Checkbutton = tk.Checkbutton
+Listbox = tk.Listbox
+Scrollbar = tk.Scrollbar
+Text = tk.Text
+Combobox = ttk.Combobox
+
+Variable = tk.Variable
+StringVar = tk.StringVar
+IntVar = tk.IntVar
+
+
+# ------------------------------
+# Functions
+#
+def watch_edits(text: tk.Text, callback: Callable[[str, str, str, str], None]) -> None:
+    """
+    Calls `callback(operation, start, end, chars)` after every insertion
+    ("insert"), deletion ("delete") or replacement ("replace") of the
+    content of `text`, including the edits made by the user.
+
+    The Tcl command of the widget is renamed and replaced by a proxy, since
+    Tk only reports, that a text was modified (`<<Modified>>`), but not
+    where. The indices of a deletion or replacement refer to the content
+    before the edit, those of an insertion to the content after it.
+    """
+    widget_command = text._w
+    original_command = widget_command + "_easytk"
+    call = text.tk.call
+    call("rename", widget_command, original_command)
+
+    def get_index(index) -> str:
+        # Like Tk, edits at "end" are applied before the final line break
+        index = str(call(original_command, "index", index))
+        if index == str(call(original_command, "index", "end")):
+            return str(call(original_command, "index", "end-1c"))
+        return index
+
+    def proxy(*args):
+        operation = args[0] if args else ""
+        if operation not in ("insert", "delete", "replace") or len(args) < 2:
+            return call((original_command,) + args)
+        if str(call(original_command, "cget", "-state")) == "disabled":
+            # Tk ignores the edit, so there is no change to report
+            return call((original_command,) + args)
+
+        try:
+            return edit(operation, args)
+        except tk.TclError:
+            # An invalid index (e.g. `sel.first` without a selection, which
+            # the bindings of Tk catch) leaves the text unchanged
+            return ""
+
+    def edit(operation: str, args: tuple):
+        start = get_index(args[1])
+        if operation == "insert":
+            chars = "".join(args[2::2])
+            result = call((original_command,) + args)
+            end = str(call(original_command, "index", f"{start} + {len(chars)} chars"))
+            changed = bool(chars)
+        elif operation == "delete" and len(args) > 3:
+            # Several ranges are reported as replacement of the whole span,
+            # whose remaining text is found with a mark at its end
+            indices = sorted((get_index(index) for index in args[1:]), key=_index_key)
+            start, end = indices[0], indices[-1]
+            call(original_command, "mark", "set", "easytk_edit_end", end)
+            result = call((original_command,) + args)
+            operation = "replace"
+            chars = str(call(original_command, "get", start, "easytk_edit_end"))
+            call(original_command, "mark", "unset", "easytk_edit_end")
+            changed = start != end
+        else:
+            if len(args) > 2:
+                end = get_index(args[2])
+            else:
+                end = get_index(f"{start} + 1 chars")
+            chars = "".join(args[3::2]) if operation == "replace" else ""
+            result = call((original_command,) + args)
+            # Tk ignores ranges, which end before their start
+            changed = bool(chars) or _index_key(start) < _index_key(end)
+
+        if changed:
+            callback(operation, start, end, chars)
+        return result
+
+    text.tk.createcommand(widget_command, proxy)
+    if text._tclCommands is None:
+        text._tclCommands = []
+    text._tclCommands.append(widget_command)
+
+
+def refresh_dropdown(combobox: ttk.Combobox) -> None:
+    """
+    Lists the current values of `combobox` in its dropdown, if it is open.
+    Tk only fills the list of the dropdown, when it is opened.
+    """
+    popdown = combobox.tk.call("ttk::combobox::PopdownWindow", combobox)
+    if combobox.tk.call("winfo", "ismapped", popdown):
+        combobox.tk.call("ttk::combobox::ConfigureListbox", combobox)
+
+
+def _index_key(index: str):
+    line, column = index.split(".")
+    return int(line), int(column)
+
+
+__all__ = [
+    "NAME", "END", "TclError", "filedialog", "watch_edits", "refresh_dropdown",
+    "Tk", "Toplevel", "Frame", "Label", "Entry", "Button", "Checkbutton",
+    "Listbox", "Scrollbar", "Text", "Combobox",
+    "Variable", "StringVar", "IntVar",
+]
@@ -0,0 +1,291 @@
+"""
+This module contains an easytk-native directory browser, which can be used
+instead of the `tkinter.filedialog` dialogs by `EasyFileDialog`.
+
+The native dialogs read and sort a whole directory, before they are shown,
+which takes very long for directories with hundreds of thousands of files.
+The browser shows the directory right away and streams the entries from
+`os.scandir` on a worker thread into an `EasyVirtualListbox`, which only
+renders the visible rows:
+
+    browser = DirectoryBrowser("/data", selection_type="file", filetypes=[("Tables", "*.csv")])
+    path = browser.browse()
+"""
+
+# ------------------------------
+# Imports
+#
+import os
+import time
+from typing import Dict, List, Literal, Optional, Sequence, Tuple, Union
+
+from easytk.filesystem import DirEntry, compile_filetypes, scan_directory
+from easytk.window import Window
+
+# ------------------------------
+# Globals
+#
+SORT_KEYS = Literal["name", "size", "mtime"]
+
+_ALL_FILES = ("All files", "*.*")
+
+# Factor, by which the number of loaded entries has to grow, before the
+# shown entries are sorted again, while a directory is loaded
+_GROWTH_FACTOR = 1.5
+
+
+# ------------------------------
+# Classes
+#
+class DirectoryBrowser:
+    """
+    Dialog to choose a file or directory, which lists the entries of the
+    current directory in a virtualized list. The entries can be sorted by
+    name, size and modification time (directories are always listed first)
+    and are filtered by the chosen file type.
+    """
+
+    def __init__(
+            self,
+            initial_dir: str = ...,
+            selection_type: Literal["file", "dir", "save"] = "file",
+            filetypes: Union[List[Tuple[str, str]], None] = None,
+            title: str = "Browse",
+            rows: int = 20,
+            testing: bool = False
+    ):
+        """
+        :param initial_dir: The directory, which is shown first
+        :param selection_type: If a file to open ("file"), a directory ("dir") or a file to save ("save") is chosen
+        :param filetypes: The file types, by which the files can be filtered, e.g. `[("Tables", "*.csv")]`
+        :param rows: The number of visible entries
+        """
+        if selection_type not in ("file", "dir", "save"):
+            raise ValueError(f"Invalid selection type: {selection_type}. Expecting 'file', 'dir' or 'save'.")
+
+        self.selection_type = selection_type
+        self.filetypes: List[Tuple[str, str]] = list(filetypes or [])
+        if _ALL_FILES not in self.filetypes:
+            self.filetypes.append(_ALL_FILES)
+
+        self.directory: str = ""
+        self.sort_key: SORT_KEYS = "name"
+        self.entries: List[DirEntry] = []
+        self.sort_keys: Dict[str, List[tuple]] = {"name": [], "size": [], "mtime": []}
+        self.visible: List[int] = []
+        self._sorted_count: int = 0
+
+        self.window = Window("SelectionFalse", title, testing=testing)
+        self.window.selection_text = "Save" if selection_type == "save" else "Open" if selection_type == "file" else "Select"
+
+        self.directory_entry = self.window.add_entry("Directory")
+        self.directory_entry.object.bind("<Return>", lambda _: self.set_directory(self.directory_entry.get()))
+
+        self.sort_box = self.window.add_combobox(["name", "size", "mtime"], "Sort by")
+        self.sort_box.object.config(state="readonly")
+        self.sort_box.object.bind("<<ComboboxSelected>>", lambda _: self.sort(self.sort_box.get()))
+
+        self.type_box = ...
+        if selection_type != "dir":
+            self.type_box = self.window.add_combobox([description for description, _ in self.filetypes], "File type")
+            self.type_box.object.config(state="readonly")
+            self.type_box.object.bind("<<ComboboxSelected>>", lambda _: self._update_visible())
+
+        self.listbox = self.window.add_virtual_listbox(self._get_row, length=0, rows=rows)
+        self.listbox.object.bind("<Double-Button-1>", lambda _: self.open_selected(), add="+")
+        self.listbox.object.bind("<Return>", lambda _: self.open_selected(), add="+")
+        self.listbox.object.bind("<<ListboxSelect>>", lambda _: self._on_select(), add="+")
+
+        self.name_entry = ...
+        if selection_type != "dir":
+            self.name_entry = self.window.add_entry("File name")
+
+        self.set_directory(os.getcwd() if initial_dir is ... else initial_dir)
+
+    def browse(self) -> str:
+        """
+        Shows the browser and returns the chosen path or an empty string,
+        if the dialog was cancelled (like the `tkinter.filedialog` dialogs).
+        """
+        return_values = self.window.show()
+        # The dialog was cancelled (`False`) or closed by the window manager (`...`)
+        if return_values is ... or return_values is False:
+            return ""
+
+        return self.get_path()
+
+    def get_path(self) -> str:
+        """
+        Returns the currently chosen path.
+        """
+        if self.selection_type == "dir":
+            entry = self._get_selected_entry()
+            if entry is not None and entry.is_dir:
+                return os.path.join(self.directory, entry.name)
+            return self.directory
+
+        name = self.name_entry.get().strip()
+        return os.path.join(self.directory, name) if name else ""
+
+    def set_directory(self, directory: str):
+        """
+        Shows the entries of the given directory, which are loaded in the background.
+        """
+        directory = os.path.abspath(os.path.expanduser(directory))
+        if not os.path.isdir(directory):
+            self.directory_entry.set(self.directory)
+            return
+
+        self.directory = directory
+        self.directory_entry.set(directory)
+        self.entries = []
+        self.sort_keys = {"name": [], "size": [], "mtime": []}
+        self.visible = []
+        self._sorted_count = 0
+        self.listbox.set_values(self._get_row, length=self._row_count())
+        self.listbox.load_chunked(
+            scan_directory(directory, with_stat=True),
+            self._add_entries,
+            self._update_visible,
+            threaded=True
+        )
+
+    def sort(self, sort_key: SORT_KEYS):
+        """
+        Sorts the entries by "name", "size" or "mtime" (newest first).
+        """
+        if sort_key not in self.sort_keys:
+            raise ValueError(f"Unknown sort key: {sort_key}")
+
+        self.sort_key = sort_key
+        self._update_visible()
+
+    def open_selected(self):
+        """
+        Opens the selected directory or chooses the selected file.
+        """
+        entry = self._get_selected_entry()
+        if entry is None:
+            return
+        if entry.is_dir:
+            self.set_directory(os.path.join(self.directory, entry.name))
+        elif self.window.return_widget is not ...:
+            self.window.return_widget.get_return_values()
+
+    def _get_selected_entry(self) -> Optional[DirEntry]:
+        """
+        Returns the selected entry, the parent directory or `None`.
+        """
+        if not self.listbox.selection:
+            return None
+
+        row = min(self.listbox.selection)
+        return self._get_row_entry(row) if row < self._row_count() else None
+
+    def _get_row_entry(self, row: int) -> DirEntry:
+        """
+        Returns the entry shown in the given row, including the parent directory.
+        """
+        if self._has_parent():
+            if row == 0:
+                return DirEntry(os.pardir, True)
+            row -= 1
+
+        return self.entries[self.visible[row]]
+
+    def _on_select(self):
+        """
+        Copies the name of a selected file to the name entry.
+        """
+        entry = self._get_selected_entry()
+        if entry is not None and not entry.is_dir and self.name_entry is not ...:
+            self.name_entry.set(entry.name)
+
+    def _add_entries(self, entries: List[DirEntry]):
+        """
+        Adds loaded entries and precomputes their sort keys. The shown
+        entries are only sorted again, after the number of entries has
+        grown sufficiently, which keeps the total sorting cost low.
+        """
+        keys = self.sort_keys
+        for entry in entries:
+            is_file = not entry.is_dir
+            name = entry.name.casefold()
+            keys["name"].append((is_file, name))
+            keys["size"].append((is_file, entry.size, name))
+            keys["mtime"].append((is_file, -entry.mtime, name))
+        self.entries.extend(entries)
+
+        if len(self.entries) >= self._sorted_count * _GROWTH_FACTOR:
+            self._update_visible()
+
+    def _update_visible(self):
+        """
+        Filters the entries by the selection type and the chosen file type
+        and sorts them by the chosen sort key. The selected entries stay
+        selected, although their rows change.
+        """
+        selected_names = {self._get_row_entry(row).name for row in self.listbox.selection if row < self._row_count()}
+        entries = self.entries
+        self._sorted_count = len(entries)
+        if self.selection_type == "dir":
+            indices = [idx for idx, entry in enumerate(entries) if entry.is_dir]
+        else:
+            pattern = compile_filetypes(self._get_filetypes())
+            if pattern is None:
+                indices = range(len(entries))
+            else:
+                indices = [idx for idx, entry in enumerate(entries) if entry.is_dir or pattern.match(entry.name)]
+
+        self.visible = sorted(indices, key=self.sort_keys[self.sort_key].__getitem__)
+        if selected_names:
+            offset = int(self._has_parent())
+            selection = {row + offset for row, idx in enumerate(self.visible) if entries[idx].name in selected_names}
+            if offset and os.pardir in selected_names:
+                selection.add(0)
+            self.listbox.selection = selection
+        self.listbox.refresh(self._row_count())
+
+    def _get_filetypes(self) -> Sequence[Tuple[str, str]]:
+        """
+        Returns the chosen file type as list, as used by `compile_filetypes`.
+        """
+        description = self.type_box.get() if self.type_box is not ... else ""
+        return [filetype for filetype in self.filetypes if filetype[0] == description][:1] or self.filetypes[:1]
+
+    def _has_parent(self) -> bool:
+        return os.path.dirname(self.directory) != self.directory
+
+    def _row_count(self) -> int:
+        return len(self.visible) + self._has_parent()
+
+    def _get_row(self, row: int) -> str:
+        """
+        Returns the text of a row of the listbox.
+        """
+        if self._has_parent():
+            if row == 0:
+                return os.pardir + os.sep
+            row -= 1
+
+        entry = self.entries[self.visible[row]]
+        if entry.is_dir:
+            return entry.name + os.sep
+
+        modified = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.mtime))
+        return f"{entry.name}    {_format_size(entry.size)}    {modified}"
+
+
+# ------------------------------
+# Functions
+#
+def _format_size(size: int) -> str:
+    """
+    Returns the file size in a human-readable unit.
+    """
+    for unit in ("B", "kB", "MB", "GB"):
+        if size < 1000:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1000
+
+    return f"{size:.1f} TB"
@@ -0,0 +1,117 @@
+"""
+This module contains a small thread-safe cache, whose entries expire after
+a time to live and which evicts the least recently used entries, when it
+is full.
+
+Caches, which are shared by all windows of a process, are defined here
+as well, so that repeated dialogs can reuse expensive results:
+
+    easytk.cache.PROVIDER_CACHE.ttl = 60
+    easytk.cache.STAT_CACHE.clear()
+"""
+
+# ------------------------------
+# Imports
+#
+import collections
+import threading
+import time
+from typing import Any, Callable, Hashable, Tuple
+
+# ------------------------------
+# Globals
+#
+_MISSING = object()
+
+
+# ------------------------------
+# Classes
+#
+class TTLCache:
+    """
+    Mapping with a maximum size and a time to live (in seconds) per entry.
+    """
+
+    def __init__(self, max_size: int = 128, ttl: float = 300.0, clock: Callable[[], float] = time.monotonic):
+        """
+        :param max_size: The maximum number of entries
+        :param ttl: The number of seconds, after which an entry expires, or `None`
+        :param clock: The function returning the current time in seconds
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: "collections.OrderedDict[Hashable, Tuple[float, Any]]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the value stored for `key` or `default`, if there is no
+        value or it has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if self.ttl is not None and self.clock() - entry[0] > self.ttl:
+                del self._entries[key]
+                return default
+
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Stores the `value` for `key` and evicts the least recently used
+        entry, if the cache is full.
+        """
+        with self._lock:
+            self._entries[key] = (self.clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """
+        Returns the value stored for `key` or calls `function` and stores
+        its result. The function is called without holding the lock, so
+        concurrent callers might compute the value more than once.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = function()
+            self.set(key, value)
+
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Removes the value stored for `key`.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Removes all values.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+# Results of the value providers of widgets (e.g. `EasyCombobox`)
+PROVIDER_CACHE = TTLCache(max_size=256, ttl=300.0)
+
+# Kinds of paths ("file", "dir", "other" or "missing"), which were checked by
+# an `EasyFileDialog`. The short time to live keeps them close to the file system.
+STAT_CACHE = TTLCache(max_size=1024, ttl=2.0)
+
+# Listings of directories, keyed by the path and modification time of the
+# directory, which are used by the path completion of `EasyFileDialog`
+DIRECTORY_CACHE = TTLCache(max_size=64, ttl=None)
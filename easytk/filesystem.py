@@ -0,0 +1,175 @@
+"""
+This module lists directories for the path completion and the directory
+browser of `EasyFileDialog`.
+
+Directory listings are read with `os.scandir`, which provides the type of
+each entry without an additional stat call on most platforms. Complete
+listings are cached by directory and modification time of the directory,
+so that a listing is only read again after an entry was added, removed or
+renamed.
+"""
+
+# ------------------------------
+# Imports
+#
+import fnmatch
+import os
+import re
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+from easytk.cache import DIRECTORY_CACHE
+from easytk.search import SearchIndex
+
+# ------------------------------
+# Globals
+#
+# Patterns of the `filetypes` of a file dialog, which match all files
+_ALL_FILES_PATTERNS = ("*", "*.*")
+
+
+# ------------------------------
+# Classes
+#
+class DirEntry:
+    """
+    A single entry of a directory. The size and modification time are
+    only read, if the directory is scanned with `with_stat`.
+    """
+
+    __slots__ = ("name", "is_dir", "size", "mtime")
+
+    def __init__(self, name: str, is_dir: bool, size: int = 0, mtime: float = 0.0):
+        self.name = name
+        self.is_dir = is_dir
+        self.size = size
+        self.mtime = mtime
+
+    def __repr__(self) -> str:
+        return f"DirEntry({self.name!r}, is_dir={self.is_dir})"
+
+
+class DirectoryListing:
+    """
+    All entries of a directory, sorted by name, with an index for
+    completing names by their prefix.
+    """
+
+    def __init__(self, path: str, mtime_ns: int, entries: List[DirEntry]):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.entries = sorted(entries, key=lambda entry: entry.name)
+        self._index: Optional[SearchIndex] = None
+
+    @property
+    def index(self) -> SearchIndex:
+        """
+        Returns the case-sensitive index over the names, which is built on first use.
+        """
+        if self._index is None:
+            self._index = SearchIndex([entry.name for entry in self.entries], case_sensitive=True)
+
+        return self._index
+
+    def complete(
+            self,
+            prefix: str,
+            selection_type: str = "file",
+            filetypes: Sequence[Tuple[str, Union[str, Sequence[str]]]] = None,
+            candidates: Sequence[int] = None
+    ) -> List[int]:
+        """
+        Returns the ascending indices of all entries, whose name starts with
+        `prefix` and which can be selected with the given `selection_type`:
+        directories are always listed, while files are only listed for the
+        types "file" and "save" and only if they match the `filetypes`.
+
+        :param candidates: The result for a shorter prefix, which is narrowed
+            instead of searching the index again
+        """
+        entries = self.entries
+        if candidates is None:
+            candidates = self.index.prefix(prefix)
+        else:
+            candidates = [idx for idx in candidates if entries[idx].name.startswith(prefix)]
+
+        if selection_type == "dir":
+            return [idx for idx in candidates if entries[idx].is_dir]
+
+        pattern = compile_filetypes(filetypes)
+        if pattern is None:
+            return list(candidates)
+        return [idx for idx in candidates if entries[idx].is_dir or pattern.match(entries[idx].name)]
+
+
+# ------------------------------
+# Functions
+#
+def compile_filetypes(filetypes: Sequence[Tuple[str, Union[str, Sequence[str]]]] = None) -> Optional[re.Pattern]:
+    """
+    Combines the patterns of the `filetypes` of a file dialog, e.g.
+    `[("Tables", "*.csv *.xlsx")]`, into one regular expression.
+
+    :return: the compiled expression or `None`, if all files are matched
+    """
+    patterns = []
+    for _, type_patterns in filetypes or ():
+        if isinstance(type_patterns, str):
+            type_patterns = type_patterns.split()
+        patterns.extend(type_patterns)
+
+    if not patterns or any(pattern in _ALL_FILES_PATTERNS for pattern in patterns):
+        return None
+
+    return _compile_patterns(tuple(patterns))
+
+
+_PATTERNS = {}
+
+
+def _compile_patterns(patterns: Tuple[str, ...]) -> re.Pattern:
+    """
+    Compiles the glob patterns into one regular expression. The results
+    are kept, because the same file types are used on every keystroke.
+    """
+    if patterns not in _PATTERNS:
+        flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+        _PATTERNS[patterns] = re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns), flags)
+
+    return _PATTERNS[patterns]
+
+
+def scan_directory(path: str, with_stat: bool = False) -> Iterator[DirEntry]:
+    """
+    Yields the entries of the directory at `path`, as they are read.
+
+    :param with_stat: If the size and modification time of each entry are read
+    """
+    with os.scandir(path) as iterator:
+        for entry in iterator:
+            try:
+                is_dir = entry.is_dir()
+                if with_stat:
+                    stat = entry.stat()
+                    yield DirEntry(entry.name, is_dir, stat.st_size, stat.st_mtime)
+                else:
+                    yield DirEntry(entry.name, is_dir)
+            except OSError:
+                # The entry was removed or cannot be accessed
+                continue
+
+
+def list_directory(path: str) -> DirectoryListing:
+    """
+    Returns the listing of the directory at `path`. Listings are cached
+    in the `DIRECTORY_CACHE` by directory and modification time, so that
+    only a single stat call is needed for an unchanged directory.
+    """
+    path = os.path.abspath(path)
+    mtime_ns = os.stat(path).st_mtime_ns
+    key = (path, mtime_ns)
+    listing = DIRECTORY_CACHE.get(key)
+    if listing is None:
+        listing = DirectoryListing(path, mtime_ns, list(scan_directory(path)))
+        DIRECTORY_CACHE.set(key, listing)
+
+    return listing
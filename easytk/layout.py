@@ -0,0 +1,153 @@
+"""
+This module contains the layout planner of easytk windows.
+
+Instead of placing every widget in the grid, when it is added to the window,
+the placements are recorded and the rows and columns are computed in Python.
+All widgets are then added to the grid in a single pass, when the window is shown.
+"""
+
+# ------------------------------
+# Imports
+#
+from typing import Dict, List
+
+
+# ------------------------------
+# Classes
+#
+class Placement:
+    """
+    Describes the grid position of a single widget.
+    """
+
+    __slots__ = ("widget", "frame", "row", "column", "column_span", "visible")
+
+    def __init__(self, widget, frame, row: int, column: int, column_span: int, visible: bool = True):
+        """
+        :type widget: easytk.widgets.EasyWidget
+        """
+        self.widget = widget
+        self.frame = frame
+        self.row = row
+        self.column = column
+        self.column_span = column_span
+        self.visible = visible
+
+    def apply(self):
+        """
+        Adds the widget to the grid of its frame at the planned position.
+        """
+        grid_object = self.widget.grid_object
+        grid_object.grid(row=self.row, column=self.column, columnspan=self.column_span)
+        if not self.visible:
+            grid_object.grid_remove()
+
+
+class GridLayout:
+    """
+    Records the placements of the widgets in a window and applies them
+    to the grid in one pass.
+
+    Once the layout has been applied, further placements are added to the
+    grid immediately. The return widget is moved down in that case, so that
+    it always stays below the other widgets in its frame.
+    """
+
+    def __init__(self):
+        self.applied: bool = False
+        self.placements: Dict[object, Placement] = {}
+        self.return_placement: Placement = ...
+        self._row_counts: Dict[object, int] = {}
+        self._column_counts: Dict[object, int] = {}
+
+    def row_count(self, frame) -> int:
+        """
+        Returns the number of rows, that are occupied in the given frame.
+        """
+        return self._row_counts.get(frame, 0)
+
+    def column_count(self, frame) -> int:
+        """
+        Returns the number of columns, that are occupied in the given frame.
+        """
+        return self._column_counts.get(frame, 0)
+
+    def place(
+            self,
+            widget,
+            frame,
+            row: int = ...,
+            column: int = 0,
+            column_span: int = 1,
+            is_return_widget: bool = False
+    ) -> Placement:
+        """
+        Plans the position of the given widget in the grid of `frame`.
+
+        If no `row` is given, the widget is placed in the next free row of the frame.
+
+        :type widget: easytk.widgets.EasyWidget
+        :return: the created `Placement`
+        """
+        if self.applied and not is_return_widget and self._is_below_return_widget(frame, row):
+            row = self.return_placement.row if row is ... else row
+            self._move_return_widget(row + 1)
+
+        if row is ...:
+            row = self.row_count(frame)
+
+        placement = Placement(widget, frame, row, column, column_span)
+        self.placements[widget] = placement
+        if is_return_widget:
+            self.return_placement = placement
+
+        self._row_counts[frame] = max(self.row_count(frame), row + 1)
+        self._column_counts[frame] = max(self.column_count(frame), column + column_span)
+
+        if self.applied:
+            placement.apply()
+
+        return placement
+
+    def hide(self, widget):
+        """
+        Removes the widget from the grid, while keeping its planned position.
+
+        :type widget: easytk.widgets.EasyWidget
+        """
+        placement = self.placements.get(widget)
+        if placement is not None and not self.applied:
+            placement.visible = False
+        else:
+            widget.grid_object.grid_remove()
+
+    def apply(self):
+        """
+        Adds all planned widgets to the grid in one pass.
+        """
+        if self.applied:
+            return
+
+        placements: List[Placement] = list(self.placements.values())
+        for placement in placements:
+            placement.apply()
+
+        self.applied = True
+
+    def _is_below_return_widget(self, frame, row: int) -> bool:
+        """
+        Checks if a widget at the given row would be placed at or below
+        the return widget.
+        """
+        if self.return_placement is ... or self.return_placement.frame is not frame:
+            return False
+
+        return row is ... or row >= self.return_placement.row
+
+    def _move_return_widget(self, row: int):
+        """
+        Moves the return widget to the given row.
+        """
+        self.return_placement.row = row
+        self._row_counts[self.return_placement.frame] = max(self.row_count(self.return_placement.frame), row + 1)
+        self.return_placement.apply()
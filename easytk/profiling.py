@@ -0,0 +1,275 @@
+"""
+This module contains an opt-in profiler for the Tcl calls, that are made
+by easytk windows and widgets.
+
+Almost all of the time spent in easytk goes into round trips from Python
+to the Tcl interpreter. When the profiler is enabled, the interpreter of
+the root object is wrapped, so that every call is counted and timed. The
+calls are attributed to the widget and the window phase ("construct",
+"layout", "show", "collect"), in which they were made:
+
+    profiler = easytk.profiling.enable()
+    window = easytk.Window("Selection")
+    window.add_entry("Name")
+    window.show()
+    print(profiler.report())
+    profiler.dump("tcl_calls.json")
+
+Calls, that are made outside of any phase (e.g. while the user interacts
+with the window), are collected in the phase "events".
+"""
+
+# ------------------------------
+# Imports
+#
+import contextlib
+import json
+import time
+from typing import Any, Callable, ContextManager, Dict, List, Optional
+
+from easytk.root import ROOT_MANAGER
+
+# ------------------------------
+# Globals
+#
+PHASES = ("construct", "layout", "show", "collect", "events")
+
+_NO_SCOPE = contextlib.nullcontext()
+_PROFILER: Optional["TclProfiler"] = None
+
+
+# ------------------------------
+# Classes
+#
+class CallStats:
+    """
+    Number and total duration of the calls of a single Tcl command.
+    """
+
+    __slots__ = ("count", "time")
+
+    def __init__(self):
+        self.count: int = 0
+        self.time: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"count": self.count, "time": self.time}
+
+
+class TclProfiler:
+    """
+    Counts and times the Tcl calls per widget and per window phase.
+    """
+
+    def __init__(self):
+        self.enabled: bool = True
+        self.phases: Dict[str, Dict[str, CallStats]] = {}
+        self.widgets: Dict[str, Dict[str, CallStats]] = {}
+        self._phase: str = "events"
+        self._widget: Optional[str] = None
+        self._roots: List[Any] = []
+
+    def attach(self, root):
+        """
+        Wraps the interpreter of the given root object, so that all calls
+        of widgets created afterwards are recorded.
+        """
+        if not isinstance(root.tk, _ProfiledInterpreter):
+            root.tk = _ProfiledInterpreter(root.tk, self)
+            self._roots.append(root)
+
+    def detach(self):
+        """
+        Stops recording and restores the original interpreters.
+        """
+        self.enabled = False
+        for root in self._roots:
+            if isinstance(root.tk, _ProfiledInterpreter):
+                root.tk = root.tk.interpreter
+        self._roots = []
+
+    def reset(self):
+        """
+        Removes all recorded calls.
+        """
+        self.phases = {}
+        self.widgets = {}
+
+    @contextlib.contextmanager
+    def scope(self, phase: str = None, widget: str = None):
+        """
+        Attributes all calls inside the context to the given window phase
+        and/or widget.
+        """
+        previous = self._phase, self._widget
+        if phase is not None:
+            self._phase = phase
+        if widget is not None:
+            self._widget = widget
+        try:
+            yield self
+        finally:
+            self._phase, self._widget = previous
+
+    def record(self, command: str, duration: float):
+        """
+        Adds a single call of `command` to the statistics of the current
+        phase and widget.
+        """
+        stats = self.phases.setdefault(self._phase, {}).setdefault(command, CallStats())
+        stats.count += 1
+        stats.time += duration
+        if self._widget is not None:
+            stats = self.widgets.setdefault(self._widget, {}).setdefault(command, CallStats())
+            stats.count += 1
+            stats.time += duration
+
+    def timed(self, command: str, function: Callable, args: tuple):
+        """
+        Calls `function` with the given arguments and records the duration.
+        """
+        if not self.enabled:
+            return function(*args)
+
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self.record(command, time.perf_counter() - start)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the recorded calls per phase and widget as a dictionary.
+        """
+        def convert(groups: Dict[str, Dict[str, CallStats]]) -> Dict[str, Any]:
+            return {
+                name: {
+                    "count": sum(stats.count for stats in commands.values()),
+                    "time": sum(stats.time for stats in commands.values()),
+                    "commands": {command: stats.to_dict() for command, stats in commands.items()},
+                }
+                for name, commands in groups.items()
+            }
+
+        return {"phases": convert(self.phases), "widgets": convert(self.widgets)}
+
+    def dump(self, path: str):
+        """
+        Writes the recorded calls to a JSON file.
+        """
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def report(self, top: int = 3) -> str:
+        """
+        Returns a human-readable summary of the recorded calls, listing the
+        `top` most expensive commands of each phase and widget.
+        """
+        data = self.to_dict()
+        lines = []
+        for title, groups in (("Phase", data["phases"]), ("Widget", data["widgets"])):
+            lines.append(f"{title:<40}{'calls':>8}{'time [ms]':>12}  top commands")
+            ordered = sorted(groups.items(), key=lambda item: item[1]["time"], reverse=True)
+            for name, group in ordered:
+                commands = sorted(group["commands"].items(), key=lambda item: item[1]["time"], reverse=True)[:top]
+                summary = ", ".join(f"{command} ({stats['count']})" for command, stats in commands)
+                lines.append(f"{name:<40}{group['count']:>8}{group['time'] * 1000:>12.3f}  {summary}")
+            lines.append("")
+
+        return "\n".join(lines)
+
+
+class _ProfiledInterpreter:
+    """
+    Wrapper around the Tcl interpreter of a root object, which records
+    all evaluated commands and variable accesses.
+    """
+
+    def __init__(self, interpreter, profiler: TclProfiler):
+        self.interpreter = interpreter
+        self.profiler = profiler
+
+    def __getattr__(self, name: str):
+        return getattr(self.interpreter, name)
+
+    def call(self, *args):
+        return self.profiler.timed(_command_name(args), self.interpreter.call, args)
+
+    def eval(self, script: str):
+        return self.profiler.timed("eval", self.interpreter.eval, (script, ))
+
+    def globalsetvar(self, *args):
+        return self.profiler.timed("set", self.interpreter.globalsetvar, args)
+
+    def globalgetvar(self, *args):
+        return self.profiler.timed("get", self.interpreter.globalgetvar, args)
+
+    def setvar(self, *args):
+        return self.profiler.timed("set", self.interpreter.setvar, args)
+
+    def getvar(self, *args):
+        return self.profiler.timed("get", self.interpreter.getvar, args)
+
+
+# ------------------------------
+# Functions
+#
+def _command_name(args: tuple) -> str:
+    """
+    Returns the name of the Tcl command of a `call`. For widget commands
+    (e.g. ".!frame.!entry xview moveto 1.0"), the subcommand is returned.
+    """
+    if len(args) == 1 and isinstance(args[0], tuple):
+        args = args[0]
+    if not args:
+        return ""
+
+    command = str(args[0])
+    if command.startswith(".") and len(args) > 1:
+        return str(args[1])
+
+    return command
+
+
+def enable() -> TclProfiler:
+    """
+    Enables the profiling of Tcl calls and returns the profiler. If the
+    profiler is already enabled, the existing profiler is returned.
+    """
+    global _PROFILER
+    if _PROFILER is None:
+        _PROFILER = TclProfiler()
+        ROOT_MANAGER.profiler = _PROFILER
+        if ROOT_MANAGER.is_active:
+            _PROFILER.attach(ROOT_MANAGER.get_root())
+
+    return _PROFILER
+
+
+def disable():
+    """
+    Disables the profiling of Tcl calls.
+    """
+    global _PROFILER
+    if _PROFILER is not None:
+        _PROFILER.detach()
+        _PROFILER = None
+        ROOT_MANAGER.profiler = None
+
+
+def get_profiler() -> Optional[TclProfiler]:
+    """
+    Returns the enabled profiler or `None`.
+    """
+    return _PROFILER
+
+
+def scope(phase: str = None, widget: str = None) -> ContextManager:
+    """
+    Attributes the Tcl calls inside the context to the given window phase
+    and/or widget. If profiling is disabled, this is a no-op.
+    """
+    if _PROFILER is None:
+        return _NO_SCOPE
+
+    return _PROFILER.scope(phase=phase, widget=widget)
@@ -0,0 +1,157 @@
+"""
+This module manages the tkinter root object, which is shared by all
+easytk windows.
+
+The root interpreter is only created, when the first `Window` is built,
+so that importing easytk neither pays the Tcl/Tk startup cost nor
+requires a display to be available.
+"""
+
+# ------------------------------
+# Imports
+#
+import time
+import tkinter as tk
+from types import ModuleType
+from typing import Dict, Optional
+
+from easytk.backends import get_backend
+
+
+# ------------------------------
+# Classes
+#
+class RootManager:
+    """
+    Creates the shared tkinter root on demand and destroys it again,
+    once the last window using it has been closed.
+    """
+
+    def __init__(self):
+        self._backend: Optional[ModuleType] = None
+        self._root: Optional[tk.Tk] = None
+        self._window_count: int = 0
+        self.session = None
+        self.profiler = None
+        self.timings: Dict[str, Optional[float]] = {
+            "import": None,
+            "root_creation": None,
+            "first_window": None,
+        }
+
+    @property
+    def backend(self) -> ModuleType:
+        """
+        Returns the backend module, which provides the widget classes.
+        """
+        if self._backend is None:
+            self._backend = get_backend()
+
+        return self._backend
+
+    def set_backend(self, name: str):
+        """
+        Selects the backend, that is used to create the root and all widgets.
+        The backend cannot be changed, while a root object exists.
+        """
+        backend = get_backend(name)
+        if self._root is not None and backend is not self.backend:
+            raise RuntimeError("The backend cannot be changed while windows are open.")
+
+        self._backend = backend
+
+    @property
+    def is_active(self) -> bool:
+        """
+        Returns if a root interpreter currently exists.
+        """
+        return self._root is not None
+
+    def get_root(self) -> tk.Tk:
+        """
+        Returns the shared root object and creates it if necessary.
+        """
+        if self._root is None:
+            start = time.perf_counter()
+            self._root = self.backend.Tk()
+            self._root.withdraw()
+            self.timings["root_creation"] = time.perf_counter() - start
+            if self.profiler is not None:
+                self.profiler.attach(self._root)
+
+        return self._root
+
+    def acquire(self, window=None) -> tk.Tk:
+        """
+        Registers a new window, that uses the root object, and returns the root.
+
+        :type window: easytk.Window
+        """
+        root = self.get_root()
+        self._window_count += 1
+        if self.session is not None and window is not None:
+            self.session.track(window)
+
+        return root
+
+    def release(self, window=None, keep_alive: bool = False):
+        """
+        Unregisters a window from the root object. If no window is using
+        the root anymore, it is destroyed unless `keep_alive` is set or
+        a `Session` is active.
+
+        :type window: easytk.Window
+        """
+        self._window_count = max(self._window_count - 1, 0)
+        if self.session is not None:
+            if window is not None:
+                self.session.untrack(window)
+            return
+
+        if self._window_count == 0 and not keep_alive:
+            self.destroy()
+
+    def destroy(self):
+        """
+        Destroys the root object, if it exists.
+        """
+        if self._root is not None:
+            root, self._root = self._root, None
+            self._window_count = 0
+            root.destroy()
+
+    def record_window_built(self, start: float):
+        """
+        Stores the time it took to build the first window of the process,
+        including the creation of the root object.
+
+        :param start: The `time.perf_counter` value when the window creation started
+        """
+        if self.timings["first_window"] is None:
+            self.timings["first_window"] = time.perf_counter() - start
+
+
+# ------------------------------
+# Globals
+#
+ROOT_MANAGER = RootManager()
+
+
+# ------------------------------
+# Functions
+#
+def set_backend(name: str):
+    """
+    Selects the backend ("tkinter" or "headless"), that is used for all
+    following windows.
+    """
+    ROOT_MANAGER.set_backend(name)
+
+
+def startup_timings() -> Dict[str, Optional[float]]:
+    """
+    Returns the measured durations (in seconds) for importing easytk,
+    creating the root object and building the first window. Values,
+    which have not been measured yet, are `None`.
+    """
+    return dict(ROOT_MANAGER.timings)
@@ -0,0 +1,259 @@
+"""
+This module contains an index over a list of string values, which answers
+prefix and substring queries without scanning all values.
+
+    index = SearchIndex(["apple", "banana", "pineapple"])
+    index.search("app")                     # -> [0]
+    index.search("app", mode="substring")   # -> [0, 2]
+    index.rank("apl", limit=2)              # -> [0, 2]
+
+The results are the indices of the matching values in their original
+order (or ordered by relevance for `rank`), so that they can be mapped
+back to the values at any time.
+"""
+
+# ------------------------------
+# Imports
+#
+import bisect
+import heapq
+import re
+from typing import Dict, List, Literal, Optional, Sequence, Tuple
+
+# ------------------------------
+# Globals
+#
+SEARCH_MODES = Literal["prefix", "substring"]
+
+# Patterns between the characters of a fuzzy query, from compact to loose matches
+_FUZZY_GAPS = ("[^\\n]?", "[^\\n]{0,3}?", "[^\\n]*?")
+
+
+# ------------------------------
+# Classes
+#
+class SearchIndex:
+    """
+    Index over a sequence of strings.
+
+    Prefix queries use a sorted copy of the values and two binary searches.
+    If only the first matches are needed (see `limit`), short queries with
+    many matches find them in the order of the values instead of sorting
+    all of them.
+    Substring queries use an n-gram index, which maps each n-gram to the
+    indices of the values containing it, so that only the values sharing
+    all n-grams of the query are compared. The n-gram index is built on the
+    first substring query. Queries shorter than `ngram_size` narrow down the
+    result of the previous query, if the new query extends it (as when
+    typing), and scan all values otherwise.
+    """
+
+    def __init__(self, values: Sequence[str], ngram_size: int = 3, case_sensitive: bool = False):
+        """
+        :param values: The values to search in
+        :param ngram_size: The length of the n-grams of the substring index
+        :param case_sensitive: If the case of the values is considered
+        """
+        self.ngram_size = ngram_size
+        self.case_sensitive = case_sensitive
+        self.keys: List[str] = [self.normalize(value) for value in values]
+
+        order = sorted(range(len(self.keys)), key=self.keys.__getitem__)
+        self._sorted_keys: List[str] = [self.keys[idx] for idx in order]
+        self._sorted_indices: List[int] = order
+        self._positions: Optional[List[int]] = None
+        self._ngrams: Optional[Dict[str, List[int]]] = None
+        self._joined: Optional[Tuple[str, List[int]]] = None
+        # Last substring query and its result
+        self._last: Optional[Tuple[str, List[int]]] = None
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def normalize(self, value: str) -> str:
+        """
+        Returns the key, under which the given value is indexed.
+        """
+        value = value if isinstance(value, str) else str(value)
+        return value if self.case_sensitive else value.casefold()
+
+    def search(self, query: str, mode: SEARCH_MODES = "prefix", limit: int = None) -> List[int]:
+        """
+        Returns the ascending indices of all values matching the `query`.
+
+        :param limit: The maximum number of returned indices, the smallest indices are kept
+        """
+        if mode == "prefix":
+            return self.prefix(query, limit)
+        if mode == "substring":
+            return self.substring(query)[:limit]
+
+        raise ValueError(f"Unknown search mode: '{mode}'.")
+
+    @staticmethod
+    def matches(query: str, value: str, mode: SEARCH_MODES = "prefix", case_sensitive: bool = False) -> bool:
+        """
+        Returns if a single value, which is not part of the index, matches the `query`.
+        """
+        if not case_sensitive:
+            query, value = query.casefold(), value.casefold()
+        return value.startswith(query) if mode == "prefix" else query in value
+
+    def prefix(self, query: str, limit: int = None) -> List[int]:
+        """
+        Returns the ascending indices of all values starting with `query`.
+
+        :param limit: The maximum number of returned indices, the smallest indices are kept
+        """
+        query = self.normalize(query)
+        count = len(self.keys) if limit is None else min(limit, len(self.keys))
+        if not query:
+            return list(range(count))
+
+        # All keys starting with the query sort between the query and the
+        # query with its last character incremented
+        upper = query[:-1] + chr(ord(query[-1]) + 1)
+        first = bisect.bisect_left(self._sorted_keys, query)
+        last = bisect.bisect_left(self._sorted_keys, upper, first)
+        matches = last - first
+        if limit is None or limit >= matches:
+            return sorted(self._sorted_indices[first:last])
+
+        # Scanning the values in their order visits about `limit * len(self) / matches`
+        # values to find the first matches, which is preferred over sorting all matches
+        if limit * len(self.keys) > matches * matches:
+            return sorted(self._sorted_indices[first:last])[:limit]
+
+        result = []
+        if limit > 0:
+            for idx, position in enumerate(self._get_positions()):
+                if first <= position < last:
+                    result.append(idx)
+                    if len(result) == limit:
+                        break
+        return result
+
+    def _get_positions(self) -> List[int]:
+        """
+        Returns the position of each value in the sorted values, which are
+        built on first use.
+        """
+        if self._positions is None:
+            positions = [0] * len(self._sorted_indices)
+            for position, idx in enumerate(self._sorted_indices):
+                positions[idx] = position
+            self._positions = positions
+
+        return self._positions
+
+    def substring(self, query: str) -> List[int]:
+        """
+        Returns the ascending indices of all values containing `query`.
+        """
+        query = self.normalize(query)
+        if not query:
+            return list(range(len(self.keys)))
+
+        keys = self.keys
+        last = self._last
+        if len(query) < self.ngram_size:
+            if last is not None and query.startswith(last[0]):
+                candidates = last[1]
+            else:
+                candidates = range(len(keys))
+        else:
+            postings = self._get_ngrams()
+            lists = sorted(
+                (postings.get(query[idx:idx + self.ngram_size], ()) for idx in range(len(query) - self.ngram_size + 1)),
+                key=len
+            )
+            candidates = lists[0]
+            if last is not None and query.startswith(last[0]) and len(last[1]) < len(candidates):
+                candidates = last[1]
+            if len(lists) > 1 and candidates:
+                other = set(lists[1])
+                candidates = [idx for idx in candidates if idx in other]
+
+        result = [idx for idx in candidates if query in keys[idx]]
+        self._last = (query, result)
+        return result
+
+    def _get_ngrams(self) -> Dict[str, List[int]]:
+        """
+        Builds the n-gram index on first use.
+        """
+        if self._ngrams is None:
+            size = self.ngram_size
+            postings: Dict[str, List[int]] = {}
+            for idx, key in enumerate(self.keys):
+                for gram in {key[pos:pos + size] for pos in range(len(key) - size + 1)}:
+                    postings.setdefault(gram, []).append(idx)
+            self._ngrams = postings
+
+        return self._ngrams
+
+    def rank(self, query: str, limit: int = 10) -> List[int]:
+        """
+        Returns the indices of the `limit` values, which match the `query`
+        best, ordered by relevance.
+
+        The matches are ranked in tiers: values starting with the query,
+        values containing the query and values containing the characters
+        of the query in order (fuzzy matches) with up to 1, 3 or any number
+        of other characters in between. Within a tier, more compact and
+        earlier matches in shorter values rank higher. Lower tiers are only
+        searched, if the higher tiers have less than `limit` matches.
+        """
+        query = self.normalize(query).replace("\n", "")
+        keys = self.keys
+        if not query:
+            return list(range(min(limit, len(keys))))
+
+        result = heapq.nsmallest(limit, self.prefix(query), key=lambda idx: (len(keys[idx]), idx))
+        if len(result) >= limit:
+            return result
+
+        # Substring and fuzzy matches are found in the joined keys by the regex
+        # engine. Fuzzy matches are searched with growing gaps between the
+        # characters, so that only few matches have to be ranked in Python,
+        # if there are compact matches.
+        joined, starts = self._get_joined()
+        found = set(result)
+        characters = [re.escape(character) for character in query]
+        patterns = [re.escape(query)]
+        if len(characters) > 1:
+            patterns.extend(gap.join(characters) for gap in _FUZZY_GAPS)
+
+        for pattern in patterns:
+            matches = {}
+            for match in re.finditer(pattern, joined):
+                idx = bisect.bisect_right(starts, match.start()) - 1
+                if idx not in found and idx not in matches:
+                    matches[idx] = (match.start() - starts[idx], match.end() - match.start())
+
+            result.extend(heapq.nsmallest(
+                limit - len(result),
+                matches,
+                key=lambda idx: (matches[idx][1], matches[idx][0], len(keys[idx]), idx)
+            ))
+            if len(result) >= limit:
+                break
+            found.update(matches)
+
+        return result
+
+    def _get_joined(self) -> Tuple[str, List[int]]:
+        """
+        Returns all keys joined by line breaks and the offsets of the keys
+        in the joined string, which are built on first use.
+        """
+        if self._joined is None:
+            keys = [key.replace("\n", " ") for key in self.keys]
+            starts = []
+            offset = 0
+            for key in keys:
+                starts.append(offset)
+                offset += len(key) + 1
+            self._joined = ("\n".join(keys), starts)
+
+        return self._joined
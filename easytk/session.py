@@ -0,0 +1,75 @@
+"""
+This module contains the `Session` class, which keeps the shared tkinter
+root alive across multiple windows.
+
+Without a session, the root is destroyed when the last window is closed,
+so that every following dialog has to start a new Tcl/Tk interpreter.
+Inside a session, all windows reuse the same interpreter:
+
+    with easytk.Session():
+        for item in items:
+            window = easytk.Window("YesNo")
+            window.add_label(f"Process {item}?")
+            window.show()
+"""
+
+# ------------------------------
+# Imports
+#
+from typing import List
+
+from easytk.root import ROOT_MANAGER
+
+
+# ------------------------------
+# Classes
+#
+class Session:
+    """
+    Context manager, which keeps one tkinter root alive and tracks
+    all windows, that are opened while the session is active.
+
+    The root is only destroyed, when the session is exited.
+    """
+
+    def __init__(self):
+        self.windows: List = []
+
+    def __enter__(self) -> "Session":
+        if ROOT_MANAGER.session is not None:
+            raise RuntimeError("An easytk session is already active.")
+
+        ROOT_MANAGER.session = self
+        ROOT_MANAGER.get_root()
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def track(self, window):
+        """
+        Adds a newly built window to the live windows of the session.
+
+        :type window: easytk.Window
+        """
+        self.windows.append(window)
+
+    def untrack(self, window):
+        """
+        Removes a closed window from the live windows of the session.
+
+        :type window: easytk.Window
+        """
+        if window in self.windows:
+            self.windows.remove(window)
+
+    def close(self):
+        """
+        Closes all windows, that are still open, and destroys the root object.
+        """
+        for window in list(self.windows):
+            window.close()
+
+        if ROOT_MANAGER.session is self:
+            ROOT_MANAGER.session = None
+        ROOT_MANAGER.destroy()
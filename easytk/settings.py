@@ -0,0 +1,128 @@
+"""
+This module contains the typed settings of easytk windows, which can be
+changed with `Window.config`.
+
+Each setting is declared once on the class as a `Setting` descriptor with
+its type, default value and an optional hook, which applies a changed value
+to the shown window (e.g. the new text of a return button):
+
+    class Window:
+        yes_text = Setting(str, "Yes", apply="_apply_button_texts")
+
+    window.config(yes_text="Confirm", no_text="Reject")
+"""
+
+# ------------------------------
+# Imports
+#
+from typing import Any, Dict, Sequence
+
+# ------------------------------
+# Globals
+#
+_REGISTRIES: Dict[type, Dict[str, "Setting"]] = {}
+
+
+# ------------------------------
+# Classes
+#
+class Setting:
+    """
+    Descriptor of a single setting. The value is stored on the instance and
+    validated on every assignment, before the `apply` hook is called.
+    """
+
+    def __init__(
+            self,
+            value_type: type,
+            default: Any,
+            apply: str = None,
+            choices: Sequence[Any] = None
+    ):
+        """
+        :param value_type: The type of the values
+        :param default: The value, which is used until the setting is changed
+        :param apply: The name of the method of the instance, which is called
+            after the value was changed
+        :param choices: The allowed values, if not all values of the type are allowed
+        """
+        self.value_type = value_type
+        self.default = default
+        self.apply = apply
+        self.choices = tuple(choices) if choices is not None else None
+        self.name: str = ""
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner: type = None):
+        if instance is None:
+            return self
+        return instance.__dict__.get(self.name, self.default)
+
+    def __set__(self, instance, value):
+        self.validate(value)
+        instance.__dict__[self.name] = value
+        if self.apply is not None:
+            getattr(instance, self.apply)()
+
+    def validate(self, value: Any) -> None:
+        """
+        Raises a `ValueError`, if the value cannot be used for the setting.
+        """
+        if not isinstance(value, self.value_type):
+            raise ValueError(f"Incompatible type {type(value)} for setting: {self.name}.\n"
+                             f" --> Should be {self.value_type}")
+        if self.choices is not None and value not in self.choices:
+            raise ValueError(f"Invalid value '{value}' for setting: {self.name}.\n"
+                             f" --> Should be one of {self.choices}")
+
+
+# ------------------------------
+# Functions
+#
+def get_settings(cls: type) -> Dict[str, Setting]:
+    """
+    Returns the settings declared by the class and its base classes. The
+    registry is only collected once per class.
+    """
+    if cls not in _REGISTRIES:
+        settings = {}
+        for base in reversed(cls.__mro__):
+            settings.update({name: value for name, value in vars(base).items() if isinstance(value, Setting)})
+        _REGISTRIES[cls] = settings
+
+    return _REGISTRIES[cls]
+
+
+def validate(cls: type, settings: Dict[str, Any]) -> None:
+    """
+    Raises a `ValueError`, if any of the settings is unknown or invalid for the class.
+    """
+    registry = get_settings(cls)
+    for name, value in settings.items():
+        if name not in registry:
+            raise ValueError(f"Unknown setting: {name}\n --> This cannot be edited at the present moment.")
+        registry[name].validate(value)
+
+
+def configure(instance, settings: Dict[str, Any], validated: bool = False) -> None:
+    """
+    Validates all given settings of the instance, before any of them is
+    changed, so that invalid settings leave the instance unchanged. Then
+    all values are stored and each distinct `apply` hook is called once.
+
+    :param validated: If the settings were already validated (e.g. by `compile_spec`)
+    """
+    registry = get_settings(type(instance))
+    if not validated:
+        validate(type(instance), settings)
+
+    hooks: Dict[str, None] = {}
+    for name, value in settings.items():
+        instance.__dict__[name] = value
+        if registry[name].apply is not None:
+            hooks[registry[name].apply] = None
+
+    for apply in hooks:
+        getattr(instance, apply)()
@@ -0,0 +1,252 @@
+"""
+This module contains a declarative format to describe easytk windows.
+
+A window spec lists the window type, its settings and the contained
+widgets with their options. It can be given as a dictionary, a JSON
+string or a tree of `WindowSpec` and `WidgetSpec` objects:
+
+    spec = {
+        "window_type": "SelectionFalse",
+        "title": "Export",
+        "settings": {"selection_text": "Export"},
+        "widgets": [
+            {"type": "label", "text": "Choose the export target."},
+            {"type": "file_dialog", "description": "Target", "selection_type": "save"},
+            {"type": "checkbutton", "description": "Overwrite", "on": True},
+        ],
+    }
+
+    template = easytk.compile_spec(spec)
+    returned_values = template.instantiate().show()
+
+The spec is validated and all widget options are merged with their
+defaults once in `compile_spec`. Instantiating the compiled `WindowTemplate`
+then only calls the widget constructors with the prepared arguments.
+"""
+
+# ------------------------------
+# Imports
+#
+import copy
+import inspect
+import json
+import typing
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple, Type, Union
+
+from easytk import settings as window_settings, widgets
+from easytk.settings import Setting
+from easytk.window import WINDOW_TYPES, Window
+
+# ------------------------------
+# Globals
+#
+# Maps the widget type names, that can be used in a spec, to the widget class.
+WIDGET_TYPES: Dict[str, Type[widgets.EasyWidget]] = {
+    "checkbutton": widgets.EasyCheckbutton,
+    "combobox": widgets.EasyCombobox,
+    "entry": widgets.EasyEntry,
+    "file_dialog": widgets.EasyFileDialog,
+    "label": widgets.EasyLabel,
+    "listbox": widgets.EasyListbox,
+    "text": widgets.EasyText,
+    "virtual_listbox": widgets.EasyVirtualListbox,
+}
+
+# Settings of the `Window`, which can be defined in a spec. The title is
+# defined by its own key.
+WINDOW_SETTINGS: Dict[str, Setting] = {
+    name: setting for name, setting in window_settings.get_settings(Window).items() if name != "title"
+}
+
+# Options, which are set by the window and cannot be defined in a spec.
+_RESERVED_OPTIONS = ("self", "main_window", "frame")
+
+
+# ------------------------------
+# Classes
+#
+@dataclass
+class WidgetSpec:
+    """
+    Describes a single widget by its type name (e.g. "entry") and
+    the options passed to the widget.
+    """
+    type: str
+    options: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class WindowSpec:
+    """
+    Describes a window by its type, title, settings and widgets.
+    """
+    window_type: WINDOW_TYPES = "SelectionFalse"
+    title: str = "easytk"
+    settings: Dict[str, Any] = field(default_factory=dict)
+    widgets: List[WidgetSpec] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, spec: Dict[str, Any]) -> "WindowSpec":
+        """
+        Creates a `WindowSpec` from its dictionary representation, where
+        each widget is a dictionary with a "type" key and its options.
+        """
+        unknown_keys = set(spec) - {"window_type", "title", "settings", "widgets"}
+        if unknown_keys:
+            raise ValueError(f"Unknown keys in window spec: {sorted(unknown_keys)}")
+
+        widget_specs = []
+        for widget in spec.get("widgets", []):
+            if isinstance(widget, WidgetSpec):
+                widget_specs.append(widget)
+                continue
+
+            options = dict(widget)
+            if "type" not in options:
+                raise ValueError(f"Missing widget type in spec: {widget}")
+            widget_type = options.pop("type")
+            widget_specs.append(WidgetSpec(widget_type, options))
+
+        return cls(
+            window_type=spec.get("window_type", "SelectionFalse"),
+            title=spec.get("title", "easytk"),
+            settings=dict(spec.get("settings", {})),
+            widgets=widget_specs
+        )
+
+    @classmethod
+    def from_json(cls, spec: str) -> "WindowSpec":
+        """
+        Creates a `WindowSpec` from a JSON string.
+        """
+        return cls.from_dict(json.loads(spec))
+
+
+class WindowTemplate:
+    """
+    A validated and normalized window spec, which can be instantiated
+    repeatedly without checking the spec again.
+    """
+
+    def __init__(
+        self,
+        window_type: WINDOW_TYPES,
+        title: str,
+        settings: List[Tuple[str, Any]],
+        widget_calls: List[Tuple[Type[widgets.EasyWidget], Dict[str, Any], bool]]
+    ):
+        self.window_type = window_type
+        self.title = title
+        self.settings = settings
+        self.widget_calls = widget_calls
+
+    def instantiate(self, testing: bool = False) -> Window:
+        """
+        Builds a new `Window` from the compiled spec. The window is
+        not shown yet, so that it can still be adjusted before calling
+        `Window.show`.
+        """
+        window = Window(self.window_type, self.title, testing=testing)
+        if self.settings:
+            window_settings.configure(window, dict(self.settings), validated=True)
+
+        add_widget = window._add_widget
+        for widget_class, kwargs, is_returned in self.widget_calls:
+            # Mutable options are copied, so that the windows do not share e.g. their values
+            add_widget(widget_class, is_returned, **{
+                name: copy.copy(value) if isinstance(value, (list, dict, set)) else value
+                for name, value in kwargs.items()
+            })
+
+        return window
+
+
+# ------------------------------
+# Functions
+#
+def compile_spec(spec: Union[WindowSpec, Dict[str, Any], str]) -> WindowTemplate:
+    """
+    Validates the given window spec and normalizes it into a `WindowTemplate`.
+
+    :param spec: A `WindowSpec`, its dictionary representation or a JSON string
+    :return: the compiled `WindowTemplate`
+    """
+    if isinstance(spec, str):
+        spec = WindowSpec.from_json(spec)
+    elif isinstance(spec, dict):
+        spec = WindowSpec.from_dict(spec)
+
+    if spec.window_type not in typing.get_args(WINDOW_TYPES):
+        raise ValueError(f"Unknown window type: {spec.window_type}")
+    if not isinstance(spec.title, str):
+        raise ValueError(f"Incompatible type {type(spec.title)} for window title.")
+
+    for name in spec.settings:
+        if name not in WINDOW_SETTINGS:
+            raise ValueError(f"Unknown setting: {name}")
+    window_settings.validate(Window, spec.settings)
+    settings = list(spec.settings.items())
+
+    widget_calls = [_compile_widget(widget_spec) for widget_spec in spec.widgets]
+    return WindowTemplate(spec.window_type, spec.title, settings, widget_calls)
+
+
+def _compile_widget(widget_spec: WidgetSpec) -> Tuple[Type[widgets.EasyWidget], Dict[str, Any], bool]:
+    """
+    Validates the options of a single widget spec and merges them
+    with the defaults of the widget constructor.
+
+    :return: the widget class, the keyword arguments for its constructor and
+        if the widget is added to the return objects of the window
+    """
+    if widget_spec.type not in WIDGET_TYPES:
+        raise ValueError(f"Unknown widget type: {widget_spec.type}")
+
+    widget_class = WIDGET_TYPES[widget_spec.type]
+    parameters, type_hints = _get_signature(widget_class)
+
+    kwargs = {}
+    for name, parameter in parameters.items():
+        if name in _RESERVED_OPTIONS:
+            continue
+        if name in widget_spec.options:
+            kwargs[name] = widget_spec.options[name]
+        elif parameter.default is inspect.Parameter.empty:
+            raise ValueError(f"Missing option '{name}' for widget type: {widget_spec.type}")
+        else:
+            kwargs[name] = parameter.default
+
+    # The name of a widget is used by the window for name-keyed results
+    if "name" in widget_spec.options:
+        if not isinstance(widget_spec.options["name"], str):
+            raise ValueError(f"Incompatible type {type(widget_spec.options['name'])} for option 'name'.")
+        kwargs["name"] = widget_spec.options["name"]
+
+    unknown_options = set(widget_spec.options) - set(kwargs)
+    if unknown_options:
+        raise ValueError(f"Unknown options for widget type {widget_spec.type}: {sorted(unknown_options)}")
+
+    for name, value in widget_spec.options.items():
+        allowed_values = typing.get_args(type_hints.get(name)) if typing.get_origin(type_hints.get(name)) is typing.Literal else ()
+        if allowed_values and value not in allowed_values:
+            raise ValueError(f"Invalid value '{value}' for option '{name}' of widget type: {widget_spec.type}")
+
+    is_returned = widget_class is not widgets.EasyLabel and (widget_class is not widgets.EasyText or kwargs["export"])
+    return widget_class, kwargs, is_returned
+
+
+_SIGNATURES: Dict[type, Tuple[Dict[str, inspect.Parameter], Dict[str, Any]]] = {}
+
+
+def _get_signature(widget_class: type) -> Tuple[Dict[str, inspect.Parameter], Dict[str, Any]]:
+    """
+    Returns the constructor parameters and type hints of the given widget class.
+    The results are cached, because they do not change at runtime.
+    """
+    if widget_class not in _SIGNATURES:
+        parameters = dict(inspect.signature(widget_class.__init__).parameters)
+        type_hints = typing.get_type_hints(widget_class.__init__)
+        _SIGNATURES[widget_class] = (parameters, type_hints)
+
+    return _SIGNATURES[widget_class]
@@ -14,7 +14,8 @@ from easytk.widgets.easy_entry import EasyEntry
 from easytk.widgets.easy_file_dialog import EasyFileDialog
 from easytk.widgets.easy_label import EasyLabel
 from easytk.widgets.easy_listbox import EasyListbox
-from easytk.widgets.easy_text import EasyText
+from easytk.widgets.easy_text import EasyText, TextChange
+from easytk.widgets.easy_virtual_listbox import EasyVirtualListbox
 from easytk.widgets.easy_widget import EasyWidget
 from easytk.widgets.easy_return_widget import EasyReturnWidget
 
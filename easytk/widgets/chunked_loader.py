@@ -0,0 +1,192 @@
+"""
+This module contains a loader, which streams the values of an iterable
+into a widget in time-sliced chunks, so that the window stays responsive
+while the values are produced.
+"""
+
+# ------------------------------
+# Imports
+#
+import collections
+import threading
+import time
+from typing import Callable, Iterable, List, Optional
+
+
+# ------------------------------
+# Classes
+#
+class ChunkedLoader:
+    """
+    Consumes an iterable in chunks, which are scheduled with `after()` on
+    the event loop of the given tkinter widget.
+
+    Each step pulls values for at most `time_slice` seconds and passes them
+    to `on_chunk` at once. If `threaded` is set, the iterable is consumed
+    on a worker thread instead, which is useful for sources, that block
+    while waiting for the next value (e.g. database cursors). The event
+    loop then only hands the collected values to `on_chunk`.
+
+    If the iterable raises an exception, the values pulled before are
+    still passed to `on_chunk`, the loader stops and the exception is
+    passed to `on_error`.
+    """
+
+    def __init__(
+            self,
+            tk_object,
+            values: Iterable,
+            on_chunk: Callable[[List], None],
+            on_done: Callable[[], None] = None,
+            on_error: Callable[[BaseException], None] = None,
+            chunk_size: int = 16,
+            time_slice: float = 0.01,
+            interval: int = 1,
+            threaded: bool = False
+    ):
+        """
+        :param tk_object: The tkinter widget, whose event loop is used for scheduling
+        :param values: The iterable providing the values
+        :param on_chunk: Called with each list of loaded values
+        :param on_done: Called after all values have been loaded
+        :param on_error: Called with the exception raised by the iterable,
+            if not given, the exception is raised on the event loop
+        :param chunk_size: The number of values pulled between two checks of the time slice
+        :param time_slice: The maximum duration of a single step in seconds
+        :param interval: The delay between two steps in milliseconds
+        :param threaded: If the iterable is consumed on a worker thread
+        """
+        self.tk_object = tk_object
+        self.iterator = iter(values)
+        self.on_chunk = on_chunk
+        self.on_done = on_done
+        self.on_error = on_error
+        self.chunk_size = chunk_size
+        self.time_slice = time_slice
+        self.interval = interval
+        self.threaded = threaded
+
+        self.count: int = 0
+        self.done: bool = False
+        self.cancelled: bool = False
+        self.error: Optional[BaseException] = None
+        self._error: Optional[BaseException] = None
+        self._after_id: Optional[str] = None
+        self._buffer = collections.deque()
+        self._exhausted = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def active(self) -> bool:
+        """
+        Returns if the loader is still loading values.
+        """
+        return not self.done and not self.cancelled and self.error is None
+
+    def start(self) -> "ChunkedLoader":
+        """
+        Starts loading the values.
+        """
+        if self.threaded:
+            self._thread = threading.Thread(target=self._consume, daemon=True)
+            self._thread.start()
+
+        self._after_id = self.tk_object.after(0, self._step)
+        return self
+
+    def cancel(self):
+        """
+        Stops loading the values. Values, that were already passed to
+        `on_chunk`, are kept.
+        """
+        if not self.active:
+            return
+
+        self.cancelled = True
+        if self._after_id is not None:
+            try:
+                self.tk_object.after_cancel(self._after_id)
+            except Exception:
+                # The widget might already be destroyed together with its window
+                pass
+            self._after_id = None
+
+        if not self.threaded and hasattr(self.iterator, "close"):
+            self.iterator.close()
+
+    def _consume(self):
+        """
+        Pulls all values from the iterator into the buffer (worker thread).
+        """
+        try:
+            for value in self.iterator:
+                if self.cancelled:
+                    break
+                self._buffer.append(value)
+        except Exception as error:
+            # Reported by the event loop after the values pulled before
+            self._error = error
+        finally:
+            self._exhausted.set()
+
+    def _pull(self, deadline: float) -> bool:
+        """
+        Pulls values into the buffer on the event loop until the deadline,
+        but at least one chunk.
+
+        :return: True, if the iterator is exhausted or raised an exception
+        """
+        iterator = self.iterator
+        append = self._buffer.append
+        chunk = range(self.chunk_size)
+        try:
+            while True:
+                for _ in chunk:
+                    append(next(iterator))
+                if time.perf_counter() >= deadline:
+                    return False
+        except StopIteration:
+            return True
+        except Exception as error:
+            self._error = error
+            return True
+
+    def _step(self):
+        """
+        Loads the values for one time slice and schedules the next step.
+        """
+        self._after_id = None
+        if not self.active:
+            return
+
+        deadline = time.perf_counter() + self.time_slice
+        buffer = self._buffer
+        chunk = []
+        if self.threaded:
+            # Values appended after the check are picked up by the next step
+            exhausted = self._exhausted.is_set()
+            while buffer:
+                chunk.extend(buffer.popleft() for _ in range(min(self.chunk_size, len(buffer))))
+                if time.perf_counter() >= deadline:
+                    break
+            exhausted = exhausted and not buffer
+        else:
+            exhausted = self._pull(deadline)
+            chunk.extend(buffer)
+            buffer.clear()
+
+        if chunk:
+            self.count += len(chunk)
+            self.on_chunk(chunk)
+
+        if exhausted and self._error is not None:
+            self.error = self._error
+            if self.on_error is None:
+                raise self.error
+            self.on_error(self.error)
+        elif exhausted:
+            self.done = True
+            if self.on_done is not None:
+                self.on_done()
+        else:
+            self._after_id = self.tk_object.after(self.interval, self._step)
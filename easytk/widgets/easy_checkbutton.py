@@ -33,16 +33,17 @@ class EasyCheckbutton(EasyWidget):
         self.apply_settings(main_window, row, column, column_span, frame, anchor, justify)
 
         # Widget frame
-        self.grid_object = tk.Frame(self.frame, width=width, height=height)
+        self.grid_object = self.backend.Frame(self.frame, width=width, height=height)
 
         # Variables
-        self.label_string_var = tk.StringVar()
+        self.label_string_var = self.backend.StringVar()
         self.label_string_var.set(description)
-        self.object_var = tk.IntVar()
+        self.object_var = self.backend.IntVar()
         self.object_var.set(1 if on else 0)
+        self.mirror_variable(self.object_var)
 
         # Checkbutton
-        self.object = tk.Checkbutton(
+        self.object = self.backend.Checkbutton(
             self.grid_object,
             variable=self.object_var,
             textvariable=self.label_string_var,
@@ -73,4 +74,4 @@ class EasyCheckbutton(EasyWidget):
         """
         Returns if the `EasyCheckbutton` is toggled on or off.
         """
-        return self.object_var.get()
+        return self.value
@@ -1,9 +1,23 @@
 import tkinter as tk
-from tkinter import ttk
-from typing import List
+from collections.abc import Sequence
+from typing import Callable, Hashable, Iterable, List, Optional, Union
+from easytk.cache import PROVIDER_CACHE
+from easytk.search import SearchIndex
+from easytk.workers import BackgroundTask
+from easytk.widgets.chunked_loader import ChunkedLoader
 from easytk.widgets.easy_widget import EasyWidget
 from easytk.widgets.literals import ANCHORS, JUSTIFICATIONS
 
+# Factor, by which the loaded values have to grow, before the values of the
+# combobox are reassigned while values are loaded in chunks
+_GROWTH_FACTOR = 1.5
+
+# Keys, which do not change the text of the combobox and therefore do not
+# update the typeahead matches
+_NAVIGATION_KEYS = {"Up", "Down", "Left", "Right", "Return", "Escape", "Tab", "Home", "End"}
+
+_MISSING = object()
+
 
 class EasyCombobox(EasyWidget):
     """
@@ -13,9 +27,13 @@ class EasyCombobox(EasyWidget):
     def __init__(
             self,
             main_window,
-            values: List[str],
+            values: Union[Iterable[str], Callable[[], Iterable[str]]],
             description: str = "",
             default_value: str = ...,
+            cache_key: Hashable = ...,
+            typeahead: bool = False,
+            max_results: int = 20,
+            debounce: int = 150,
             width: int = None,
             height: int = None,
             label_width: int = None,
@@ -31,17 +49,36 @@ class EasyCombobox(EasyWidget):
         Creates a new `EasyCombobox` object.
 
         :type main_window: easytk.Window
+        :param values: The values, an iterable, which is no sequence, is loaded in chunks and
+            a callable is used as provider of the values, when the dropdown is opened (see `set_values`)
+        :param default_value: The initial value, defaults to the first value
+        :param cache_key: The key of the provided values in the shared cache, defaults to the provider
+        :param typeahead: If only the values best matching the typed text are listed in the dropdown
+        :param max_results: The number of values listed in typeahead mode
+        :param debounce: The delay in milliseconds after the last keystroke, before the matches are updated
         """
         super().__init__()
         self.apply_settings(main_window, row, column, column_span, frame, anchor, justify)
+        provided_values = None if isinstance(values, Sequence) else values
+        self.values: List[str] = [] if provided_values is not None else list(values)
+        self._shown_count: int = len(self.values)
+        self.provider: Optional[Callable[[], Iterable[str]]] = None
+        self.cache_key: Hashable = cache_key
+        self._provider_task: Optional[BackgroundTask] = None
+        self._provider_loaded: bool = False
+        self.typeahead = typeahead
+        self.max_results = max_results
+        self.debounce = debounce
+        self._search_index: Optional[SearchIndex] = None
+        self._pending_update: Optional[str] = None
 
         # Widget frame
-        self.grid_object = tk.Frame(self.frame, width=width, height=height)
+        self.grid_object = self.backend.Frame(self.frame, width=width, height=height)
 
         # Label
-        self.label_string_var = tk.StringVar()
+        self.label_string_var = self.backend.StringVar()
         self.label_string_var.set(description)
-        self.label = tk.Label(
+        self.label = self.backend.Label(
             self.grid_object,
             textvariable=self.label_string_var,
             width=label_width,
@@ -50,12 +87,20 @@ class EasyCombobox(EasyWidget):
         )
 
         # Combobox
-        self.object = ttk.Combobox(
+        self.object_string_var = self.backend.StringVar()
+        self.mirror_variable(self.object_string_var)
+        self.object = self.backend.Combobox(
             self.grid_object,
-            values=values,
+            textvariable=self.object_string_var,
+            values=tuple(self.values[:max_results] if typeahead else self.values),
         )
-        value = values[0] if default_value is ... else default_value
-        self.object.set(value)
+        self.object.config(postcommand=self._on_post)
+        if typeahead:
+            self.object.bind("<KeyRelease>", self._on_key_release)
+        if default_value is not ...:
+            self.object.set(default_value)
+        elif self.values:
+            self.object.set(self.values[0])
 
         # Arrange widgets
         self.label.pack(side="left", padx=(0, self.padx))
@@ -73,6 +118,9 @@ class EasyCombobox(EasyWidget):
         if not add_to_grid:
             self.remove_from_grid()
 
+        if provided_values is not None:
+            self.set_values(provided_values)
+
     def set(self, value: str):
         """
         Sets the `EasyCombobox` to the given `value`.
@@ -82,14 +130,192 @@ class EasyCombobox(EasyWidget):
 
         self.object.set(value)
 
-    def set_values(self, values: List[str]):
+    def set_values(
+            self,
+            values: Union[Iterable[str], Callable[[], Iterable[str]]],
+            chunk_size: int = 16,
+            time_slice: float = 0.01,
+            threaded: bool = False,
+            on_error: Callable[[BaseException], None] = None
+    ) -> Optional[ChunkedLoader]:
         """
         Adjusts the selectable `values` in the `EasyCombobox`.
+
+        A sequence (e.g. a list) is set at once. Any other iterable is loaded
+        in chunks between the events of the window (see `EasyListbox.set_values`).
+        If the combobox is empty, the first loaded value is shown.
+
+        A callable is stored as provider of the values, which is only called
+        when the dropdown is opened for the first time (see `load_values`).
+
+        :return: the `ChunkedLoader` if the values are loaded in chunks, otherwise `None`
+        """
+        self.cancel_loading()
+        self._search_index = None
+        if self._provider_task is not None:
+            self._provider_task.cancel()
+            self.main_window.remove_close_callback(self._provider_task.cancel)
+            self._provider_task = None
+            self.hide_loading()
+
+        if callable(values) and not isinstance(values, Sequence):
+            self.provider = values
+            values = []
+        else:
+            self.provider = None
+        self._provider_loaded = False
+
+        if isinstance(values, Sequence):
+            self.values = list(values)
+            self._shown_count = -1
+            self._show_values()
+            return None
+
+        self.values = []
+        self._shown_count = -1
+        self._show_values()
+        return self.load_chunked(
+            values,
+            self._append_values,
+            self._show_values,
+            on_error=on_error,
+            chunk_size=chunk_size,
+            time_slice=time_slice,
+            threaded=threaded
+        )
+
+    def load_values(self, refresh: bool = False) -> Optional[BackgroundTask]:
+        """
+        Loads the values from the provider. The provider is called on a
+        worker thread and its result is stored in the `PROVIDER_CACHE`,
+        which is shared by all windows, so that later dialogs can use the
+        cached values without calling the provider again.
+
+        :param refresh: If the cached values are ignored
+        :return: the `BackgroundTask` calling the provider or `None`, if the cached values are used
+        """
+        if self.provider is None:
+            raise ValueError("The values of the combobox are not given by a provider.")
+        if self._provider_task is not None and self._provider_task.active:
+            return self._provider_task
+
+        provider = self.provider
+        key = provider if self.cache_key is ... else self.cache_key
+        if not refresh:
+            values = PROVIDER_CACHE.get(key, _MISSING)
+            if values is not _MISSING:
+                self._set_provided_values(values)
+                return None
+
+        def fetch() -> List[str]:
+            values = [value if isinstance(value, str) else str(value) for value in provider()]
+            PROVIDER_CACHE.set(key, values)
+            return values
+
+        self.show_loading()
+        self._provider_task = self.run_in_background(
+            fetch,
+            on_result=self._set_provided_values,
+            on_error=self._on_provider_error
+        )
+        return self._provider_task
+
+    def _set_provided_values(self, values: List[str]) -> None:
+        """
+        Shows the values returned by the provider. If the combobox is
+        empty, the first value is shown, like for values given at once.
         """
-        self.object.config(values=values)
+        provider = self.provider
+        self.hide_loading()
+        self._provider_task = None
+        self.set_values(values)
+        self.provider = provider
+        self._provider_loaded = True
+        if self.values and self.object.get() == "":
+            self.object.set(self.values[0])
+
+    def _on_provider_error(self, error: BaseException) -> None:
+        """
+        Shows, that the provider failed. It is called again, when the
+        dropdown is opened the next time.
+        """
+        self._provider_task = None
+        self.show_loading(f"Loading failed: {error}")
+
+    def _on_post(self) -> None:
+        """
+        Called before the dropdown is opened.
+        """
+        if self.provider is not None and not self._provider_loaded:
+            self.load_values()
+        if self.typeahead:
+            self.update_matches()
+
+    def _append_values(self, values: List) -> None:
+        """
+        Appends loaded values. As the values of a combobox can only be
+        reassigned as a whole, this is only done after they have grown
+        sufficiently, which keeps the total cost of a load linear.
+        """
+        first_chunk = not self.values
+        self.values.extend(values)
+        self._search_index = None
+        if first_chunk and self.object.get() == "":
+            self.object.set(self.values[0])
+        if len(self.values) >= self._shown_count * _GROWTH_FACTOR:
+            self._show_values()
+
+    def _show_values(self) -> None:
+        """
+        Passes all loaded values to the combobox, or the best matches
+        in typeahead mode.
+        """
+        if self._shown_count != len(self.values):
+            self._shown_count = len(self.values)
+            if self.typeahead:
+                self.update_matches()
+            else:
+                self.object.config(values=tuple(self.values))
+                self.backend.refresh_dropdown(self.object)
+
+    @property
+    def search_index(self) -> SearchIndex:
+        """
+        Returns the index over the values, which is built on first use.
+        """
+        if self._search_index is None:
+            self._search_index = SearchIndex(self.values)
+
+        return self._search_index
+
+    def _on_key_release(self, event) -> None:
+        """
+        Schedules the update of the typeahead matches, after no key was
+        pressed for `debounce` milliseconds.
+        """
+        if getattr(event, "keysym", "") in _NAVIGATION_KEYS:
+            return
+
+        if self._pending_update is not None:
+            self.object.after_cancel(self._pending_update)
+        self._pending_update = self.object.after(self.debounce, self.update_matches)
+
+    def update_matches(self) -> None:
+        """
+        Lists the `max_results` values, which match the current text best,
+        in the dropdown (see `SearchIndex.rank`).
+        """
+        if self._pending_update is not None:
+            self.object.after_cancel(self._pending_update)
+            self._pending_update = None
+
+        values = self.values
+        matches = self.search_index.rank(self.object.get(), self.max_results)
+        self.object.config(values=tuple(values[idx] for idx in matches))
+        self.backend.refresh_dropdown(self.object)
 
     def get(self) -> str:
         """
         Returns the currently selected item in the `EasyCombobox`.
         """
-        return self.object.get()
+        return self.value
@@ -36,15 +36,15 @@ class EasyEntry(EasyWidget):
         self.apply_settings(main_window, row, column, column_span, frame, anchor, justify)
 
         # Widget frame
-        self.grid_object = tk.Frame(self.frame, width=width, height=height)
+        self.grid_object = self.backend.Frame(self.frame, width=width, height=height)
 
         # No widget shrinking
         self.grid_object.grid_propagate(False)
 
         # Label
-        self.label_string_var = tk.StringVar()
+        self.label_string_var = self.backend.StringVar()
         self.label_string_var.set(description)
-        self.label = tk.Label(
+        self.label = self.backend.Label(
             self.grid_object,
             textvariable=self.label_string_var,
             width=label_width,
@@ -53,9 +53,10 @@ class EasyEntry(EasyWidget):
         )
 
         # Entry field
-        self.object_string_var = tk.StringVar()
+        self.object_string_var = self.backend.StringVar()
         self.object_string_var.set(default_value)
-        self.object = tk.Entry(
+        self.mirror_variable(self.object_string_var)
+        self.object = self.backend.Entry(
             self.grid_object,
             textvariable=self.object_string_var,
             width=width
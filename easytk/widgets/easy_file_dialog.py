@@ -1,7 +1,10 @@
 import os
+import stat
 import tkinter as tk
-from tkinter import filedialog
-from typing import List, Literal, Union, Tuple
+from typing import List, Literal, Optional, Union, Tuple
+from easytk.cache import STAT_CACHE
+from easytk.filesystem import DirectoryListing, list_directory
+from easytk.workers import BackgroundTask
 from easytk.widgets.easy_widget import EasyWidget
 from easytk.widgets.literals import ANCHORS, JUSTIFICATIONS
 
@@ -22,10 +25,13 @@ class EasyFileDialog(EasyWidget):
             self,
             main_window,
             description: str = "",
-            initial_dir: str = os.getcwd(),
+            initial_dir: str = ...,
             filetypes: Union[List[Tuple[str, str]], None] = None,
             selection_type: Literal["file", "dir", "save"] = "file",
             default_value: str = "",
+            check_delay: int = 200,
+            autocomplete: bool = False,
+            dialog: Literal["native", "builtin"] = "native",
             width: int = None,
             height: int = None,
             label_width: int = None,
@@ -41,18 +47,41 @@ class EasyFileDialog(EasyWidget):
         Creates a new EasyFileDialogue object.
 
         :type main_window: easytk.Window
+        :param check_delay: The delay in milliseconds after the last change of the path, before it is checked
+        :param autocomplete: If typed paths are completed with the entries of their directory
+        :param dialog: If the `tkinter.filedialog` dialogs or the easytk `DirectoryBrowser`, which
+            handles huge directories, is opened by the button
         """
         super().__init__()
         self.apply_settings(main_window, row, column, column_span, frame, anchor, justify)
         self.selection_type = selection_type
+        self.check_delay = check_delay
+        self._pending_check: Optional[str] = None
+        self._check_task: Optional[BackgroundTask] = None
+        if initial_dir is ...:
+            initial_dir = os.getcwd()
+        if default_value is ...:
+            default_value = ""
+        self.initial_dir = initial_dir
+        self.filetypes = filetypes
+        self.autocomplete = autocomplete
+        self.dialog = dialog
+
+        # Listing of the directory of the typed path and the indices of the
+        # entries completing the typed name
+        self._listing: Optional[DirectoryListing] = None
+        self._listing_task: Optional[BackgroundTask] = None
+        self._listing_path: str = ""
+        self._completion: Optional[Tuple[str, str, List[int]]] = None
+        self._completion_index: int = 0
 
         # Widget frame
-        self.grid_object = tk.Frame(self.frame, width=width, height=height)
+        self.grid_object = self.backend.Frame(self.frame, width=width, height=height)
 
         # Label
-        self.label_string_var = tk.StringVar()
+        self.label_string_var = self.backend.StringVar()
         self.label_string_var.set(description)
-        self.label = tk.Label(
+        self.label = self.backend.Label(
             self.grid_object,
             textvariable=self.label_string_var,
             width=label_width,
@@ -61,9 +90,10 @@ class EasyFileDialog(EasyWidget):
         )
 
         # Entry field
-        self.object_string_var = tk.StringVar()
+        self.object_string_var = self.backend.StringVar()
         self.object_string_var.set(default_value)
-        self.object = tk.Entry(
+        self.mirror_variable(self.object_string_var)
+        self.object = self.backend.Entry(
             self.grid_object,
             textvariable=self.object_string_var,
             width=width
@@ -71,7 +101,7 @@ class EasyFileDialog(EasyWidget):
         self.object.xview_moveto(1.0)
 
         # Dialogue button
-        button = tk.Button(
+        button = self.backend.Button(
             self.grid_object,
             text="...",
             width=5,
@@ -97,6 +127,12 @@ class EasyFileDialog(EasyWidget):
         self.object_string_var.trace("w", self.check_path)
         self.check_path()
 
+        if autocomplete:
+            self.object.bind("<KeyRelease>", self._on_key_release)
+            self.object.bind("<Tab>", self.accept_completion)
+            self.object.bind("<Down>", lambda _: self.cycle_completion(1))
+            self.object.bind("<Up>", lambda _: self.cycle_completion(-1))
+
         # Add to grid and then remove if desired
         self.insert_into_grid(self.frame, row, column, column_span)
         if add_to_grid is False:
@@ -104,35 +140,155 @@ class EasyFileDialog(EasyWidget):
 
     def check_path(self, *_):
         """
-        Checks if the path stored in the object string variable is valid.
+        Schedules checking, if the path stored in the object string variable
+        is valid, after it has not changed for `check_delay` milliseconds.
         """
+        if self.selection_type not in ("file", "dir", "save"):
+            raise ValueError(f"Invalid path type: {self.selection_type}. Expecting 'file', 'dir' or 'save'.")
+
+        if self._pending_check is not None:
+            self.object.after_cancel(self._pending_check)
+        self._pending_check = self.object.after(self.check_delay, self._start_check)
+
+    def _start_check(self):
+        """
+        Checks the current path. If the file system has to be accessed,
+        the check runs on a worker thread and only the result of the
+        latest check is applied.
+        """
+        self._pending_check = None
+        if self._check_task is not None:
+            self._check_task.cancel()
+            self._check_task = None
+
         value = self.get()
         if value.strip() == "":
             return
 
-        if self.selection_type == "dir":
-            if os.path.isdir(value):
-                background_color = _OK_COLOR
-            else:
-                background_color = _NOT_OK_COLOR
-        elif self.selection_type == "file":
-            if os.path.isfile(value):
-                background_color = _OK_COLOR
-            else:
-                background_color = _NOT_OK_COLOR
-        elif self.selection_type == "save":
-            dir_name = os.path.dirname(value)
-            if os.path.isfile(value) and os.path.exists(value):
-                background_color = _OVERWRITE_COLOR
-            elif dir_name == "" or os.path.isdir(dir_name):
-                background_color = _OK_COLOR
-            else:
-                background_color = _NOT_OK_COLOR
-        else:
-            raise ValueError(f"Invalid path type: {self.selection_type}. Expecting 'file', 'dir' or 'save'.")
+        # Paths, which were checked recently, are colored right away
+        background_color = _get_path_color(value, self.selection_type, cached_only=True)
+        if background_color is not None:
+            self.object.config(background=background_color)
+            return
 
+        self._check_task = self.run_in_background(
+            _get_path_color,
+            value,
+            self.selection_type,
+            on_result=self._apply_check
+        )
+
+    def _apply_check(self, background_color: str):
+        """
+        Colors the entry field with the result of the check.
+        """
+        self._check_task = None
         self.object.config(background=background_color)
 
+    def _on_key_release(self, event):
+        """
+        Completes the path after a character has been typed.
+        """
+        if event.char and event.char.isprintable():
+            self.complete()
+
+    def complete(self):
+        """
+        Completes the path up to the insert cursor with the first matching
+        entry of its directory and selects the completed part, so that it
+        is replaced by typing on.
+
+        The directory is listed on a worker thread (see `list_directory`).
+        While the same directory is typed in, the matching entries of the
+        previous completion are narrowed down.
+        """
+        typed = self.object.get()[:self.object.index("insert")]
+        directory, prefix = os.path.split(typed)
+        directory_path = os.path.abspath(directory or os.curdir)
+
+        listing = self._listing
+        if listing is None or listing.path != directory_path:
+            self._load_listing(directory_path)
+            return
+
+        candidates = None
+        if self._completion is not None:
+            completed_path, completed_prefix, completed_candidates = self._completion
+            if completed_path == directory_path and prefix.startswith(completed_prefix):
+                candidates = completed_candidates
+
+        candidates = listing.complete(prefix, self.selection_type, self.filetypes, candidates)
+        self._completion = (directory_path, prefix, candidates)
+        self._completion_index = 0
+        self._show_completion(typed)
+
+    def _load_listing(self, directory_path: str):
+        """
+        Lists the directory on a worker thread and completes the path afterwards.
+        """
+        task = self._listing_task
+        if task is not None and task.active:
+            if self._listing_path == directory_path:
+                return
+            task.cancel()
+
+        def listing_loaded(listing: DirectoryListing):
+            self._listing_task = None
+            self._listing = listing
+            self._completion = None
+            self.complete()
+
+        def listing_failed(_):
+            # Directories, which do not exist (yet), are not completed
+            self._listing_task = None
+
+        self._listing_task = self.run_in_background(
+            list_directory,
+            directory_path,
+            on_result=listing_loaded,
+            on_error=listing_failed
+        )
+        self._listing_path = directory_path
+
+    def _show_completion(self, typed: str):
+        """
+        Shows the current completion of the `typed` path.
+        """
+        candidates = self._completion[2]
+        if not candidates:
+            return
+
+        entry = self._listing.entries[candidates[self._completion_index % len(candidates)]]
+        name = entry.name + os.sep if entry.is_dir else entry.name
+        self.object_string_var.set(typed[:len(typed) - len(os.path.basename(typed))] + name)
+        self.object.icursor(len(typed))
+        self.object.select_range(len(typed), "end")
+
+    def cycle_completion(self, step: int):
+        """
+        Shows the next (or previous) matching entry as completion.
+        """
+        if self._completion is None or not self._completion[2]:
+            return None
+
+        self._completion_index += step
+        self._show_completion(self.object.get()[:self.object.index("insert")])
+        return "break"
+
+    def accept_completion(self, *_):
+        """
+        Accepts the completed path and starts completing its entries, if
+        a directory was completed.
+        """
+        if not self.object.selection_present():
+            return None
+
+        self.object.select_clear()
+        self.object.icursor("end")
+        self._completion = None
+        self.complete()
+        return "break"
+
     def file_chosen(
             self,
             initial_dir: str,
@@ -141,15 +297,20 @@ class EasyFileDialog(EasyWidget):
         """
         Opens a file/directory dialogue and sets the selected path in the entry field.
         """
+        filetypes = list(filetypes or [])
         if ("All files", "*.*") not in filetypes:
             filetypes.append(("All files", "*.*"))
 
-        if self.selection_type == "file":
-            path = filedialog.askopenfilename(initialdir=initial_dir, filetypes=filetypes)
+        if self.dialog == "builtin":
+            # Imported here, because the browser is built from a `Window`, which imports the widgets
+            from easytk.browser import DirectoryBrowser
+            path = DirectoryBrowser(initial_dir, self.selection_type, filetypes).browse()
+        elif self.selection_type == "file":
+            path = self.backend.filedialog.askopenfilename(initialdir=initial_dir, filetypes=filetypes)
         elif self.selection_type == "dir":
-            path = filedialog.askdirectory(initialdir=initial_dir)
+            path = self.backend.filedialog.askdirectory(initialdir=initial_dir)
         elif self.selection_type == "save":
-            path = filedialog.asksaveasfilename(initialdir=initial_dir, filetypes=filetypes)
+            path = self.backend.filedialog.asksaveasfilename(initialdir=initial_dir, filetypes=filetypes)
         else:
             raise ValueError("Invalid selection type.")
 
@@ -165,3 +326,51 @@ class EasyFileDialog(EasyWidget):
         self.object_string_var.set(value)
         self.check_path(self.selection_type)
         self.object.xview_moveto(1.0)
+
+
+def _get_path_kind(path: str, cached_only: bool = False) -> Optional[str]:
+    """
+    Returns if the path is a "file", a "dir", any "other" file or "missing",
+    with a single stat call. The results are cached in the `STAT_CACHE`.
+
+    :param cached_only: If `None` is returned instead of accessing the file system
+    """
+    kind = STAT_CACHE.get(path)
+    if kind is None and not cached_only:
+        try:
+            mode = os.stat(path).st_mode
+        except (OSError, ValueError):
+            kind = "missing"
+        else:
+            kind = "dir" if stat.S_ISDIR(mode) else "file" if stat.S_ISREG(mode) else "other"
+        STAT_CACHE.set(path, kind)
+
+    return kind
+
+
+def _get_path_color(path: str, selection_type: str, cached_only: bool = False) -> Optional[str]:
+    """
+    Returns the background color of the entry field for the given path.
+
+    :param cached_only: If `None` is returned instead of accessing the file system
+    """
+    kind = _get_path_kind(path, cached_only)
+    if kind is None:
+        return None
+
+    if selection_type == "dir":
+        return _OK_COLOR if kind == "dir" else _NOT_OK_COLOR
+    if selection_type == "file":
+        return _OK_COLOR if kind == "file" else _NOT_OK_COLOR
+
+    if kind == "file":
+        return _OVERWRITE_COLOR
+
+    dir_name = os.path.dirname(path)
+    if dir_name == "":
+        return _OK_COLOR
+
+    dir_kind = _get_path_kind(dir_name, cached_only)
+    if dir_kind is None:
+        return None
+    return _OK_COLOR if dir_kind == "dir" else _NOT_OK_COLOR
@@ -34,12 +34,12 @@ class EasyLabel(EasyWidget):
         self.apply_settings(main_window, row, column, column_span, frame, anchor, justify)
 
         # Widget frame
-        self.grid_object = tk.Frame(self.frame, width=width, height=height)
+        self.grid_object = self.backend.Frame(self.frame, width=width, height=height)
 
         # Label
-        self.object_string_var = tk.StringVar()
+        self.object_string_var = self.backend.StringVar()
         self.object_string_var.set(text)
-        self.object = tk.Label(
+        self.object = self.backend.Label(
             self.grid_object,
             textvariable=self.object_string_var,
             anchor=anchor,
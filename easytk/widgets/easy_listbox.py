@@ -1,8 +1,19 @@
+import bisect
 import tkinter as tk
-from typing import List, Literal
+from collections.abc import Sequence
+from typing import Callable, Dict, Iterable, List, Literal, Optional, Set, Union
+from easytk.search import SearchIndex
+from easytk.widgets.chunked_loader import ChunkedLoader
 from easytk.widgets.easy_widget import EasyWidget
 from easytk.widgets.literals import ANCHORS, JUSTIFICATIONS
 
+# Maximum number of separate deletions, before the whole list is reassigned
+_MAX_DELETE_CALLS = 16
+
+# Maximum number of entries shown for a filter, further matches are hidden
+# until the filter is narrowed
+_MAX_FILTER_ROWS = 1000
+
 
 class EasyListbox(EasyWidget):
     """
@@ -13,9 +24,10 @@ class EasyListbox(EasyWidget):
     def __init__(
             self,
             main_window,
-            values: List[str],
+            values: Iterable[str],
             description: str = "",
             select_mode: Literal['browse', 'single', 'extended', 'multiple'] = "browse",
+            filter_mode: Literal['none', 'prefix', 'substring'] = "none",
             width: int = None,
             height: int = None,
             label_width: int = None,
@@ -31,22 +43,37 @@ class EasyListbox(EasyWidget):
         Creates a new `EasyListbox` object.
 
         :type main_window: easytk.Window
+        :param values: The values, an iterable, which is no sequence, is loaded in chunks (see `set_values`)
+        :param filter_mode: Adds an entry, which filters the values by "prefix" or "substring"
         """
         super().__init__()
         self.apply_settings(main_window, row, column, column_span, frame, anchor, justify)
-        self.entries = values.copy()
+        streamed_values = None if isinstance(values, Sequence) else values
+        values = () if streamed_values is not None else values
+        self.entries = [value if isinstance(value, str) else str(value) for value in values]
+        self._indices: Dict[str, int] = {}
+        self._build_index()
         self.select_mode = select_mode
+        self.filter_mode = filter_mode
+
+        # Indices of the shown entries, if the entries are filtered, and
+        # indices of selected entries, which are hidden by the filter
+        self.visible: Optional[List[int]] = None
+        self._hidden_selection: Set[int] = set()
+        self._search_index: Optional[SearchIndex] = None
 
         if select_mode not in ('browse', 'single', 'extended', 'multiple'):
             raise ValueError(f"Forbidden selection mode: '{select_mode}'.")
+        if filter_mode not in ('none', 'prefix', 'substring'):
+            raise ValueError(f"Forbidden filter mode: '{filter_mode}'.")
 
         # Widget frame
-        self.grid_object = tk.Frame(self.frame, width=width, height=height)
+        self.grid_object = self.backend.Frame(self.frame, width=width, height=height)
 
         # Label
-        self.label_string_var = tk.StringVar()
+        self.label_string_var = self.backend.StringVar()
         self.label_string_var.set(description)
-        self.label = tk.Label(
+        self.label = self.backend.Label(
             self.grid_object,
             textvariable=self.label_string_var,
             width=label_width,
@@ -55,16 +82,26 @@ class EasyListbox(EasyWidget):
         )
 
         # Listbox
-        self.object_var = tk.Variable()
+        self.object_var = self.backend.Variable()
         self.object_var.set(self.entries)
-        self.object = tk.Listbox(
+        self.object = self.backend.Listbox(
             self.grid_object,
             listvariable=self.object_var,
             selectmode=select_mode,
         )
 
+        # Filter entry
+        self.filter_var: tk.StringVar = ...
+        self.filter_entry: tk.Entry = ...
+        if filter_mode != "none":
+            self.filter_var = self.backend.StringVar()
+            self.filter_entry = self.backend.Entry(self.grid_object, textvariable=self.filter_var)
+            self.filter_var.trace_add("write", lambda *_: self.apply_filter(self.filter_var.get()))
+
         # Arrange widgets
         self.label.pack(side="left", padx=(0, self.padx))
+        if filter_mode != "none":
+            self.filter_entry.pack(side="top", fill="x", padx=self.padx)
         self.object.pack(side="left", fill="both", expand=True, padx=self.padx)
 
         # No widget shrinking
@@ -79,43 +116,245 @@ class EasyListbox(EasyWidget):
         if not add_to_grid:
             self.remove_from_grid()
 
+        if streamed_values is not None:
+            self.set_values(streamed_values)
+
+    def _build_index(self) -> None:
+        """
+        Maps each value to the index of its first occurrence in the entries.
+        """
+        self._indices = {}
+        for idx, entry in enumerate(self.entries):
+            self._indices.setdefault(entry, idx)
+
     def set(self, value: str) -> None:
         """
-        Sets the `EasyListbox` to the given `value`.
+        Sets the `EasyListbox` to the given `value`. If the value is not
+        contained in the listbox yet, it is added.
         """
         if not isinstance(value, str):
             value = str(value)
 
-        for idx, entry in enumerate(self.entries):
-            if entry == value:
-                self.object.selection_clear(0, 'end')
-                self.object.activate(idx)
-                self.object.index(idx)
-                self.object.selection_set(idx)
-                break
-        else:
+        self._reset_filter()
+        idx = self._indices.get(value)
+        if idx is None:
             self.insert_value(value)
-            self.set(value)
+            idx = self._indices[value]
+
+        self._hidden_selection.clear()
+        self.object.selection_clear(0, 'end')
+        self.object.activate(idx)
+        self.object.selection_set(idx)
 
     def insert_value(self, value: str) -> None:
         """
         Adds a new `value` to the contents of the `EasyListbox`.
         """
-        if not isinstance(value, str):
-            value = str(value)
+        self.insert_values([value])
 
-        if value not in self.entries:
-            self.entries.append(value)
+    def insert_values(self, values: Iterable[str]) -> None:
+        """
+        Appends all given `values`, which are not contained yet, to the
+        contents of the `EasyListbox` with a single insertion.
+        """
+        self._reset_filter()
+        new_values = []
+        for value in values:
+            if not isinstance(value, str):
+                value = str(value)
+            if value not in self._indices:
+                self._indices[value] = len(self.entries)
+                self.entries.append(value)
+                new_values.append(value)
+
+        if new_values:
+            self._search_index = None
+            self.object.insert('end', *new_values)
+
+    def remove_values(self, values: Iterable[str]) -> None:
+        """
+        Removes all occurrences of the given `values` from the `EasyListbox`.
+        """
+        self._reset_filter()
+        removed = {value if isinstance(value, str) else str(value) for value in values}
+        removed_indices = [idx for idx, entry in enumerate(self.entries) if entry in removed]
+        if not removed_indices:
+            return
+
+        # Group the removed indices into contiguous ranges
+        ranges = []
+        for idx in removed_indices:
+            if ranges and ranges[-1][1] == idx - 1:
+                ranges[-1][1] = idx
+            else:
+                ranges.append([idx, idx])
+
+        self.entries = [entry for entry in self.entries if entry not in removed]
+        self._build_index()
+        self._search_index = None
+
+        if len(ranges) <= _MAX_DELETE_CALLS:
+            # Delete from the end, so that the indices of the other ranges stay valid
+            for first, last in reversed(ranges):
+                self.object.delete(first, last)
+        else:
+            # Reassign the whole list and restore the selection of the remaining values
+            removed_set = set(removed_indices)
+            selection = [
+                idx - bisect.bisect_left(removed_indices, idx)
+                for idx in self.object.curselection()
+                if idx not in removed_set
+            ]
             self.object_var.set(self.entries)
+            # Tk keeps the selected rows, which now show other entries
+            self.object.selection_clear(0, "end")
+            for idx in selection:
+                self.object.selection_set(idx)
 
-    def set_values(self, values: List[str]) -> None:
+    def set_values(
+            self,
+            values: Iterable[str],
+            chunk_size: int = 16,
+            time_slice: float = 0.01,
+            threaded: bool = False,
+            on_error: Callable[[BaseException], None] = None
+    ) -> Optional[ChunkedLoader]:
         """
         Adjusts the selectable `values` in the `EasyListbox`.
+
+        A sequence (e.g. a list) is set at once. Any other iterable (e.g. a
+        generator or a database cursor) is loaded in chunks between the events
+        of the window, so that the window stays responsive. A loading indicator
+        is shown until all values are loaded. The load is cancelled, if new
+        values are set or the window is closed.
+
+        :param chunk_size: The number of values pulled from the iterable between two checks of the time slice
+        :param time_slice: The maximum time spent loading per step in seconds
+        :param threaded: If the iterable is consumed on a worker thread, for sources which block
+        :param on_error: Called with the exception raised by the iterable (see `load_chunked`)
+        :return: the `ChunkedLoader` if the values are loaded in chunks, otherwise `None`
         """
-        self.entries = values
+        self.cancel_loading()
+        self._reset_filter(clear_selection=True)
+        self._search_index = None
+        if isinstance(values, Sequence):
+            self.entries = [value if isinstance(value, str) else str(value) for value in values]
+            self._build_index()
+            self.object_var.set(self.entries)
+            return None
+
+        self.entries = []
+        self._indices = {}
         self.object_var.set(self.entries)
+        return self.load_chunked(
+            values,
+            self._append_values,
+            on_error=on_error,
+            chunk_size=chunk_size,
+            time_slice=time_slice,
+            threaded=threaded
+        )
+
+    def _append_values(self, values: List) -> None:
+        """
+        Appends the given `values` including duplicates with a single insertion.
+        """
+        values = [value if isinstance(value, str) else str(value) for value in values]
+        start = len(self.entries)
+        indices = self._indices
+        for idx, value in enumerate(values, start=start):
+            indices.setdefault(value, idx)
+        self.entries.extend(values)
+        self._search_index = None
+
+        if self.visible is None:
+            self.object.insert('end', *values)
+            return
+
+        # Only show the appended values, which match the active filter
+        query = self.filter_var.get()
+        shown = [
+            idx for idx, value in enumerate(values, start=start)
+            if SearchIndex.matches(query, value, self.filter_mode)
+        ]
+        shown = shown[:max(_MAX_FILTER_ROWS - len(self.visible), 0)]
+        if shown:
+            self.visible.extend(shown)
+            self.object.insert('end', *(self.entries[idx] for idx in shown))
+
+    @property
+    def search_index(self) -> SearchIndex:
+        """
+        Returns the index over the entries, which is built on first use.
+        """
+        if self._search_index is None:
+            self._search_index = SearchIndex(self.entries)
+
+        return self._search_index
+
+    def apply_filter(self, query: str) -> None:
+        """
+        Only shows the entries matching the `query` according to the
+        `filter_mode` ("prefix" is used, if no filter mode is set). The
+        selection of hidden entries is kept and restored, when they are
+        shown again.
+
+        At most `_MAX_FILTER_ROWS` matching entries are shown, so that the
+        cost of a keystroke does not depend on the number of entries.
+        """
+        mode = "prefix" if self.filter_mode == "none" else self.filter_mode
+        visible = None if query == "" else self.search_index.search(query, mode, limit=_MAX_FILTER_ROWS)
 
-    def get(self) -> str:
+        selection = self._get_selection()
+        if visible is None:
+            self.object_var.set(self.entries)
+            rows = selection
+            self._hidden_selection = set()
+        else:
+            entries = self.entries
+            self.object_var.set([entries[idx] for idx in visible])
+            selected = set(selection)
+            rows = [row for row, idx in enumerate(visible) if idx in selected] if selected else []
+            self._hidden_selection = selected.difference(visible)
+
+        self.visible = visible
+        # Tk keeps the selected rows, which now show other entries
+        self.object.selection_clear(0, "end")
+        for row in rows:
+            self.object.selection_set(row)
+
+    def _reset_filter(self, clear_selection: bool = False) -> None:
+        """
+        Shows all entries again, before the entries are modified.
+        """
+        if clear_selection:
+            self._hidden_selection = set()
+        if self.visible is None:
+            return
+
+        if self.filter_var is not ...:
+            # Clearing the entry calls `apply_filter` by its trace
+            self.filter_var.set("")
+        else:
+            self.apply_filter("")
+
+    def _get_selection(self) -> List[int]:
+        """
+        Returns the ascending indices of all selected entries, including
+        selected entries, that are hidden by the filter.
+        """
+        rows = self.object.curselection()
+        visible = self.visible
+        selection = list(rows) if visible is None else [visible[row] for row in rows]
+        if self._hidden_selection:
+            if selection and self.select_mode in ("browse", "single"):
+                self._hidden_selection = set()
+            else:
+                selection = sorted(self._hidden_selection.union(selection))
+
+        return selection
+
+    def get(self) -> Union[str, List[str]]:
         """
         Returns the currently selected item(s) in the `EasyListbox`.
 
@@ -123,7 +362,11 @@ class EasyListbox(EasyWidget):
         selected values are returned as a list. Otherwise, a single
         string is returned.
         """
-        selected_values = [self.object.get(idx) for idx in self.object.curselection()]
+        entries = self.entries
+        if self.visible is None and not self._hidden_selection:
+            selected_values = [entries[idx] for idx in self.object.curselection()]
+        else:
+            selected_values = [entries[idx] for idx in self._get_selection()]
         if self.select_mode in ["multiple", "extended"]:
             return_value = selected_values
         else:
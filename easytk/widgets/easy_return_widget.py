@@ -16,6 +16,7 @@ window type.
 #
 import tkinter as tk
 from typing import Literal
+from easytk import profiling
 from easytk.widgets.easy_widget import EasyWidget
 
 
@@ -42,18 +43,23 @@ class EasyReturnWidget(EasyWidget):
         super().__init__()
         self.apply_settings(main_window, row, column, column_span, frame, "center", "center")
 
-        self.grid_object = tk.Frame(self.frame)
+        self.grid_object = self.backend.Frame(self.frame)
         # self.grid_object.grid_propagate(False)
 
+        self.select_button: tk.Button = ...
+        self.yes_button: tk.Button = ...
+        self.false_button: tk.Button = ...
+        self.no_button: tk.Button = ...
+
         if return_type in ('Selection', 'SelectionFalse'):
-            self.select_button = tk.Button(
+            self.select_button = self.backend.Button(
                 self.grid_object,
                 text=main_window.selection_text,
                 command=self.get_return_values
             )
             self.select_button.pack(side='top' if return_type == 'Selection' else 'right')
         elif return_type == 'YesNo':
-            self.yes_button = tk.Button(
+            self.yes_button = self.backend.Button(
                 self.grid_object,
                 text=main_window.yes_text,
                 command=self.yes_clicked
@@ -63,7 +69,7 @@ class EasyReturnWidget(EasyWidget):
             raise ValueError(f"Unknown window type: {return_type}")
 
         if return_type == 'SelectionFalse':
-            self.false_button = tk.Button(
+            self.false_button = self.backend.Button(
                 self.grid_object,
                 text=main_window.false_text,
                 command=self.no_clicked
@@ -71,7 +77,7 @@ class EasyReturnWidget(EasyWidget):
             self.false_button.pack(side='left')
 
         elif return_type == 'YesNo':
-            self.no_button = tk.Button(
+            self.no_button = self.backend.Button(
                 self.grid_object,
                 text=main_window.no_text,
                 command=self.no_clicked
@@ -81,6 +87,19 @@ class EasyReturnWidget(EasyWidget):
         # self.grid_object.config(borderwidth=2.0, relief='solid', highlightcolor="yellow", highlightbackground="yellow", highlightthickness=4)
         self.insert_into_grid(self.frame, row, column, column_span, check_return_widget=False)
 
+    def update_texts(self):
+        """
+        Sets the texts of the buttons to the current settings of the main window.
+        """
+        for button, text in (
+            (self.select_button, self.main_window.selection_text),
+            (self.yes_button, self.main_window.yes_text),
+            (self.false_button, self.main_window.false_text),
+            (self.no_button, self.main_window.no_text),
+        ):
+            if button is not ...:
+                button.config(text=text)
+
     def yes_clicked(self):
         """
         Callback function for the yes button.
@@ -100,13 +119,25 @@ class EasyReturnWidget(EasyWidget):
         Callback function for the select button.
 
         Gets all returnable values from the widgets contained in the GUI
-        and assigns them to the main window.
+        and assigns them to the main window in the format given by its
+        `result_type`. Most widgets keep a copy of their value, so that
+        collecting the values does not need any Tcl calls.
         """
 
-        return_values = tuple(widget.get() for widget in self.main_window.return_objects)
-        self.main_window.return_values = return_values
+        with profiling.scope(phase="collect"):
+            return_values = tuple(self._get_value(widget) for widget in self.main_window.return_objects)
+        self.main_window.return_values = self.main_window.format_values(return_values)
         self.main_window.close()
 
+    @staticmethod
+    def _get_value(widget: EasyWidget):
+        """
+        Returns the value of the given widget, attributing the Tcl calls
+        to the widget, if profiling is enabled.
+        """
+        with profiling.scope(widget=widget.profile_label):
+            return widget.get()
+
 
 # ------------------------------
 # Execution
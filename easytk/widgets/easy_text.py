@@ -1,14 +1,50 @@
 import tkinter as tk
+from dataclasses import dataclass
+from typing import Iterable, List, Literal, Optional
 from easytk.widgets.easy_widget import EasyWidget
+from easytk.widgets.file_view import FileTail, FileView
 from easytk.widgets.literals import ANCHORS, JUSTIFICATIONS
 
+# Delay in milliseconds, after which appended text is inserted (about one frame)
+_FLUSH_INTERVAL = 16
+
+# Number of lines of a text widget, if its height is not set
+_DEFAULT_HEIGHT = 24
+
+# Number of tracked changes, after which the changes are dropped and
+# `get_changes` asks for the whole text instead
+_MAX_CHANGES = 1000
+
+
+@dataclass(frozen=True)
+class TextChange:
+    """
+    A single edit of the text. The indices ("line.column") of a deletion or
+    replacement refer to the text before the edit, those of an insertion to
+    the text after it, so that the changes can be applied in order to a copy
+    of the text.
+    """
+    operation: Literal["insert", "delete", "replace"]
+    start: str
+    end: str
+    text: str = ""
+
 
 class EasyText(EasyWidget):
     """
     Class to define a `tk.Text` widget, which can be used to display text.
 
     The text can be changed via the `set` method and returned with the `get` method
-    of an `EasyText` instance.
+    of an `EasyText` instance. For live output (e.g. logs), text can be added
+    with `append` and `append_lines`, which only insert the new content.
+
+    Large files can be shown read-only with `open_file`, which memory-maps the
+    file and only inserts the lines around the viewport. Growing files (e.g.
+    the output of a running process) can be followed with `follow_file`.
+
+    Every edit increases the `revision` of the text, so that `get` only copies
+    the text out of Tcl after it was changed, and `get_changes` returns the
+    edits since the last export instead of the whole text.
     """
 
     def __init__(
@@ -17,6 +53,11 @@ class EasyText(EasyWidget):
             text: str = "",
             export: bool = False,
             monospace: bool = False,
+            max_lines: int = None,
+            autoscroll: bool = True,
+            file_path: str = None,
+            follow_path: str = None,
+            encoding: str = "utf-8",
             width: int = None,
             height: int = None,
             row: int = ...,
@@ -27,21 +68,58 @@ class EasyText(EasyWidget):
             justify: JUSTIFICATIONS = "left",
             add_to_grid: bool = True
     ):
+        """
+        Creates a new `EasyText` object.
+
+        :type main_window: easytk.Window
+        :param max_lines: The maximum number of retained lines (line breaks), the oldest lines are
+            removed when text is appended
+        :param autoscroll: If the view follows appended text, when it is scrolled to the bottom
+        :param file_path: A file, which is shown read-only instead of the `text` (see `open_file`)
+        :param follow_path: A file, whose appended data is added to the `text` (see `follow_file`)
+        :param encoding: The encoding of the file
+        """
         super().__init__()
         self.apply_settings(main_window, row, column, column_span, frame, anchor, justify)
         self.export = export
+        self.max_lines = max_lines
+        self.autoscroll = autoscroll
+
+        # Appended text, which is inserted with the next flush, and the number
+        # of line breaks in the widget, which is tracked for trimming
+        self._pending: List[str] = []
+        self._flush_id: Optional[str] = None
+        self._line_breaks: int = text.count("\n")
+
+        # Shown file and the byte position of the first shown line
+        self.file_view: Optional[FileView] = None
+        self.file_position: int = 0
+        self.scrollbar: tk.Scrollbar = ...
+
+        # Followed file and the polling of new data
+        self.file_tail: Optional[FileTail] = None
+        self.follow_interval: int = 500
+        self._follow_id: Optional[str] = None
+
+        # Revision of the text, the last exported text and the changes since then,
+        # which are not tracked until the text is exported for the first time
+        self.revision: int = 0
+        self._exported: Optional[str] = None
+        self._exported_revision: int = -1
+        self._changes: Optional[List[TextChange]] = None
 
         # Widget frame
-        self.grid_object = tk.Frame(self.frame, width=width, height=height)
+        self.grid_object = self.backend.Frame(self.frame, width=width, height=height)
 
         # Text
-        self.object = tk.Text(
+        self.object = self.backend.Text(
             self.grid_object,
         )
         # TODO: Define default font for non-monospace texts?
         if monospace:
             self.object.config(font="Courier")
-        self.object.insert(tk.END, text)
+        self.object.insert(self.backend.END, text)
+        self.backend.watch_edits(self.object, self._on_edit)
 
         # Arrange widgets
         self.object.pack(side="left", fill="both", expand=True, padx=self.padx)
@@ -54,11 +132,283 @@ class EasyText(EasyWidget):
         if add_to_grid is False:
             self.remove_from_grid()
 
+        if file_path is not None:
+            self.open_file(file_path, encoding)
+        elif follow_path is not None:
+            self.follow_file(follow_path, encoding=encoding)
+
     def set(self, value: str) -> None:
         if isinstance(value, str):
-            self.object.delete(1.0, tk.END)
+            self.close_file()
+            self._cancel_flush()
+            self.object.delete(1.0, self.backend.END)
             self.object.insert(1.0, value)
             self.object.xview_moveto(1)
+            self._line_breaks = value.count("\n")
 
     def get(self) -> str:
-        return self.object.get("1.0", "end-1c")
+        """
+        Returns the text. The text is only copied out of the widget, if it
+        was changed since the last call.
+        """
+        if self._exported is None or self._exported_revision != self.revision:
+            self._exported = self.object.get("1.0", "end-1c")
+            self._mark_exported()
+
+        return self._exported
+
+    @property
+    def modified(self) -> bool:
+        """
+        Returns if the text was changed since it was last exported by `get`
+        or `get_changes`.
+        """
+        return self._exported_revision != self.revision
+
+    def get_changes(self) -> Optional[List[TextChange]]:
+        """
+        Returns the changes since the text was last exported by `get` or
+        `get_changes` and marks the text as exported. Applying the changes
+        in order to the last exported text results in the current text.
+
+        :return: the changes or `None`, if the text was not exported before
+            or too many changes were made to track them, in which case the
+            whole text has to be read with `get`
+        """
+        changes = self._changes
+        self._exported = None
+        self._mark_exported()
+        return changes
+
+    def _mark_exported(self) -> None:
+        self._exported_revision = self.revision
+        self._changes = []
+
+    def _on_edit(self, operation: str, start: str, end: str, text: str) -> None:
+        """
+        Records an edit of the text (see `watch_edits` of the backends).
+        """
+        self.revision += 1
+        if self._changes is not None:
+            if len(self._changes) < _MAX_CHANGES:
+                self._changes.append(TextChange(operation, start, end, text))
+            else:
+                self._changes = None
+
+    def append(self, text: str) -> None:
+        """
+        Appends the given `text`. Text appended in quick succession is
+        collected and inserted at once about every frame.
+        """
+        if self.file_view is not None:
+            raise RuntimeError("Text can not be appended, while a file is shown. Call `close_file` first.")
+        if not isinstance(text, str):
+            text = str(text)
+
+        self._pending.append(text)
+        if self._flush_id is None:
+            self._flush_id = self.object.after(_FLUSH_INTERVAL, self.flush)
+            self.main_window.add_close_callback(self._cancel_flush)
+
+    def append_lines(self, lines: Iterable[str]) -> None:
+        """
+        Appends each of the given `lines` followed by a line break.
+        """
+        self.append("".join(f"{line}\n" for line in lines))
+
+    def flush(self) -> None:
+        """
+        Inserts the appended text right away.
+
+        If `max_lines` is set, the oldest lines are removed, so that the
+        cost of an update only depends on the appended text. The view is
+        scrolled to the end, if it showed the end before.
+        """
+        if self._flush_id is not None:
+            self.object.after_cancel(self._flush_id)
+            self._flush_id = None
+            self.main_window.remove_close_callback(self._cancel_flush)
+        if not self._pending:
+            return
+
+        text = "".join(self._pending)
+        self._pending = []
+        at_bottom = self.autoscroll and float(self.object.yview()[1]) >= 1.0
+        line_breaks = text.count("\n")
+
+        if self.max_lines is not None and line_breaks >= self.max_lines:
+            # The appended text alone fills the widget, so only its last lines are inserted
+            text = "\n".join(text.split("\n")[-self.max_lines - 1:])
+            self.object.delete("1.0", self.backend.END)
+            self.object.insert("1.0", text)
+            self._line_breaks = self.max_lines
+        else:
+            self.object.insert("end-1c", text)
+            self._line_breaks += line_breaks
+            excess = self._line_breaks - self.max_lines if self.max_lines is not None else 0
+            if excess > 0:
+                self.object.delete("1.0", f"{excess + 1}.0")
+                self._line_breaks = self.max_lines
+
+        if at_bottom:
+            self.object.see("end-1c")
+
+    def _cancel_flush(self) -> None:
+        """
+        Discards the appended text, which has not been inserted yet.
+        """
+        if self._flush_id is not None:
+            self.object.after_cancel(self._flush_id)
+            self._flush_id = None
+            self.main_window.remove_close_callback(self._cancel_flush)
+        self._pending = []
+
+    def open_file(self, path: str, encoding: str = "utf-8") -> FileView:
+        """
+        Shows the file at `path` read-only. The file is memory-mapped and
+        only the lines in the viewport are inserted into the text widget.
+        The scrollbar is mapped to the byte position in the file, so that
+        any part of the file can be shown right away, while the offsets of
+        the lines are indexed on a worker thread (see `FileView`).
+
+        :return: the `FileView` of the file
+        """
+        self.stop_following()
+        self.close_file()
+        self._cancel_flush()
+        self.file_view = FileView(path, encoding).start_indexing()
+        self.main_window.add_close_callback(self.close_file)
+
+        if self.scrollbar is ...:
+            self.scrollbar = self.backend.Scrollbar(self.grid_object, orient="vertical", command=self.scroll_file)
+        self.scrollbar.pack(side="right", fill="y", before=self.object)
+        self.object.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.object.bind("<Button-4>", self._on_mouse_wheel)
+        self.object.bind("<Button-5>", self._on_mouse_wheel)
+
+        self.show_file_position(0)
+        return self.file_view
+
+    def close_file(self) -> None:
+        """
+        Closes the shown file and makes the text editable again.
+        """
+        if self.file_view is None:
+            return
+
+        self.file_view.close()
+        self.file_view = None
+        self.main_window.remove_close_callback(self.close_file)
+        self.scrollbar.pack_forget()
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.object.unbind(sequence)
+        self.object.config(state="normal")
+        self.object.delete("1.0", self.backend.END)
+        self._line_breaks = 0
+
+    def show_file_position(self, position: int) -> None:
+        """
+        Shows the lines of the file starting with the line, which contains
+        the byte at `position`.
+        """
+        file_view = self.file_view
+        rows = int(self.object.cget("height") or _DEFAULT_HEIGHT)
+
+        # Do not scroll beyond the last full page
+        last_line = file_view.line_start(file_view.size - 1)
+        position = min(file_view.line_start(position), file_view.move(last_line, 1 - rows))
+
+        text, end = file_view.read_lines(position, rows)
+        self.file_position = position
+        self.object.config(state="normal")
+        self.object.delete("1.0", self.backend.END)
+        self.object.insert("1.0", text)
+        self.object.config(state="disabled")
+        size = max(file_view.size, 1)
+        self.scrollbar.set(position / size, end / size)
+
+    def goto_line(self, line: int) -> bool:
+        """
+        Shows the file starting at the line with the given number
+        (starting at 0), if the line has been indexed already.
+
+        :return: True, if the line has been indexed
+        """
+        position = self.file_view.line_offset(line)
+        if position is None:
+            return False
+
+        self.show_file_position(position)
+        return True
+
+    def scroll_file(self, *args) -> None:
+        """
+        Callback of the scrollbar, which moves the shown part of the file
+        (e.g. `scroll_file("moveto", 0.5)` or `scroll_file("scroll", 1, "pages")`).
+        """
+        file_view = self.file_view
+        if args[0] == "moveto":
+            position = int(float(args[1]) * file_view.size)
+        elif args[0] == "scroll":
+            rows = int(self.object.cget("height") or _DEFAULT_HEIGHT)
+            lines = int(args[1]) * (rows if args[2].startswith("page") else 1)
+            position = file_view.move(self.file_position, lines)
+        else:
+            return
+
+        self.show_file_position(position)
+
+    def _on_mouse_wheel(self, event) -> str:
+        """
+        Scrolls the shown part of the file with the mouse wheel.
+        """
+        if event.num == 5 or event.delta < 0:
+            self.scroll_file("scroll", 3, "units")
+        else:
+            self.scroll_file("scroll", -3, "units")
+        return "break"
+
+    def follow_file(self, path: str, interval: int = 500, encoding: str = "utf-8", from_end: bool = False) -> FileTail:
+        """
+        Appends the data, which is appended to the file at `path`, every
+        `interval` milliseconds (see `append`). Only the new data is read,
+        so that the cost of a poll does not depend on the size of the file.
+        Truncated and rotated files are read from their start again.
+
+        :param from_end: If only data appended from now on is shown
+        :return: the `FileTail` reading the file
+        """
+        self.stop_following()
+        self.close_file()
+        self.file_tail = FileTail(path, encoding, from_end)
+        self.follow_interval = interval
+        self.main_window.add_close_callback(self.stop_following)
+        self._poll_file()
+        return self.file_tail
+
+    def stop_following(self) -> None:
+        """
+        Stops following the file.
+        """
+        if self.file_tail is None:
+            return
+
+        if self._follow_id is not None:
+            self.object.after_cancel(self._follow_id)
+            self._follow_id = None
+        self.file_tail.close()
+        self.file_tail = None
+        self.main_window.remove_close_callback(self.stop_following)
+
+    def _poll_file(self) -> None:
+        """
+        Appends the new data of the followed file and schedules the next poll.
+        """
+        self._follow_id = None
+        text = self.file_tail.read()
+        if text:
+            self.append(text)
+
+        # Continue right after the next flush, if not all data could be read at once
+        delay = _FLUSH_INTERVAL if self.file_tail.pending else self.follow_interval
+        self._follow_id = self.object.after(delay, self._poll_file)
@@ -0,0 +1,331 @@
+import tkinter as tk
+from typing import Callable, List, Literal, Optional, Sequence, Set, Union
+from easytk.widgets.easy_widget import EasyWidget
+from easytk.widgets.literals import ANCHORS, JUSTIFICATIONS
+
+
+class EasyVirtualListbox(EasyWidget):
+    """
+    Class to define a widget, that displays a `tkinter.Listbox` for very
+    large lists of values.
+
+    The values are kept in a Python sequence (or are produced by a callable
+    returning the value for a given index) and only the visible rows plus
+    a small overscan are materialized in the `tkinter.Listbox`. When scrolling,
+    the row slots are recycled, so that only the rows, which become visible,
+    are fetched. The selection is stored as a set of indices into the values.
+    """
+
+    def __init__(
+            self,
+            main_window,
+            values: Union[Sequence[str], Callable[[int], str]],
+            description: str = "",
+            length: int = None,
+            select_mode: Literal['browse', 'single', 'extended', 'multiple'] = "browse",
+            rows: int = 10,
+            overscan: int = 2,
+            width: int = None,
+            height: int = None,
+            label_width: int = None,
+            row: int = ...,
+            column: int = 0,
+            column_span: int = 1,
+            frame: tk.Frame = ...,
+            anchor: ANCHORS = "center",
+            justify: JUSTIFICATIONS = "left",
+            add_to_grid: bool = True
+    ):
+        """
+        Creates a new `EasyVirtualListbox` object.
+
+        :type main_window: easytk.Window
+        :param values: A sequence of values or a callable, which returns the value for an index
+        :param length: The number of values, required if `values` is a callable
+        :param rows: The number of visible rows
+        :param overscan: The number of rows, which are materialized below the visible rows
+        """
+        super().__init__()
+        self.apply_settings(main_window, row, column, column_span, frame, anchor, justify)
+        self.select_mode = select_mode
+        self.rows = rows
+        self.slot_count = rows + overscan
+        self.selection: Set[int] = set()
+        self.top: int = 0
+        self.active: int = 0
+
+        if select_mode not in ('browse', 'single', 'extended', 'multiple'):
+            raise ValueError(f"Forbidden selection mode: '{select_mode}'.")
+
+        # Currently materialized rows, starting at `self.top`
+        self._slots: List[str] = []
+        self._get_row: Callable[[int], str] = ...
+        self._values: Optional[Sequence[str]] = None
+        self.length: int = 0
+        self._set_source(values, length)
+
+        # Widget frame
+        self.grid_object = self.backend.Frame(self.frame, width=width, height=height)
+
+        # Label
+        self.label_string_var = self.backend.StringVar()
+        self.label_string_var.set(description)
+        self.label = self.backend.Label(
+            self.grid_object,
+            textvariable=self.label_string_var,
+            width=label_width,
+            anchor=anchor,
+            justify=justify
+        )
+
+        # Listbox with a scrollbar, that is mapped to the full list of values
+        self.object = self.backend.Listbox(
+            self.grid_object,
+            selectmode=select_mode,
+            height=rows,
+            exportselection=False,
+        )
+        self.scrollbar = self.backend.Scrollbar(
+            self.grid_object,
+            orient="vertical",
+            command=self.scroll
+        )
+        self.object.bind("<<ListboxSelect>>", self._on_select)
+        self.object.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.object.bind("<Button-4>", self._on_mouse_wheel)
+        self.object.bind("<Button-5>", self._on_mouse_wheel)
+        # The keyboard navigation of Tk would scroll the listbox into the overscan rows
+        for sequence in ("<Up>", "<Down>", "<Prior>", "<Next>"):
+            self.object.bind(sequence, self._on_key)
+        # Dragging the selection out of the listbox would do the same
+        self.object.bind("<B1-Leave>", lambda _: "break")
+
+        # Arrange widgets
+        self.label.pack(side="left", padx=(0, self.padx))
+        self.object.pack(side="left", fill="both", expand=True, padx=(self.padx, 0))
+        self.scrollbar.pack(side="left", fill="y", padx=(0, self.padx))
+
+        # No widget shrinking
+        self.grid_object.grid_propagate(False)
+
+        # Remove label if label text is empty
+        if description.strip() == "":
+            self.label.pack_forget()
+
+        self._render()
+
+        # Add to grid and then remove if desired
+        self.insert_into_grid(self.frame, row, column, column_span)
+        if not add_to_grid:
+            self.remove_from_grid()
+
+    def _set_source(self, values: Union[Sequence[str], Callable[[int], str]], length: int = None):
+        """
+        Stores the source of the values and the number of values.
+        """
+        if callable(values):
+            if length is None:
+                raise ValueError("The length is required, if the values are given as a callable.")
+            self._get_row = values
+            self._values = None
+            self.length = length
+        else:
+            self._get_row = values.__getitem__
+            self._values = values
+            self.length = len(values) if length is None else length
+
+    def _render(self, top: int = None):
+        """
+        Materializes the rows starting at `top` in the row slots of the listbox.
+
+        If the new rows overlap with the currently materialized rows, only
+        the rows, that scrolled into view, are fetched and inserted, while
+        the remaining slots are reused.
+        """
+        top = self.top if top is None else top
+        top = max(0, min(top, max(self.length - self.rows, 0)))
+        end = min(top + self.slot_count, self.length)
+        shift = top - self.top
+
+        if self._slots and 0 < shift < len(self._slots):
+            # Scrolled down: drop rows at the head and append new rows at the tail
+            start = self.top + len(self._slots)
+            new_rows = [str(self._get_row(idx)) for idx in range(start, end)]
+            self.object.delete(0, shift - 1)
+            if new_rows:
+                self.object.insert("end", *new_rows)
+            self._slots = self._slots[shift:] + new_rows
+        elif self._slots and 0 < -shift < len(self._slots):
+            # Scrolled up: drop rows at the tail and insert new rows at the head
+            new_rows = [str(self._get_row(idx)) for idx in range(top, self.top)]
+            keep = end - self.top
+            if keep < len(self._slots):
+                self.object.delete(keep, "end")
+            self.object.insert(0, *new_rows)
+            self._slots = new_rows + self._slots[:keep]
+        elif shift != 0 or len(self._slots) != end - top:
+            self._slots = [str(self._get_row(idx)) for idx in range(top, end)]
+            self.object.delete(0, "end")
+            if self._slots:
+                self.object.insert("end", *self._slots)
+
+        self.top = top
+        self.object.yview_moveto(0)
+        self._show_selection()
+        self._update_scrollbar()
+
+    def _show_selection(self):
+        """
+        Highlights the selected rows among the materialized rows.
+        """
+        self.object.selection_clear(0, "end")
+        for idx in self.selection:
+            if self.top <= idx < self.top + len(self._slots):
+                self.object.selection_set(idx - self.top)
+
+    def _update_scrollbar(self):
+        """
+        Maps the currently visible rows to the position of the scrollbar.
+        """
+        if self.length == 0:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.top / self.length, min((self.top + self.rows) / self.length, 1.0))
+
+    def _on_select(self, *_):
+        """
+        Updates the selected indices from the selection of the visible rows.
+        """
+        visible = range(self.top, self.top + len(self._slots))
+        selected = {self.top + slot for slot in self.object.curselection()}
+        if self.select_mode in ("browse", "single"):
+            if selected:
+                self.selection = selected
+                self.active = min(selected)
+        else:
+            self.selection.difference_update(visible)
+            self.selection.update(selected)
+
+    def _on_mouse_wheel(self, event) -> str:
+        """
+        Scrolls the rows with the mouse wheel instead of scrolling the listbox.
+        """
+        if event.num == 5 or event.delta < 0:
+            self.scroll("scroll", 3, "units")
+        else:
+            self.scroll("scroll", -3, "units")
+        return "break"
+
+    def _on_key(self, event) -> str:
+        """
+        Moves the active row with the arrow and page keys, which scrolls the
+        rows at the edges. Like in Tk, the active row is selected in the
+        "browse" and "extended" modes.
+        """
+        step = {"Up": -1, "Down": 1, "Prior": -self.rows, "Next": self.rows}.get(event.keysym, 0)
+        if self.length == 0 or step == 0:
+            return "break"
+
+        self.active = max(0, min(self.active + step, self.length - 1))
+        self.see(self.active)
+        if self.select_mode in ("browse", "extended"):
+            self.selection = {self.active}
+            self._show_selection()
+            self.object.event_generate("<<ListboxSelect>>")
+        self.object.activate(self.active - self.top)
+        return "break"
+
+    def scroll(self, *args):
+        """
+        Callback of the scrollbar, which moves the visible rows
+        (e.g. `scroll("moveto", 0.5)` or `scroll("scroll", 1, "pages")`).
+        """
+        if args[0] == "moveto":
+            top = int(float(args[1]) * self.length)
+        elif args[0] == "scroll":
+            step = self.rows if args[2].startswith("page") else 1
+            top = self.top + int(args[1]) * step
+        else:
+            return
+
+        self._render(top)
+
+    def see(self, index: int):
+        """
+        Scrolls the rows, so that the value at `index` is visible.
+        """
+        if index < self.top:
+            self._render(index)
+        elif index >= self.top + self.rows:
+            self._render(index - self.rows + 1)
+
+    def set(self, value: str) -> None:
+        """
+        Selects the given `value` and scrolls it into view.
+
+        The values are searched one by one, which fetches every value up to
+        the given one. Use `select` with the index of the value, if it is
+        known, e.g. for large or lazily provided values.
+        """
+        if not isinstance(value, str):
+            value = str(value)
+
+        for idx in range(self.length):
+            if str(self._get_row(idx)) == value:
+                self.select(idx)
+                break
+        else:
+            raise ValueError(f"Value not found: '{value}'.")
+
+    def select(self, index: int) -> None:
+        """
+        Selects the value at `index` and scrolls it into view.
+        """
+        if not 0 <= index < self.length:
+            raise IndexError(f"Index out of range: {index}.")
+
+        self.selection = {index}
+        self.active = index
+        self.see(index)
+        self._show_selection()
+
+    def set_values(self, values: Union[Sequence[str], Callable[[int], str]], length: int = None) -> None:
+        """
+        Replaces the values of the `EasyVirtualListbox` and clears the selection.
+        """
+        self._set_source(values, length)
+        self.selection = set()
+        self._slots = []
+        self.top = 0
+        self.active = 0
+        self._render(0)
+
+    def refresh(self, length: int = None) -> None:
+        """
+        Renders the visible rows again after the values have changed in
+        place, keeping the scroll position and the selected indices.
+
+        :param length: The new number of values, by default the length of a sequence is read again
+        """
+        if length is not None:
+            self.length = length
+        elif self._values is not None:
+            self.length = len(self._values)
+        self.selection = {idx for idx in self.selection if idx < self.length}
+        self.active = min(self.active, max(self.length - 1, 0))
+        self._slots = []
+        self._render()
+
+    def get(self) -> Union[str, List[str]]:
+        """
+        Returns the currently selected item(s) in the `EasyVirtualListbox`.
+
+        If the `select_mode` is set to `multiple` or `extended`, all
+        selected values are returned as a list. Otherwise, a single
+        string is returned.
+        """
+        selected_values = [str(self._get_row(idx)) for idx in sorted(self.selection) if idx < self.length]
+        if self.select_mode in ["multiple", "extended"]:
+            return selected_values
+
+        return selected_values[0] if selected_values else ""
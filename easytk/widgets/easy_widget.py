@@ -1,4 +1,7 @@
 import tkinter as tk
+from typing import Any, Callable, Iterable, List, Optional
+from easytk import workers
+from easytk.widgets.chunked_loader import ChunkedLoader
 from easytk.widgets.literals import ANCHORS, JUSTIFICATIONS
 
 
@@ -11,18 +14,27 @@ class EasyWidget:
     def __init__(self):
         self.add_to_grid: bool = True
         self.anchor: str = ...
+        self.backend = ...
         self.column: int = ...
         self.column_span: int = 1
         self.frame: tk.Frame = ...
         self.grid_object: tk.Frame = ...
         self.justify: str = ...
         self.main_window = ...
+        self.name: Optional[str] = None
         self.label_string_var: tk.StringVar = ...
+        self.loader: Optional[ChunkedLoader] = None
+        self.loading_label: tk.Label = ...
         self.object: tk.Widget = ...
         self.object_string_var: tk.StringVar = ...
         self.padx: int = 2
+        self.profile_label: str = ...
         self.row: int = ...
 
+        # Variable holding the value and its copy, which is kept in sync by a trace
+        self.value_var: tk.Variable = ...
+        self.value = None
+
     def apply_settings(
             self,
             main_window,
@@ -39,6 +51,7 @@ class EasyWidget:
         :type main_window: easytk.Window
         """
         self.main_window = main_window
+        self.backend = main_window.backend
         self.row = row
         self.column = column
         self.column_span = column_span
@@ -55,27 +68,24 @@ class EasyWidget:
             check_return_widget: bool = True
     ):
         """
-        Adds the `EasyWidget` to the grid.
-
-        If no `row` or `column` values are given, the function checks the
-        current grid size of the `tk.Frame`, and adds the widget to the
-        next free row in the first column, spanning the amount of columns
-        defined by `column_span`.
-        """
-        if check_return_widget and self.main_window.return_widget is not ...:
-            _RETURN_WIDGET_EXISTS = True
-            self.main_window.return_widget.grid_object.grid_forget()
-        else:
-            _RETURN_WIDGET_EXISTS = False
-
-        if row is ...:
-            row = frame.grid_size()[1]
+        Adds the `EasyWidget` to the layout of the main window.
 
-        self.grid_object.grid(row=row, column=column, columnspan=column_span)
+        If no `row` value is given, the widget is placed in the next free
+        row of the `tk.Frame`, spanning the amount of columns defined by
+        `column_span`. The widgets are only added to the grid, once the
+        window is shown.
 
-        if _RETURN_WIDGET_EXISTS:
-            for widget in self.main_window.return_widget:
-                widget.grid_object.grid()
+        :param check_return_widget: False, if this is the return widget of the window
+        """
+        placement = self.main_window.layout.place(
+            self,
+            frame,
+            row=row,
+            column=column,
+            column_span=column_span,
+            is_return_widget=not check_return_widget
+        )
+        self.row = placement.row
 
     def remove_from_grid(self):
         """
@@ -84,14 +94,30 @@ class EasyWidget:
         to the same position as before by making an empty `grid()` call
         without any positioning arguments.
         """
-        self.grid_object.grid_remove()
+        self.main_window.layout.hide(self)
 
     def get(self):
         """
         Returns the value of the object string variable.
         """
+        if self.value_var is not ...:
+            return self.value
         return self.object_string_var.get()
 
+    def mirror_variable(self, variable: tk.Variable) -> None:
+        """
+        Keeps a copy of the value of `variable` in `value`, which is updated
+        by a write trace, whenever the variable is changed (e.g. by typing).
+        Reading the value then does not need a Tcl call, so that the values
+        of a form are collected without any Tcl calls.
+        """
+        self.value_var = variable
+        self.value = variable.get()
+        variable.trace_add("write", self._update_value)
+
+    def _update_value(self, *_):
+        self.value = self.value_var.get()
+
     def set(self, value: str):
         """
         Sets the value of the object string variable.
@@ -102,3 +128,119 @@ class EasyWidget:
         self.object_string_var.set(value)
         if hasattr(self.object, "xview_moveto"):
             self.object.xview_moveto(1.0)
+
+    def bind_async(self, sequence: str, callback: Callable[..., Any]) -> None:
+        """
+        Binds a normal or async `callback` to the event `sequence` of the
+        widget (see `Window.bind_async`).
+        """
+        self.main_window.bind_async(self.object, sequence, callback)
+
+    def set_threadsafe(self, value) -> None:
+        """
+        Sets the value from any thread. The value is set by the window's
+        update queue on its thread. If the value is set several times
+        within a frame, only the latest value is applied.
+        """
+        self.main_window.post(self.set, value, key=(self, "set"))
+
+    def load_chunked(
+            self,
+            values: Iterable,
+            on_chunk: Callable[[List], None],
+            on_done: Callable[[], None] = None,
+            on_error: Callable[[BaseException], None] = None,
+            **loader_options
+    ) -> ChunkedLoader:
+        """
+        Streams the given `values` into the widget in time-sliced chunks
+        (see `ChunkedLoader`), while a loading indicator is shown next to it.
+        A previous load is cancelled and the load is cancelled as well, when
+        the window is closed.
+
+        :param on_chunk: Called with each list of loaded values
+        :param on_done: Called after all values have been loaded
+        :param on_error: Called with the exception raised by the iterable,
+            if not given, the exception is raised on the event loop
+        :param loader_options: Options passed to the `ChunkedLoader`
+        :return: the started `ChunkedLoader`
+        """
+        self.cancel_loading()
+        self.show_loading()
+
+        def chunk_loaded(chunk: List):
+            on_chunk(chunk)
+            self.show_loading(f"Loading... ({loader.count})")
+
+        def loading_done():
+            self.hide_loading()
+            self.main_window.remove_close_callback(loader.cancel)
+            if on_done is not None:
+                on_done()
+
+        def loading_failed(error: BaseException):
+            self.hide_loading()
+            self.main_window.remove_close_callback(loader.cancel)
+            if on_error is None:
+                raise error
+            on_error(error)
+
+        loader = ChunkedLoader(self.grid_object, values, chunk_loaded, loading_done, loading_failed, **loader_options)
+        self.loader = loader
+        self.main_window.add_close_callback(loader.cancel)
+        return loader.start()
+
+    def cancel_loading(self):
+        """
+        Cancels loading values with `load_chunked`, if a load is in progress.
+        """
+        if self.loader is not None and self.loader.active:
+            self.loader.cancel()
+            self.main_window.remove_close_callback(self.loader.cancel)
+            self.hide_loading()
+        self.loader = None
+
+    def show_loading(self, text: str = "Loading..."):
+        """
+        Shows a loading indicator with the given `text` next to the widget.
+        """
+        if self.loading_label is ...:
+            self.loading_label = self.backend.Label(self.grid_object, text=text)
+        else:
+            self.loading_label.config(text=text)
+        if self.loading_label.winfo_manager() != "pack":
+            self.loading_label.pack(side="left", padx=self.padx)
+
+    def hide_loading(self):
+        """
+        Hides the loading indicator.
+        """
+        if self.loading_label is not ...:
+            self.loading_label.pack_forget()
+
+    def run_in_background(
+            self,
+            function: Callable[..., Any],
+            *args,
+            on_result: Callable[[Any], None] = None,
+            on_error: Callable[[BaseException], None] = None
+    ) -> workers.BackgroundTask:
+        """
+        Calls `function` on a worker thread and passes its result to
+        `on_result` on the event loop (see `workers.run_in_background`).
+        The result is discarded, if the window is closed before.
+        """
+        def result_ready(result):
+            self.main_window.remove_close_callback(task.cancel)
+            if on_result is not None:
+                on_result(result)
+
+        def error_raised(error: BaseException):
+            self.main_window.remove_close_callback(task.cancel)
+            if on_error is None:
+                raise error
+            on_error(error)
+
+        task = workers.run_in_background(self.grid_object, function, *args, on_result=result_ready, on_error=error_raised)
+        self.main_window.add_close_callback(task.cancel)
+        return task
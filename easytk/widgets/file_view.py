@@ -0,0 +1,282 @@
+"""
+This module contains the file access of `EasyText`: a read-only view of a
+(possibly very large) file, which is used to display only the lines around
+the viewport, and a reader, which follows the data appended to a file.
+"""
+
+# ------------------------------
+# Imports
+#
+import bisect
+import codecs
+import mmap
+import os
+import threading
+from array import array
+from typing import Optional, Tuple
+
+
+# ------------------------------
+# Classes
+#
+class FileView:
+    """
+    Memory-maps a file and reads lines starting at any byte position
+    without loading the file.
+
+    The offsets of all lines are collected by `start_indexing` on a worker
+    thread, so that lines can be addressed by their number. Reading lines
+    at a byte position does not need the index, so that the view can jump
+    anywhere in the file, while the index is still being built.
+    """
+
+    def __init__(self, path: str, encoding: str = "utf-8", chunk_size: int = 2 ** 24):
+        """
+        :param path: The path of the file
+        :param encoding: The encoding used to decode the lines
+        :param chunk_size: The number of bytes searched for line breaks at once while indexing
+        """
+        self.path = path
+        self.encoding = encoding
+        self.chunk_size = chunk_size
+        self._file = open(path, "rb")
+        self.size: int = os.fstat(self._file.fileno()).st_size
+        # Empty files cannot be mapped
+        self.map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+
+        # Offsets of the line starts, which are known so far
+        self.line_offsets = array("Q", [0])
+        self.indexed: int = 0
+        self.index_done = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._closed: bool = False
+        self._lock = threading.Lock()
+
+    def start_indexing(self) -> "FileView":
+        """
+        Starts collecting the line offsets on a worker thread.
+        """
+        self._thread = threading.Thread(target=self._build_index, daemon=True)
+        self._thread.start()
+        return self
+
+    def _build_index(self):
+        """
+        Collects the offsets of all line starts (worker thread).
+        """
+        try:
+            data, size, offsets = self.map, self.size, self.line_offsets
+            start = 0
+            while start < size and not self._closed:
+                end = min(start + self.chunk_size, size)
+                position = data.find(b"\n", start, end)
+                while position != -1:
+                    if position + 1 < size:
+                        offsets.append(position + 1)
+                    position = data.find(b"\n", position + 1, end)
+                start = self.indexed = end
+        finally:
+            self.index_done.set()
+            with self._lock:
+                if self._closed:
+                    self._release()
+
+    @property
+    def line_count(self) -> Optional[int]:
+        """
+        Returns the number of lines, if the index is complete, otherwise `None`.
+        """
+        return len(self.line_offsets) if self.index_done.is_set() else None
+
+    def line_start(self, position: int) -> int:
+        """
+        Returns the start of the line containing the byte at `position`.
+        """
+        position = max(0, min(position, self.size))
+        if position == 0:
+            return 0
+        return self.map.rfind(b"\n", 0, position) + 1
+
+    def line_number(self, position: int) -> Optional[int]:
+        """
+        Returns the number (starting at 0) of the line containing the byte
+        at `position` or `None`, if that part of the file is not indexed yet.
+        """
+        if position >= self.indexed and not self.index_done.is_set():
+            return None
+        return bisect.bisect_right(self.line_offsets, position) - 1
+
+    def line_offset(self, line: int) -> Optional[int]:
+        """
+        Returns the start of the line with the given number (starting at 0)
+        or `None`, if the line is not indexed yet.
+        """
+        line = max(line, 0)
+        if line < len(self.line_offsets):
+            return self.line_offsets[line]
+        return self.size if self.index_done.is_set() else None
+
+    def move(self, position: int, lines: int) -> int:
+        """
+        Returns the start of the line `lines` lines after (or before, if
+        negative) the line starting at `position`.
+        """
+        data = self.map
+        if lines >= 0:
+            for _ in range(lines):
+                next_line = data.find(b"\n", position, self.size)
+                if next_line == -1 or next_line + 1 >= self.size:
+                    break
+                position = next_line + 1
+        else:
+            for _ in range(-lines):
+                if position == 0:
+                    break
+                position = self.line_start(position - 1)
+        return position
+
+    def read_lines(self, position: int, count: int) -> Tuple[str, int]:
+        """
+        Reads `count` lines starting at the line start `position`.
+
+        :return: the decoded lines and the position after the last line
+        """
+        end = position
+        for _ in range(count):
+            line_end = self.map.find(b"\n", end, self.size)
+            if line_end == -1:
+                end = self.size
+                break
+            end = line_end + 1
+
+        text = self.map[position:end].decode(self.encoding, errors="replace")
+        return text, end
+
+    def close(self):
+        """
+        Stops indexing and closes the file.
+        """
+        with self._lock:
+            self._closed = True
+            if self._thread is None or self.index_done.is_set():
+                self._release()
+
+    def _release(self):
+        if isinstance(self.map, mmap.mmap) and not self.map.closed:
+            self.map.close()
+        self._file.close()
+
+
+class FileTail:
+    """
+    Reads the data appended to a file since the last read, like `tail -F`.
+
+    The reader remembers the offset, up to which the file has been read,
+    and decodes the new bytes incrementally, so that characters split
+    between two reads are decoded correctly. If the file is truncated, it
+    is read from its start again. If the file is replaced (e.g. by log
+    rotation), the rest of the old file is read over as many reads as
+    needed, before the new file is opened.
+    """
+
+    def __init__(self, path: str, encoding: str = "utf-8", from_end: bool = False, max_read: int = 2 ** 22):
+        """
+        :param path: The path of the file
+        :param encoding: The encoding used to decode the data
+        :param from_end: If only data appended after opening the file is read
+        :param max_read: The maximum number of bytes returned by one `read`
+        """
+        self.path = path
+        self.encoding = encoding
+        self.max_read = max_read
+        self.offset: int = 0
+        self._file = None
+        self._identity: Optional[Tuple[int, int]] = None
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._open()
+        if from_end and self._file is not None:
+            self.offset = os.fstat(self._file.fileno()).st_size
+
+    def _open(self):
+        """
+        Opens the file at the path, if it exists.
+        """
+        try:
+            self._file = open(self.path, "rb")
+        except FileNotFoundError:
+            self._file = None
+            self._identity = None
+            return
+
+        stat = os.fstat(self._file.fileno())
+        self._identity = (stat.st_dev, stat.st_ino)
+        self.offset = 0
+        self._decoder.reset()
+
+    def _read_from_file(self, size: int) -> str:
+        self._file.seek(self.offset)
+        data = self._file.read(size)
+        self.offset += len(data)
+        return self._decoder.decode(data)
+
+    def read(self) -> str:
+        """
+        Returns the text appended since the last read. The cost only
+        depends on the size of the new data.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            # The file is being rotated, the new file is opened by a later read
+            stat = None
+
+        text = ""
+        budget = self.max_read
+        if self._file is not None and (stat is None or (stat.st_dev, stat.st_ino) != self._identity):
+            # The file was replaced, the rest of the old file is read first
+            remaining = os.fstat(self._file.fileno()).st_size - self.offset
+            if remaining > 0:
+                text = self._read_from_file(min(remaining, budget))
+                if remaining >= budget:
+                    return text
+                budget -= remaining
+            self._file.close()
+            self._file = None
+
+        if stat is None:
+            return text
+
+        if self._file is None:
+            self._open()
+            if self._file is None:
+                return text
+            stat = os.fstat(self._file.fileno())
+        elif stat.st_size < self.offset:
+            # The file was truncated
+            self.offset = 0
+            self._decoder.reset()
+
+        if stat.st_size > self.offset:
+            text += self._read_from_file(min(stat.st_size - self.offset, budget))
+
+        return text
+
+    @property
+    def pending(self) -> bool:
+        """
+        Returns if the file contains data, which has not been read yet.
+        """
+        if self._file is None:
+            return False
+        try:
+            return os.fstat(self._file.fileno()).st_size > self.offset
+        except OSError:
+            return False
+
+    def close(self):
+        """
+        Closes the file.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -6,21 +6,27 @@ easytk module.
 # ------------------------------
 # Imports
 #
-import os
+import asyncio
+import collections
+import inspect
+import threading
+import time
 import tkinter as tk
+import typing
+from concurrent.futures import Future
 
-from easytk import widgets
+from easytk import profiling, settings, widgets, workers
+from easytk.layout import GridLayout
+from easytk.root import ROOT_MANAGER
+from easytk.settings import Setting
 from easytk.widgets.literals import ANCHORS, JUSTIFICATIONS
-from typing import Any, List, Literal, Tuple, Union
+from typing import Any, Callable, Hashable, Iterable, List, Literal, Optional, Sequence, Set, Tuple, Union
 
 # ------------------------------
 # Globals
 #
-_CURRENT_DIR = os.getcwd()
-_ROOT = tk.Tk()
-_ROOT.withdraw()
-
 WINDOW_TYPES = Literal["Selection", "SelectionFalse", "YesNo", "Message"]
+RESULT_TYPES = Literal["tuple", "dict", "namedtuple"]
 
 
 # ------------------------------
@@ -30,8 +36,22 @@ class Window:
     """
     Main class to create user interfaces with the easytk module.
     It can be called with the desired interface type.
+
+    The settings below can be changed with `config` or by assigning them.
+    Changes are applied to the window right away.
     """
 
+    # Settings
+    title = Setting(str, "easytk", apply="_apply_title")
+    false_text = Setting(str, "Cancel", apply="_apply_button_texts")
+    no_text = Setting(str, "No", apply="_apply_button_texts")
+    ok_text = Setting(str, "OK", apply="_apply_button_texts")
+    selection_text = Setting(str, "Select", apply="_apply_button_texts")
+    yes_text = Setting(str, "Yes", apply="_apply_button_texts")
+    # Format of the returned values of "Selection" windows, which are
+    # keyed by the widget names for "dict" and "namedtuple"
+    result_type = Setting(str, "tuple", choices=typing.get_args(RESULT_TYPES))
+
     def __init__(
         self,
         window_type: WINDOW_TYPES = "SelectionFalse",
@@ -44,53 +64,232 @@ class Window:
         :param window_type: The type of GUI that will be displayed
         :param window_title: The title of the GUI
         """
+        build_start = time.perf_counter()
         self.label_width: int = ...
         self.return_values: Tuple[Any] = ...
-        self.title: str = window_title
+        self.title = window_title
         self.window_type: WINDOW_TYPES = window_type
         self._TESTING: bool = testing
+        self._closed: bool = False
 
-        # Initialize return button texts
-        self.false_text: str = "Cancel"
-        self.no_text: str = "No"
-        self.ok_text: str = "OK"
-        self.selection_text: str = "Select"
-        self.yes_text: str = "Yes"
         self.return_widget: widgets.EasyReturnWidget = ...
+        self._result_class: Optional[Tuple[str, Callable[..., Any]]] = None
 
         # Initialize and configure the main window
-        self.master_frame = tk.Toplevel(_ROOT)
-        self.master_frame.attributes("-topmost", True)
-        self.master_frame.protocol("WM_DELETE_WINDOW", self.close)  # Close window on close button
-        self.master_frame.title(window_title)
+        self.backend = ROOT_MANAGER.backend
+        with profiling.scope(phase="construct"):
+            self.master_frame = self.backend.Toplevel(ROOT_MANAGER.acquire(self))
+            self.master_frame.attributes("-topmost", True)
+            self.master_frame.protocol("WM_DELETE_WINDOW", self.close)  # Close window on close button
+            self.master_frame.title(window_title)
 
         # Initialize collectors
         self.return_objects: List[widgets.EasyWidget] = []
+        self.layout: GridLayout = GridLayout()
+        self._close_callbacks: List[Callable[[], None]] = []
+        self._widget_count: int = 0
+        self.updates: workers.UpdateQueue = workers.UpdateQueue(self.master_frame)
+
+        # Result of a non-blocking `show` and the thread, which runs the window
+        self.future: Optional[WindowFuture] = None
+        self._thread_id: int = threading.get_ident()
+
+        # Event loop of `show_async`, which runs the async callbacks
+        self.event_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_tasks: Set[asyncio.Task] = set()
+
+        ROOT_MANAGER.record_window_built(build_start)
 
     def close(self):
         """
-        Closes the window and destroys the tkinter root object.
+        Closes the window and destroys the tkinter root object,
+        if no other window is using it anymore.
         """
+        if self._closed:
+            return
+
+        self._closed = True
+        self.updates.close()
+        for task in list(self._async_tasks):
+            task.cancel()
+        for callback in list(self._close_callbacks):
+            callback()
+        self._close_callbacks = []
+
         self.master_frame.destroy()
-        if not self._TESTING:
-            _ROOT.destroy()
+        ROOT_MANAGER.release(self, keep_alive=self._TESTING)
+        if self.future is not None and not self.future.done():
+            self.future.set_result(self.return_values)
+
+    def add_close_callback(self, callback: Callable[[], None]):
+        """
+        Registers a function, which is called when the window is closed,
+        e.g. to cancel pending background work of a widget.
+        """
+        self._close_callbacks.append(callback)
+
+    def remove_close_callback(self, callback: Callable[[], None]):
+        """
+        Unregisters a function, that was added with `add_close_callback`.
+        """
+        if callback in self._close_callbacks:
+            self._close_callbacks.remove(callback)
+
+    def post(self, function: Callable[..., Any], *args, key: Hashable = None):
+        """
+        Runs `function(*args)` on the thread of the window. Unlike all other
+        methods, this method can be called from any thread, e.g. to update
+        widgets with the progress of a worker thread. Calls posted after the
+        window was closed are discarded.
+
+        Example: `window.post(label.set, "Done")`
+
+        :param key: Calls with the same key are coalesced, so that only the
+            latest one is run per frame (see `workers.UpdateQueue`)
+        """
+        self.updates.post(function, *args, key=key)
 
-    def show(self) -> Union[Tuple, bool, None]:
+    def show(self, block: bool = True) -> Union[Tuple, bool, None, "WindowFuture"]:
         """
         Shows the `Window` and returns the value(s), that are given back
         for the chosen window type.
+
+        :param block: If not set, the window is shown without waiting for
+            it and a `WindowFuture` is returned instead, which resolves to
+            the value(s), once the window is closed. This allows showing
+            several windows at once (see `easytk.gather`).
         """
-        column_span, _ = self.master_frame.grid_size()
-        self.return_widget = self.add_return_widget(self.window_type, column_span=column_span)
+        self._prepare_show()
+        if not block:
+            self.future = WindowFuture(self)
+            return self.future
+
+        self.wait()
+        return self.return_values
 
-        self.center_window()
-        if not self._TESTING:
-            self.master_frame.update()
-            self.master_frame.deiconify()
+    def wait(self):
+        """
+        Runs the event loop until the window is closed. Other open windows
+        keep responding in the meantime.
+        """
+        if not self._closed and not self._TESTING:
             self.master_frame.wait_window()
 
+    async def show_async(self, poll_interval: int = 10) -> Union[Tuple, bool, None]:
+        """
+        Shows the `Window` without blocking the running asyncio event loop
+        and returns the same value(s) as `show`.
+
+        The tkinter events are processed every `poll_interval` milliseconds
+        in between the other tasks of the asyncio loop, so that the window
+        stays responsive, while other coroutines are running. Async
+        callbacks bound with `bind_async` run on this loop.
+
+        Example: `values = await window.show_async()`
+        """
+        self.event_loop = asyncio.get_running_loop()
+        self._prepare_show()
+        if self._TESTING:
+            return self.return_values
+
+        root = ROOT_MANAGER.get_root()
+        try:
+            while not self._closed:
+                advance = getattr(root, "advance", None)
+                if advance is not None:
+                    # The headless root runs on a virtual clock, which follows the polling
+                    advance(poll_interval)
+                else:
+                    root.update()
+                await asyncio.sleep(poll_interval / 1000)
+        finally:
+            # A cancelled task leaves no one to process the events of the window
+            self.close()
+
         return self.return_values
 
+    def bind_async(self, widget: tk.Widget, sequence: str, callback: Callable[..., Any]):
+        """
+        Binds `callback` to the event `sequence` of the tkinter `widget`.
+        The callback can be a normal function or a coroutine function,
+        whose coroutines are run as tasks on the loop of `show_async`.
+        Running tasks are cancelled, when the window is closed.
+
+        Example: `window.bind_async(entry.object, "<Return>", fetch_details)`
+        """
+        widget.bind(sequence, self.wrap_callback(callback), add="+")
+
+    def wrap_callback(self, callback: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Returns a function, which calls `callback` and runs the returned
+        coroutine (if any) as task on the loop of `show_async`.
+        """
+        def wrapper(*args):
+            result = callback(*args)
+            if inspect.isawaitable(result):
+                if self.event_loop is None or self.event_loop.is_closed():
+                    if inspect.iscoroutine(result):
+                        result.close()
+                    raise RuntimeError("Async callbacks can only be used with show_async().")
+                task = asyncio.ensure_future(result, loop=self.event_loop)
+                self._async_tasks.add(task)
+                task.add_done_callback(self._async_tasks.discard)
+
+        return wrapper
+
+    def _prepare_show(self):
+        """
+        Adds the return widget, applies the layout and shows the window.
+        """
+        column_span = max(self.layout.column_count(self.master_frame), 1)
+        self.return_widget = self.add_return_widget(self.window_type, column_span=column_span)
+        with profiling.scope(phase="layout"):
+            self.layout.apply()
+
+        with profiling.scope(phase="show"):
+            self.updates.start()
+            self.center_window()
+            if not self._TESTING:
+                self.master_frame.update()
+                self.master_frame.deiconify()
+
+    def format_values(self, values: Tuple) -> Union[Tuple, dict]:
+        """
+        Returns the collected `values` of the return objects in the format
+        given by `result_type`. The keys are only computed once per window.
+        """
+        if self.result_type == "tuple":
+            return values
+        if self._result_class is None or self._result_class[0] != self.result_type:
+            names = self.get_value_names()
+            if self.result_type == "namedtuple":
+                # Names, which are no valid identifiers, are replaced by "_<index>"
+                result_class = collections.namedtuple("Values", names, rename=True)
+            else:
+                result_class = lambda *args: dict(zip(names, args))
+            self._result_class = (self.result_type, result_class)
+
+        return self._result_class[1](*values)
+
+    def get_value_names(self) -> List[str]:
+        """
+        Returns the keys of the return objects for name-keyed results: the
+        name or description of each widget or "value_<index>", if it has
+        neither. Duplicate names are made unique by appending "_<index>".
+        """
+        names = []
+        for idx, widget in enumerate(self.return_objects):
+            name = widget.name if isinstance(widget.name, str) and widget.name else f"value_{idx}"
+            names.append(name if name not in names else f"{name}_{idx}")
+        return names
+
+    def _on_future_done(self, future: Future):
+        """
+        Closes the window, if its future was cancelled (possibly by another thread).
+        """
+        if future.cancelled():
+            self.post(self.close)
+
     def center_window(self):
         """
         Places the window at the center of the screen.
@@ -108,26 +307,23 @@ class Window:
     def config(self, **kwargs):
         """
         Checks if the given `kwargs` refer to valid settings and if so,
-        changes to the given value.
+        changes them to the given values. All settings are validated
+        first, so that the window is left unchanged, if any of them is
+        invalid, and the changes are applied to the window at once.
 
-        Example: `window.config(width=550)`
+        Example: `window.config(yes_text="Confirm", no_text="Reject")`
 
-        :param kwargs: The name of an attribute and its new value
+        :param kwargs: The name of a setting and its new value
         """
+        settings.configure(self, kwargs)
 
-        for arg in kwargs:
-            if hasattr(self, arg):
-                previous_value = eval(f"self.{arg}")
-                if not isinstance(kwargs[arg], type(previous_value)) and previous_value is not None:
-                    raise ValueError(f"""Incompatible type {type(kwargs[arg])} for setting: {arg}.\n""" +
-                                     f""" --> Should be {eval('type(self.{})'.format(arg))}""")
-                else:
-                    if arg == "title":
-                        self.master_frame.title(kwargs[arg])
-                    else:
-                        exec("""self.{} = {}""".format(arg, repr(kwargs[arg])))
-            else:
-                raise ValueError(f"Unknown setting: {arg}\n --> This cannot be edited at the present moment.")
+    def _apply_title(self):
+        if getattr(self, "master_frame", None) is not None:
+            self.master_frame.title(self.title)
+
+    def _apply_button_texts(self):
+        if self.return_widget is not ...:
+            self.return_widget.update_texts()
 
     def add_return_widget(
         self,
@@ -141,14 +337,47 @@ class Window:
         :return: the added `EasyReturnWidget` object
         """
 
-        return widgets.EasyReturnWidget(self, window_type, column_span=column_span)
+        return self._add_widget(
+            widgets.EasyReturnWidget,
+            is_returned=False,
+            return_type=window_type,
+            column_span=column_span
+        )
+
+    def _add_widget(self, widget_class: type, is_returned: bool = True, name: str = None, **kwargs) -> widgets.EasyWidget:
+        """
+        Creates a widget of the given class in the window and adds it to the
+        objects, whose values are returned, if `is_returned` is set.
+
+        :param widget_class: The subclass of `widgets.EasyWidget` to create
+        :param name: The key of the value in name-keyed results (see `result_type`),
+            by default the description of the widget
+        :param kwargs: The arguments passed to the widget
+        :return: the added widget
+        """
+        profile_label = f"{self.title}/{widget_class.__name__}#{self._widget_count}"
+        self._widget_count += 1
+        with profiling.scope(phase="construct", widget=profile_label):
+            added_widget = widget_class(self, **kwargs)
+        added_widget.profile_label = profile_label
+        added_widget.name = name if name is not None else kwargs.get("description") or None
+
+        if is_returned:
+            self.return_objects.append(added_widget)
+            self._result_class = None
+
+        return added_widget
 
     def add_file_dialog(
         self,
         description: str,
-        initial_dir: str = _CURRENT_DIR,
+        initial_dir: str = ...,
         filetypes: Union[List[Tuple[str, str]], None] = None,
         default_value: str = ...,
+        check_delay: int = 200,
+        autocomplete: bool = False,
+        dialog: Literal["native", "builtin"] = "native",
+        name: str = None,
         width: int = None,
         height: int = None,
         label_width: int = None,
@@ -163,13 +392,17 @@ class Window:
         """
         Adds a `widgets.EasyFileDialogue` to the window.
         """
-        added_widget = widgets.EasyFileDialog(
-            self,
+        added_widget = self._add_widget(
+            widgets.EasyFileDialog,
             description=description,
             selection_type="file",
             initial_dir=initial_dir,
             filetypes=filetypes,
             default_value=default_value,
+            check_delay=check_delay,
+            autocomplete=autocomplete,
+            dialog=dialog,
+            name=name,
             width=width,
             height=height,
             label_width=label_width,
@@ -182,7 +415,6 @@ class Window:
             add_to_grid=add_to_grid
         )
 
-        self.return_objects.append(added_widget)
         return added_widget
 
     def add_label(
@@ -201,8 +433,9 @@ class Window:
         """
         Adds an `widgets.EasyLabel` to the window.
         """
-        added_widget = widgets.EasyLabel(
-            self,
+        added_widget = self._add_widget(
+            widgets.EasyLabel,
+            is_returned=False,
             text=text,
             width=width,
             height=height,
@@ -221,6 +454,7 @@ class Window:
         self,
         description: str = "",
         default_value: str = "",
+        name: str = None,
         width: int = None,
         height: int = None,
         label_width: int = None,
@@ -236,10 +470,11 @@ class Window:
         Adds a `widgets.EasyEntry` to the window.
         """
 
-        added_widget = widgets.EasyEntry(
-            self,
+        added_widget = self._add_widget(
+            widgets.EasyEntry,
             description=description,
             default_value=default_value,
+            name=name,
             width=width,
             height=height,
             label_width=label_width,
@@ -252,7 +487,6 @@ class Window:
             add_to_grid=add_to_grid
         )
 
-        self.return_objects.append(added_widget)
         return added_widget
 
     def add_text(
@@ -260,6 +494,12 @@ class Window:
         text: str = "",
         export: bool = False,
         monospace: bool = False,
+        max_lines: int = None,
+        autoscroll: bool = True,
+        file_path: str = None,
+        follow_path: str = None,
+        encoding: str = "utf-8",
+        name: str = None,
         width: int = None,
         height: int = None,
         row: int = ...,
@@ -274,11 +514,18 @@ class Window:
         Adds a `widgets.EasyText` to the window.
         """
 
-        added_widget = widgets.EasyText(
-            self,
+        added_widget = self._add_widget(
+            widgets.EasyText,
+            is_returned=export,
             text=text,
             export=export,
             monospace=monospace,
+            max_lines=max_lines,
+            autoscroll=autoscroll,
+            file_path=file_path,
+            follow_path=follow_path,
+            encoding=encoding,
+            name=name,
             width=width,
             height=height,
             row=row,
@@ -290,15 +537,13 @@ class Window:
             add_to_grid=add_to_grid
         )
 
-        if added_widget.export:
-            self.return_objects.append(added_widget)
-
         return added_widget
 
     def add_checkbutton(
         self,
         description: str = "",
         on: bool = False,
+        name: str = None,
         width: int = None,
         height: int = None,
         row: int = ...,
@@ -313,10 +558,11 @@ class Window:
         Adds a `widgets.EasyCheckbutton` to the window.
         """
 
-        added_widget = widgets.EasyCheckbutton(
-            self,
+        added_widget = self._add_widget(
+            widgets.EasyCheckbutton,
             description=description,
             on=on,
+            name=name,
             width=width,
             height=height,
             row=row,
@@ -328,13 +574,18 @@ class Window:
             add_to_grid=add_to_grid
         )
 
-        self.return_objects.append(added_widget)
         return added_widget
 
     def add_combobox(
         self,
-        values: List[str],
+        values: Union[Iterable[str], Callable[[], Iterable[str]]],
         description: str = "",
+        default_value: str = ...,
+        cache_key: Hashable = ...,
+        typeahead: bool = False,
+        max_results: int = 20,
+        debounce: int = 150,
+        name: str = None,
         width: int = None,
         height: int = None,
         label_width: int = None,
@@ -350,10 +601,16 @@ class Window:
         Adds a `widgets.EasyCombobox` to the window.
         """
 
-        added_widget = widgets.EasyCombobox(
-            self,
+        added_widget = self._add_widget(
+            widgets.EasyCombobox,
             values=values,
             description=description,
+            default_value=default_value,
+            cache_key=cache_key,
+            typeahead=typeahead,
+            max_results=max_results,
+            debounce=debounce,
+            name=name,
             width=width,
             height=height,
             label_width=label_width,
@@ -366,14 +623,15 @@ class Window:
             add_to_grid=add_to_grid
         )
 
-        self.return_objects.append(added_widget)
         return added_widget
 
     def add_listbox(
         self,
-        values: List[str],
+        values: Iterable[str],
         description: str = "",
         select_mode: Literal['browse', 'single', 'extended', 'multiple'] = 'browse',
+        filter_mode: Literal['none', 'prefix', 'substring'] = 'none',
+        name: str = None,
         width: int = None,
         height: int = None,
         label_width: int = None,
@@ -389,11 +647,61 @@ class Window:
         Adds a `widgets.EasyCombobox` to the window.
         """
 
-        added_widget = widgets.EasyListbox(
-            self,
+        added_widget = self._add_widget(
+            widgets.EasyListbox,
+            values=values,
+            description=description,
+            select_mode=select_mode,
+            filter_mode=filter_mode,
+            name=name,
+            width=width,
+            height=height,
+            label_width=label_width,
+            row=row,
+            column=column,
+            column_span=column_span,
+            frame=frame,
+            anchor=anchor,
+            justify=justify,
+            add_to_grid=add_to_grid
+        )
+
+        return added_widget
+
+    def add_virtual_listbox(
+        self,
+        values: Union[Sequence[str], Callable[[int], str]],
+        description: str = "",
+        length: int = None,
+        select_mode: Literal['browse', 'single', 'extended', 'multiple'] = 'browse',
+        rows: int = 10,
+        overscan: int = 2,
+        name: str = None,
+        width: int = None,
+        height: int = None,
+        label_width: int = None,
+        row: int = ...,
+        column: int = 0,
+        column_span: int = 1,
+        frame: tk.Frame = ...,
+        anchor: ANCHORS = "center",
+        justify: JUSTIFICATIONS = "left",
+        add_to_grid: bool = True
+    ):
+        """
+        Adds a `widgets.EasyVirtualListbox` to the window, which only
+        materializes the visible rows of large lists of values.
+        """
+
+        added_widget = self._add_widget(
+            widgets.EasyVirtualListbox,
             values=values,
+            length=length,
             description=description,
             select_mode=select_mode,
+            rows=rows,
+            overscan=overscan,
+            name=name,
             width=width,
             height=height,
             label_width=label_width,
@@ -406,6 +714,68 @@ class Window:
             add_to_grid=add_to_grid
         )
 
-        self.return_objects.append(added_widget)
         return added_widget
 
+
+class WindowFuture(Future):
+    """
+    Result of a window shown with `show(block=False)`, which resolves to the
+    value(s) of the window, once it is closed. Cancelling the future closes
+    the window.
+
+    Unlike a plain `concurrent.futures.Future`, waiting for the result on
+    the thread of the window runs the event loop instead of blocking it.
+    """
+
+    def __init__(self, window: Window):
+        super().__init__()
+        self.window = window
+        self.add_done_callback(window._on_future_done)
+
+    def result(self, timeout: float = None):
+        return super().result(self._wait(timeout))
+
+    def exception(self, timeout: float = None):
+        return super().exception(self._wait(timeout))
+
+    def _wait(self, timeout: Optional[float]) -> Optional[float]:
+        """
+        Runs the event loop until the window is closed or the timeout
+        expires, if called on the thread of the window, and returns the
+        remaining timeout. Blocking that thread would keep the window from
+        ever being closed.
+        """
+        if self.done() or threading.get_ident() != self.window._thread_id:
+            return timeout
+
+        if timeout is None:
+            self.window.wait()
+            # A window, that is still open (e.g. in testing mode), raises a `TimeoutError`
+            return 0
+
+        deadline = time.monotonic() + timeout
+        root = ROOT_MANAGER.get_root()
+        advance = getattr(root, "advance", None)
+        while not self.done() and time.monotonic() < deadline:
+            if advance is not None:
+                # The headless root runs on a virtual clock, which follows the polling
+                advance(workers.PUMP_INTERVAL)
+            else:
+                root.update()
+            time.sleep(min(workers.PUMP_INTERVAL / 1000, max(deadline - time.monotonic(), 0)))
+
+        return 0
+
+
+# ------------------------------
+# Functions
+#
+def gather(*windows: Window) -> List[Union[Tuple, bool, None]]:
+    """
+    Shows all given windows at once (if they are not shown yet) and returns
+    their values in the given order, once all of them are closed.
+
+    Example: `first, second = easytk.gather(first_window, second_window)`
+    """
+    futures = [window.future if window.future is not None else window.show(block=False) for window in windows]
+    return [future.result() for future in futures]
@@ -0,0 +1,238 @@
+"""
+This module runs functions on worker threads and hands their results back
+to the thread of the tkinter event loop.
+
+tkinter objects may only be used from the thread, which created the root
+object. Therefore, the result of a background call is not passed to its
+callback by the worker thread. Instead, the event loop polls the future of
+the call with `after()` and calls the callback itself:
+
+    task = run_in_background(window.master_frame, fetch_values, on_result=combobox.set_values)
+    task.cancel()
+
+The other direction is covered by the `UpdateQueue`, to which worker threads
+post calls, that are run on the event loop (see `Window.post`).
+"""
+
+# ------------------------------
+# Imports
+#
+import collections
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+# ------------------------------
+# Globals
+#
+MAX_WORKERS = 4
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+# Delay in milliseconds between draining the update queue (about one frame)
+PUMP_INTERVAL = 16
+
+
+# ------------------------------
+# Classes
+#
+class BackgroundTask:
+    """
+    A function running on a worker thread, whose result is passed to
+    `on_result` (or its exception to `on_error`) on the event loop.
+    """
+
+    def __init__(
+            self,
+            tk_object,
+            future: Future,
+            on_result: Callable[[Any], None] = None,
+            on_error: Callable[[BaseException], None] = None,
+            poll_interval: int = 10
+    ):
+        """
+        :param tk_object: The tkinter widget, whose event loop is used for polling
+        :param future: The future of the function call
+        :param on_result: Called with the result of the function
+        :param on_error: Called with the exception raised by the function,
+            if not given, the exception is raised on the event loop
+        :param poll_interval: The delay between checking the future in milliseconds
+        """
+        self.tk_object = tk_object
+        self.future = future
+        self.on_result = on_result
+        self.on_error = on_error
+        self.poll_interval = poll_interval
+        self.cancelled: bool = False
+        self._after_id: Optional[str] = tk_object.after(0, self._poll)
+
+    @property
+    def active(self) -> bool:
+        """
+        Returns if the result has not been handed to the callbacks yet.
+        """
+        return self._after_id is not None
+
+    def cancel(self):
+        """
+        Discards the result of the call. The function itself is only
+        stopped, if it has not been started by a worker yet.
+        """
+        if not self.active:
+            return
+
+        self.cancelled = True
+        self.future.cancel()
+        try:
+            self.tk_object.after_cancel(self._after_id)
+        except Exception:
+            # The widget might already be destroyed together with its window
+            pass
+        self._after_id = None
+
+    def _poll(self):
+        """
+        Passes the result to the callbacks, once the call is done.
+        """
+        if not self.future.done():
+            self._after_id = self.tk_object.after(self.poll_interval, self._poll)
+            return
+
+        self._after_id = None
+        error = self.future.exception()
+        if error is None:
+            if self.on_result is not None:
+                self.on_result(self.future.result())
+        elif self.on_error is not None:
+            self.on_error(error)
+        else:
+            raise error
+
+
+class UpdateQueue:
+    """
+    Calls posted by any thread, which are run on the event loop of
+    `tk_object`. The queue is a `collections.deque`, whose `append` and
+    `popleft` are atomic, so that posting never waits for a lock held by
+    the event loop. It is drained by a pump, which runs every
+    `PUMP_INTERVAL` milliseconds via `after()`.
+
+    Calls posted with the same `key` are coalesced: only the latest one is
+    run, if several are posted between two runs of the pump.
+    """
+
+    def __init__(self, tk_object, interval: int = PUMP_INTERVAL):
+        """
+        :param tk_object: The tkinter widget, whose event loop runs the calls
+        :param interval: The delay between draining the queue in milliseconds
+        """
+        self.tk_object = tk_object
+        self.interval = interval
+        self.closed: bool = False
+        self._queue: "collections.deque[Tuple[Any, Optional[Callable], tuple]]" = collections.deque()
+        self._latest: Dict[Hashable, Tuple[Callable, tuple]] = {}
+        self._after_id: Optional[str] = None
+        self._thread_id: int = threading.get_ident()
+
+    def post(self, function: Callable[..., Any], *args, key: Hashable = None) -> None:
+        """
+        Runs `function(*args)` on the event loop. Can be called from any thread.
+
+        :param key: Calls with the same key are coalesced, only the latest is run
+        """
+        if self.closed:
+            return
+
+        if key is None:
+            self._queue.append((None, function, args))
+        else:
+            # The queue only holds a marker, the pump runs the latest call for the key
+            self._latest[key] = (function, args)
+            self._queue.append((key, None, ()))
+
+        if self._after_id is None and threading.get_ident() == self._thread_id:
+            self.start()
+
+    def start(self) -> None:
+        """
+        Starts the pump. Must be called from the thread of the event loop.
+        """
+        if self._after_id is None and not self.closed:
+            self._after_id = self.tk_object.after(self.interval, self._pump)
+
+    def close(self) -> None:
+        """
+        Stops the pump and discards all pending calls.
+        """
+        self.closed = True
+        if self._after_id is not None:
+            try:
+                self.tk_object.after_cancel(self._after_id)
+            except Exception:
+                # The widget might already be destroyed together with its window
+                pass
+            self._after_id = None
+        self._queue.clear()
+        self._latest.clear()
+
+    def drain(self) -> int:
+        """
+        Runs the calls, which were posted before the drain started.
+
+        :return: the number of calls run
+        """
+        queue, latest = self._queue, self._latest
+        count = 0
+        for _ in range(len(queue)):
+            key, function, args = queue.popleft()
+            if key is not None:
+                entry = latest.pop(key, None)
+                if entry is None:
+                    # Already run for an earlier marker of the same key
+                    continue
+                function, args = entry
+            count += 1
+            function(*args)
+
+        return count
+
+    def _pump(self):
+        self._after_id = None
+        try:
+            self.drain()
+        finally:
+            self.start()
+
+
+# ------------------------------
+# Functions
+#
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Returns the executor shared by all windows, which is created on first use.
+    """
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="easytk")
+
+    return _EXECUTOR
+
+
+def run_in_background(
+        tk_object,
+        function: Callable[..., Any],
+        *args,
+        on_result: Callable[[Any], None] = None,
+        on_error: Callable[[BaseException], None] = None,
+        poll_interval: int = 10
+) -> BackgroundTask:
+    """
+    Calls `function` with the given arguments on a worker thread and passes
+    its result to `on_result` on the event loop of `tk_object`.
+
+    :return: the `BackgroundTask`, which can be used to discard the result
+    """
+    future = get_executor().submit(function, *args)
+    return BackgroundTask(tk_object, future, on_result, on_error, poll_interval)
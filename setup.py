@@ -23,7 +23,7 @@ AUTHOR = "Malte Herrmann"
 AUTHOR_EMAIL = "malteherrmann.mail@web.de"
 URL = "https://github.com/MalteHerrmann/easy-toolkit"
 LICENSE = license_contents
-PACKAGES = find_packages(exclude=["examples", "tests", "tests.*"])
+PACKAGES = find_packages(exclude=["benchmarks", "examples", "tests", "tests.*"])
 
 CLASSIFIERS = [
     "Development Status :: 2 - Pre-Alpha",
@@ -0,0 +1,10 @@
+"""
+Shared configuration of the `easytk` tests.
+
+The tests use the headless backend by default, so that they run without
+a display. Set `EASYTK_BACKEND=tkinter` to run them against real tkinter widgets.
+"""
+
+import os
+
+os.environ.setdefault("EASYTK_BACKEND", "headless")
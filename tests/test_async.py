@@ -0,0 +1,137 @@
+"""
+Unit-testing module for the asyncio integration of `easytk` windows.
+"""
+
+# --------------------
+# Imports
+#
+import sys
+import os
+import asyncio
+import concurrent.futures
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import easytk
+
+
+# --------------------
+# Tests
+#
+def test_show_async_should_return_same_values_as_show():
+    def build():
+        window = easytk.Window("Selection")
+        window.add_entry("Name", default_value="Test")
+        window.add_checkbutton("Check", on=True)
+        window.master_frame.after(30, lambda: window.return_widget.get_return_values())
+        return window
+
+    assert asyncio.run(build().show_async()) == build().show() == ("Test", 1)
+
+
+def test_show_async_should_not_block_other_tasks():
+    window = easytk.Window("YesNo")
+    ticks = []
+
+    async def other_task():
+        for _ in range(3):
+            ticks.append(len(ticks))
+            await asyncio.sleep(0)
+        window.return_widget.yes_clicked()
+
+    async def main():
+        task = asyncio.ensure_future(other_task())
+        result = await window.show_async(poll_interval=1)
+        await task
+        return result
+
+    assert asyncio.run(main()) is True
+    assert ticks == [0, 1, 2]
+
+
+def test_async_callbacks_should_run_on_event_loop():
+    window = easytk.Window("YesNo")
+    label = window.add_label("start")
+    events = []
+
+    async def on_event(event):
+        events.append(event)
+        await asyncio.sleep(0)
+        label.set("done")
+        window.return_widget.yes_clicked()
+
+    label.bind_async("<<Done>>", on_event)
+    window.master_frame.after(30, lambda: label.object.event_generate("<<Done>>"))
+    assert asyncio.run(window.show_async()) is True
+    assert len(events) == 1
+    assert label.get() == "done"
+
+
+def test_async_callbacks_should_require_show_async():
+    window = easytk.Window("Selection", testing=True)
+    label = window.add_label("start")
+
+    async def on_event(_):
+        pass
+
+    label.bind_async("<<Done>>", on_event)
+    window.show()
+    with pytest.raises(RuntimeError):
+        window.wrap_callback(on_event)(None)
+    window.close()
+
+
+def test_cancelled_show_async_should_close_window():
+    window = easytk.Window("YesNo")
+
+    async def main():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(window.show_async(), 0.05)
+
+    asyncio.run(main())
+    assert window._closed
+
+
+def test_show_without_blocking_should_return_future():
+    first = easytk.Window("YesNo")
+    second = easytk.Window("Selection")
+    second.add_entry("Name", default_value="Test")
+    first_future = first.show(block=False)
+    second_future = second.show(block=False)
+    assert not first_future.done() and not second_future.done()
+
+    first.master_frame.after(10, second.return_widget.get_return_values)
+    first.master_frame.after(20, first.return_widget.no_clicked)
+    assert first_future.result() is False
+    assert second_future.done()
+    assert second_future.result() == ("Test", )
+
+
+def test_result_should_honor_timeout_on_window_thread():
+    window = easytk.Window("YesNo")
+    future = window.show(block=False)
+    with pytest.raises(concurrent.futures.TimeoutError):
+        future.result(timeout=0.05)
+    assert not future.done()
+
+    window.master_frame.after(10, window.return_widget.yes_clicked)
+    assert future.result(timeout=5) is True
+
+
+def test_gather_should_return_values_of_all_windows():
+    windows = [easytk.Window("YesNo") for _ in range(3)]
+    # The windows are closed in reverse order
+    windows[0].master_frame.after(30, lambda: windows[0].return_widget.yes_clicked())
+    windows[1].master_frame.after(20, lambda: windows[1].return_widget.no_clicked())
+    windows[2].master_frame.after(10, lambda: windows[2].return_widget.yes_clicked())
+    assert easytk.gather(*windows) == [True, False, True]
+
+
+def test_cancelling_future_should_close_window():
+    window = easytk.Window("YesNo")
+    future = window.show(block=False)
+    assert future.cancel()
+    assert future.cancelled()
+    window.wait()
+    assert window._closed
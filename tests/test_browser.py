@@ -0,0 +1,99 @@
+"""
+Unit-testing module for the `easytk` directory browser.
+"""
+
+# --------------------
+# Imports
+#
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from easytk.browser import DirectoryBrowser
+from easytk.root import ROOT_MANAGER
+
+
+# --------------------
+# Helpers
+#
+def new_browser(directory, **kwargs):
+    browser = DirectoryBrowser(str(directory), testing=True, **kwargs)
+    wait_for_entries(browser)
+    return browser
+
+
+def wait_for_entries(browser):
+    loader = browser.listbox.loader
+    loader._thread.join(timeout=5)
+    while loader.active:
+        ROOT_MANAGER.get_root().advance(10)
+
+
+def rows(browser):
+    return [browser.listbox.object.get(idx) for idx in range(browser.listbox.object.size())]
+
+
+def create_files(directory):
+    (directory / "sub").mkdir()
+    (directory / "sub" / "inner.csv").write_text("")
+    (directory / "b.csv").write_text("x" * 2000)
+    (directory / "a.txt").write_text("x" * 10)
+    (directory / "C.csv").write_text("")
+    os.utime(directory / "a.txt", (0, 0))
+
+
+# --------------------
+# Tests
+#
+def test_browser_should_list_sorted_and_filtered_entries(tmp_path):
+    create_files(tmp_path)
+    browser = new_browser(tmp_path, filetypes=[("Tables", "*.csv")])
+    assert [row.split()[0] for row in rows(browser)] == [os.pardir + os.sep, "sub" + os.sep, "b.csv", "C.csv"]
+
+    browser.sort("size")
+    assert [row.split()[0] for row in rows(browser)][2:] == ["C.csv", "b.csv"]
+
+    browser.type_box.set("All files")
+    browser.sort("mtime")
+    assert [row.split()[0] for row in rows(browser)][-1] == "a.txt"
+
+
+def test_browser_should_navigate_and_choose_files(tmp_path):
+    create_files(tmp_path)
+    browser = new_browser(tmp_path)
+    browser.listbox.set("sub" + os.sep)
+    browser.open_selected()
+    wait_for_entries(browser)
+    assert browser.directory == str(tmp_path / "sub")
+
+    browser.listbox.set(rows(browser)[1])
+    browser.listbox.object.event_generate("<<ListboxSelect>>")
+    assert browser.get_path() == str(tmp_path / "sub" / "inner.csv")
+
+
+def test_directory_browser_should_only_list_directories(tmp_path):
+    create_files(tmp_path)
+    browser = new_browser(tmp_path, selection_type="dir")
+    assert rows(browser) == [os.pardir + os.sep, "sub" + os.sep]
+    assert browser.get_path() == str(tmp_path)
+
+    browser.listbox.set("sub" + os.sep)
+    assert browser.get_path() == str(tmp_path / "sub")
+
+
+def test_browser_should_keep_selected_entry_when_sorting(tmp_path):
+    create_files(tmp_path)
+    browser = new_browser(tmp_path, filetypes=[("Tables", "*.csv")])
+    browser.listbox.set(rows(browser)[2])
+    assert browser._get_selected_entry().name == "b.csv"
+
+    browser.sort("size")
+    assert browser._get_selected_entry().name == "b.csv"
+    assert browser.listbox.get().startswith("b.csv")
+
+
+def test_browse_should_return_empty_path_when_closed(tmp_path):
+    browser = new_browser(tmp_path)
+    browser.name_entry.set("typed.csv")
+    # Closing the window by the window manager keeps the return values unset
+    assert browser.browse() == ""
@@ -0,0 +1,152 @@
+"""
+Unit-testing module for loading the values of `easytk` widgets in chunks.
+"""
+
+# --------------------
+# Imports
+#
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import easytk
+from easytk.root import ROOT_MANAGER
+from easytk.widgets import chunked_loader
+
+
+# --------------------
+# Helpers
+#
+def generate(count):
+    for idx in range(count):
+        yield f"value {idx}"
+
+
+def generate_failing(count):
+    yield from generate(count)
+    raise OSError("Connection lost")
+
+
+def advance(ms=1):
+    ROOT_MANAGER.get_root().advance(ms)
+
+
+# --------------------
+# Tests
+#
+def test_listbox_should_load_generator_in_chunks():
+    window = easytk.Window("Selection", testing=True)
+    listbox = window.add_listbox(["old"])
+    loader = listbox.set_values(generate(5), chunk_size=2, time_slice=0)
+    assert listbox.entries == []
+    assert listbox.loading_label.winfo_manager() == "pack"
+
+    advance(0)
+    assert listbox.entries == ["value 0", "value 1"]
+    assert listbox.loading_label.cget("text") == "Loading... (2)"
+
+    for _ in range(3):
+        advance()
+    assert not loader.active
+    assert listbox.object.get(0, "end") == tuple(generate(5))
+    assert listbox.loading_label.winfo_manager() == ""
+
+    listbox.set("value 3")
+    assert listbox.get() == "value 3"
+
+
+def test_listbox_should_keep_duplicates_of_loaded_values():
+    window = easytk.Window("Selection", testing=True)
+    listbox = window.add_listbox(iter(["a", "b", "a"]), select_mode="browse")
+    advance(0)
+    assert listbox.entries == ["a", "b", "a"]
+
+    listbox.set("a")
+    assert listbox.object.curselection() == (0, )
+
+
+def test_threaded_loading_should_deliver_all_values():
+    window = easytk.Window("Selection", testing=True)
+    listbox = window.add_listbox([])
+    loader = listbox.set_values(generate(100), threaded=True)
+    loader._thread.join()
+    while loader.active:
+        advance()
+    assert listbox.entries == list(generate(100))
+
+
+def test_combobox_should_show_first_loaded_value():
+    window = easytk.Window("Selection", testing=True)
+    combobox = window.add_combobox(generate(10))
+    assert combobox.get() == ""
+    advance(0)
+    assert combobox.get() == "value 0"
+    assert combobox.object.cget("values") == tuple(generate(10))
+
+
+def test_set_values_should_cancel_previous_load():
+    window = easytk.Window("Selection", testing=True)
+    combobox = window.add_combobox(["a"])
+    loader = combobox.set_values(generate(10), chunk_size=1, time_slice=0)
+    combobox.set_values(["b", "c"])
+    assert loader.cancelled
+    advance(10)
+    assert combobox.values == ["b", "c"]
+    assert combobox.get() == "a"
+
+
+def test_closing_window_should_cancel_load():
+    window = easytk.Window("Selection", testing=True)
+    listbox = window.add_listbox([])
+    loader = listbox.set_values(generate(10), chunk_size=1, time_slice=0)
+    advance(0)
+    window.close()
+    assert loader.cancelled
+    assert listbox.entries == ["value 0"]
+
+
+def test_slow_iterable_should_stop_at_time_slice(monkeypatch):
+    clock = [0.0]
+    monkeypatch.setattr(chunked_loader.time, "perf_counter", lambda: clock[0])
+
+    def slow_values():
+        for idx in range(1000):
+            clock[0] += 0.005
+            yield idx
+
+    window = easytk.Window("Selection", testing=True)
+    listbox = window.add_listbox([])
+    listbox.set_values(slow_values(), time_slice=0.01)
+    advance(0)
+    assert 0 < len(listbox.entries) <= 16
+    listbox.cancel_loading()
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+def test_loading_error_should_stop_loader(threaded):
+    errors = []
+    window = easytk.Window("Selection", testing=True)
+    listbox = window.add_listbox([])
+    loader = listbox.set_values(generate_failing(3), threaded=threaded, on_error=errors.append)
+    if threaded:
+        loader._thread.join()
+    for _ in range(3):
+        advance()
+
+    assert [str(error) for error in errors] == ["Connection lost"]
+    assert isinstance(loader.error, OSError)
+    assert not loader.active and not loader.done
+    assert listbox.entries == list(generate(3))
+    assert listbox.loading_label.winfo_manager() == ""
+
+
+def test_loading_error_should_be_raised_without_callback():
+    window = easytk.Window("Selection", testing=True)
+    listbox = window.add_listbox([])
+    loader = listbox.set_values(generate_failing(3))
+    with pytest.raises(OSError):
+        advance(0)
+    assert not loader.active
+    assert listbox.loading_label.winfo_manager() == ""
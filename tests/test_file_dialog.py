@@ -0,0 +1,136 @@
+"""
+Unit-testing module for the path checks of the `easytk` file dialog.
+"""
+
+# --------------------
+# Imports
+#
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import easytk
+from easytk.cache import STAT_CACHE
+from easytk.root import ROOT_MANAGER
+from easytk.widgets import easy_file_dialog
+
+
+# --------------------
+# Helpers
+#
+def advance(ms):
+    ROOT_MANAGER.get_root().advance(ms)
+
+
+def finish_check(file_dialog):
+    task = file_dialog._check_task
+    if task is not None:
+        task.future.result(timeout=5)
+        while task.active:
+            advance(10)
+
+
+# --------------------
+# Tests
+#
+def test_check_should_be_debounced_and_run_in_background(tmp_path):
+    STAT_CACHE.clear()
+    window = easytk.Window("Selection", testing=True)
+    file_dialog = window.add_file_dialog("File", check_delay=100)
+    path = tmp_path / "data.txt"
+    path.write_text("data")
+
+    for idx in range(1, len(str(path)) + 1):
+        file_dialog.object_string_var.set(str(path)[:idx])
+        advance(50)
+    assert file_dialog._check_task is None
+
+    advance(50)
+    finish_check(file_dialog)
+    assert file_dialog.object.cget("background") == easy_file_dialog._OK_COLOR
+    assert STAT_CACHE.get(str(path)) == "file"
+
+
+def test_cached_paths_should_be_colored_directly(tmp_path):
+    STAT_CACHE.clear()
+    STAT_CACHE.set(str(tmp_path), "dir")
+    window = easytk.Window("Selection", testing=True)
+    file_dialog = window.add_file_dialog("File", check_delay=0)
+    file_dialog.set(str(tmp_path))
+    advance(0)
+    assert file_dialog._check_task is None
+    assert file_dialog.object.cget("background") == easy_file_dialog._NOT_OK_COLOR
+
+
+def test_stale_checks_should_be_discarded(tmp_path):
+    STAT_CACHE.clear()
+    window = easytk.Window("Selection", testing=True)
+    file_dialog = window.add_file_dialog("File", check_delay=0)
+    file_dialog.set(str(tmp_path / "missing"))
+    advance(0)
+    stale_task = file_dialog._check_task
+
+    file_dialog.set(str(tmp_path / "missing" / "other"))
+    advance(0)
+    assert stale_task.cancelled
+    finish_check(file_dialog)
+    assert file_dialog.object.cget("background") == easy_file_dialog._NOT_OK_COLOR
+
+
+def test_save_path_colors():
+    STAT_CACHE.clear()
+    assert easy_file_dialog._get_path_color(__file__, "save") == easy_file_dialog._OVERWRITE_COLOR
+    assert easy_file_dialog._get_path_color("new.txt", "save") == easy_file_dialog._OK_COLOR
+    missing_dir = os.path.join(os.path.dirname(__file__), "missing", "new.txt")
+    assert easy_file_dialog._get_path_color(missing_dir, "save") == easy_file_dialog._NOT_OK_COLOR
+
+
+def type_path(file_dialog, text):
+    for character in text:
+        file_dialog.object.delete("insert", "end")
+        file_dialog.object.insert("end", character)
+        file_dialog.object.icursor("end")
+        file_dialog.object.event_generate("<KeyRelease>", keysym=character, char=character)
+        task = file_dialog._listing_task
+        if task is not None:
+            task.future.result(timeout=5)
+            while task.active:
+                advance(10)
+
+
+def test_autocomplete_should_complete_matching_entries(tmp_path):
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "table.csv").write_text("")
+    (tmp_path / "data.csv").write_text("")
+    (tmp_path / "data.txt").write_text("")
+    window = easytk.Window("Selection", testing=True)
+    file_dialog = window.add_file_dialog("File", filetypes=[("Tables", "*.csv")], autocomplete=True)
+    file_dialog.set(str(tmp_path) + os.sep)
+    file_dialog.object.icursor("end")
+
+    type_path(file_dialog, "d")
+    assert file_dialog.get() == str(tmp_path / "data") + os.sep
+    assert file_dialog.object.selection == (len(str(tmp_path)) + 2, len(file_dialog.get()))
+
+    file_dialog.cycle_completion(1)
+    assert file_dialog.get() == str(tmp_path / "data.csv")
+
+    file_dialog.cycle_completion(1)
+    file_dialog.accept_completion()
+    task = file_dialog._listing_task
+    task.future.result(timeout=5)
+    while task.active:
+        advance(10)
+    assert file_dialog.get() == str(tmp_path / "data" / "table.csv")
+
+
+def test_directory_completion_should_skip_files(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "setup.py").write_text("")
+    window = easytk.Window("Selection", testing=True)
+    file_dialog = window.add_file_dialog("Directory", autocomplete=True)
+    file_dialog.selection_type = "dir"
+    file_dialog.set(str(tmp_path) + os.sep)
+    file_dialog.object.icursor("end")
+    type_path(file_dialog, "s")
+    assert file_dialog.get() == str(tmp_path / "src") + os.sep
@@ -0,0 +1,85 @@
+"""
+Unit-testing module for the headless `easytk` backend.
+"""
+
+# --------------------
+# Imports
+#
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import easytk
+from easytk.backends import headless
+
+
+# --------------------
+# Tests
+#
+def test_show_should_return_values_of_all_widgets():
+    window = easytk.Window("Selection")
+    window.add_label("Label")
+    window.add_entry("Entry", default_value="Test")
+    window.add_checkbutton("Checkbutton", on=True)
+    window.add_combobox(["a", "b"], "Combobox")
+    window.add_listbox(["x", "y", "z"], "Listbox").set("y")
+    window.add_text("Text", export=True)
+    window.master_frame.after(0, lambda: window.return_widget.get_return_values())
+    assert window.show() == ("Test", 1, "a", "y", "Text")
+
+
+def test_show_without_scheduled_input_should_raise():
+    window = easytk.Window("YesNo")
+    with pytest.raises(headless.TclError):
+        window.show()
+    window.close()
+
+
+def test_widgets_should_be_gridded_on_show():
+    window = easytk.Window("YesNo", testing=True)
+    label = window.add_label("Label")
+    hidden = window.add_entry("Hidden", add_to_grid=False)
+    assert label.grid_object.manager is None
+
+    window.show()
+    assert label.grid_object.grid_info()["row"] == 0
+    assert hidden.grid_object.manager is None
+    assert window.return_widget.grid_object.grid_info()["row"] == 2
+
+
+def test_listbox_should_insert_unknown_values():
+    window = easytk.Window("Selection", testing=True)
+    listbox = window.add_listbox(["a", "b"], select_mode="multiple")
+    listbox.set("c")
+    listbox.set("a")
+    assert listbox.object.size() == 3
+    assert listbox.get() == ["a"]
+
+
+def test_listbox_should_accept_see():
+    window = easytk.Window("Selection", testing=True)
+    listbox = window.add_listbox(["a", "b"])
+    listbox.object.see(1)
+    listbox.object.see("end")
+
+
+def test_text_should_replace_content():
+    window = easytk.Window("Selection", testing=True)
+    text = window.add_text("First line\nSecond line", export=True)
+    assert text.object.get("2.0", "2.end") == "Second line"
+
+    text.set("Replaced")
+    assert text.get() == "Replaced"
+
+
+def test_file_dialog_should_use_dialog_response(tmp_path):
+    window = easytk.Window("Selection", testing=True)
+    file_dialog = window.add_file_dialog("File", filetypes=[("Text files", "*.txt")])
+    headless.filedialog.response = str(tmp_path)
+    try:
+        file_dialog.file_chosen(str(tmp_path), [("Text files", "*.txt")])
+    finally:
+        headless.filedialog.response = ""
+    assert file_dialog.get() == str(tmp_path)
@@ -0,0 +1,88 @@
+"""
+Unit-testing module for the `easytk` layout planner.
+"""
+
+# --------------------
+# Imports
+#
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from easytk.layout import GridLayout
+
+
+# --------------------
+# Helpers
+#
+class GridObject:
+    """
+    Records the grid calls, which would be made on a `tk.Frame`.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def grid(self, **kwargs):
+        self.calls.append(("grid", kwargs))
+
+    def grid_remove(self):
+        self.calls.append(("grid_remove", {}))
+
+
+class Widget:
+    def __init__(self):
+        self.grid_object = GridObject()
+
+
+# --------------------
+# Tests
+#
+def test_place_should_use_next_free_row():
+    layout = GridLayout()
+    frame = object()
+    rows = [layout.place(Widget(), frame).row for _ in range(3)]
+    assert rows == [0, 1, 2]
+    assert layout.row_count(frame) == 3
+
+
+def test_place_should_track_columns():
+    layout = GridLayout()
+    frame = object()
+    layout.place(Widget(), frame, row=0, column=0)
+    layout.place(Widget(), frame, row=0, column=1, column_span=2)
+    assert layout.column_count(frame) == 3
+    assert layout.row_count(frame) == 1
+
+
+def test_place_should_not_grid_before_apply():
+    layout = GridLayout()
+    widget = Widget()
+    layout.place(widget, object())
+    assert widget.grid_object.calls == []
+
+    layout.apply()
+    assert widget.grid_object.calls == [("grid", {"row": 0, "column": 0, "columnspan": 1})]
+
+
+def test_hidden_widget_should_be_removed_on_apply():
+    layout = GridLayout()
+    widget = Widget()
+    layout.place(widget, object())
+    layout.hide(widget)
+    layout.apply()
+    assert [name for name, _ in widget.grid_object.calls] == ["grid", "grid_remove"]
+
+
+def test_return_widget_should_stay_below_widgets_added_after_apply():
+    layout = GridLayout()
+    frame = object()
+    layout.place(Widget(), frame)
+    return_widget = Widget()
+    layout.place(return_widget, frame, is_return_widget=True)
+    layout.apply()
+
+    added = layout.place(Widget(), frame)
+    assert added.row == 1
+    assert layout.return_placement.row == 2
+    assert return_widget.grid_object.calls[-1] == ("grid", {"row": 2, "column": 0, "columnspan": 1})
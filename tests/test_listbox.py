@@ -0,0 +1,84 @@
+"""
+Unit-testing module for the `easytk` listbox.
+"""
+
+# --------------------
+# Imports
+#
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import easytk
+
+
+# --------------------
+# Helpers
+#
+def new_listbox(values, select_mode="multiple"):
+    window = easytk.Window("Selection", testing=True)
+    return window.add_listbox(values, select_mode=select_mode)
+
+
+# --------------------
+# Tests
+#
+def test_set_should_select_first_occurrence():
+    listbox = new_listbox(["a", "b", "a"], select_mode="browse")
+    listbox.set("a")
+    assert listbox.object.curselection() == (0, )
+    assert listbox.get() == "a"
+
+
+def test_insert_values_should_skip_known_values():
+    listbox = new_listbox(["a"])
+    listbox.insert_values(["b", "a", "c", "b"])
+    assert listbox.entries == ["a", "b", "c"]
+    assert listbox.object.get(0, "end") == ("a", "b", "c")
+
+    listbox.set("d")
+    assert listbox.entries[-1] == "d"
+    assert listbox.get() == ["d"]
+
+
+def test_remove_values_should_keep_selection():
+    listbox = new_listbox(["a", "b", "c", "d", "e"])
+    listbox.object.selection_set(3)
+    listbox.remove_values(["b", "c"])
+    assert listbox.object.get(0, "end") == ("a", "d", "e")
+    assert listbox.get() == ["d"]
+
+    listbox.set("e")
+    assert listbox.object.curselection() == (2, )
+
+
+def test_remove_values_with_scattered_values_should_keep_selection():
+    values = [str(idx) for idx in range(100)]
+    listbox = new_listbox(values)
+    listbox.object.selection_set(99)
+    listbox.remove_values(values[:98:2])
+    assert listbox.object.size() == 51
+    assert listbox.get() == ["99"]
+
+
+def test_remove_values_in_bulk_should_remap_selection():
+    values = [str(idx) for idx in range(40)]
+    listbox = new_listbox(values)
+    listbox.object.selection_set(1)
+    # More ranges than `_MAX_DELETE_CALLS`, so that the list is reassigned at once
+    listbox.remove_values(values[::2])
+    assert listbox.object.get(0, "end") == tuple(values[1::2])
+    assert listbox.object.curselection() == (0, )
+    assert listbox.get() == ["1"]
+
+
+def test_get_should_read_selection_with_one_call():
+    profiler = easytk.profiling.enable()
+    try:
+        listbox = new_listbox([str(idx) for idx in range(1000)])
+        listbox.object.selection_set(0, 499)
+        profiler.reset()
+        assert len(listbox.get()) == 500
+        assert sum(group["count"] for group in profiler.to_dict()["phases"].values()) == 1
+    finally:
+        easytk.profiling.disable()
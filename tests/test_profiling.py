@@ -0,0 +1,87 @@
+"""
+Unit-testing module for the `easytk` Tcl call profiler.
+"""
+
+# --------------------
+# Imports
+#
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+
+import pytest
+
+import easytk
+from easytk import profiling
+
+
+# --------------------
+# Fixtures
+#
+@pytest.fixture
+def profiler():
+    profiler = profiling.enable()
+    yield profiler
+    profiling.disable()
+
+
+# --------------------
+# Tests
+#
+def test_profiler_should_record_calls_per_phase(profiler):
+    window = easytk.Window("Selection")
+    window.add_entry("Entry", default_value="Test")
+    # The entry value is mirrored, while the listbox selection is read on collection
+    window.add_listbox(["a", "b"], "Listbox")
+    window.master_frame.after(0, lambda: window.return_widget.get_return_values())
+    window.show()
+
+    data = profiler.to_dict()
+    for phase in ("construct", "layout", "show", "collect"):
+        assert data["phases"][phase]["count"] > 0
+    assert data["phases"]["layout"]["commands"]["grid"]["count"] == 3
+
+
+def test_profiler_should_record_calls_per_widget(profiler):
+    window = easytk.Window("Selection", window_title="Profiled", testing=True)
+    entry = window.add_entry("Entry")
+    window.show()
+    window.return_widget.get_return_values()
+
+    assert entry.profile_label == "Profiled/EasyEntry#0"
+    commands = profiler.to_dict()["widgets"][entry.profile_label]["commands"]
+    assert commands["entry"]["count"] == 1
+    assert commands["get"]["count"] >= 1
+
+
+def test_profiler_should_dump_json(profiler, tmp_path):
+    window = easytk.Window("YesNo", testing=True)
+    window.add_label("Label")
+    window.show()
+
+    path = tmp_path / "calls.json"
+    profiler.dump(str(path))
+    assert "construct" in json.loads(path.read_text())["phases"]
+    assert "construct" in profiler.report()
+
+
+def test_command_name_should_use_widget_subcommand():
+    assert profiling._command_name((".!toplevel.!entry", "xview", "moveto", 1.0)) == "xview"
+    assert profiling._command_name((("frame", ".!toplevel.!frame", "-width", 10), )) == "frame"
+
+
+def test_collecting_mirrored_values_should_not_call_tcl(profiler):
+    window = easytk.Window("Selection", testing=True)
+    entries = [window.add_entry(f"Entry {idx}", default_value=str(idx)) for idx in range(50)]
+    window.add_checkbutton("Check", on=True)
+    window.add_combobox(["a", "b"], "Choice")
+    window.add_file_dialog("File", default_value="path")
+    window.show()
+    entries[0].object.insert("end", "0")
+    window.return_widget.get_return_values()
+
+    assert window.return_values[0] == "00"
+    assert window.return_values[-3:] == (1, "a", "path")
+    assert "collect" not in profiler.to_dict()["phases"]
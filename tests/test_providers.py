@@ -0,0 +1,117 @@
+"""
+Unit-testing module for the value providers of the `easytk` combobox and
+the shared cache.
+"""
+
+# --------------------
+# Imports
+#
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import easytk
+from easytk.cache import PROVIDER_CACHE, TTLCache
+from easytk.root import ROOT_MANAGER
+
+
+# --------------------
+# Helpers
+#
+class Provider:
+    def __init__(self, values):
+        self.values = values
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if isinstance(self.values, Exception):
+            raise self.values
+        return iter(self.values)
+
+
+def finish(task):
+    task.future.exception(timeout=5)
+    while task.active:
+        ROOT_MANAGER.get_root().advance(10)
+
+
+# --------------------
+# Tests
+#
+def test_ttl_cache_should_expire_and_evict_entries():
+    now = [0.0]
+    cache = TTLCache(max_size=2, ttl=10, clock=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+
+    now[0] = 11
+    assert cache.get("a") is None
+    assert cache.get_or_set("a", lambda: 4) == 4
+
+
+def test_provider_should_only_be_called_when_posted():
+    PROVIDER_CACHE.clear()
+    provider = Provider(["a", "b"])
+    window = easytk.Window("Selection", testing=True)
+    combobox = window.add_combobox(provider, default_value="a")
+    assert provider.calls == 0
+    assert combobox.get() == "a"
+
+    combobox.object.post()
+    task = combobox._provider_task
+    assert combobox.loading_label.cget("text") == "Loading..."
+    finish(task)
+    assert provider.calls == 1
+    assert combobox.object.cget("values") == ("a", "b")
+    assert combobox.loading_label.winfo_manager() == ""
+
+    # The values are cached for the following windows
+    window = easytk.Window("Selection", testing=True)
+    combobox = window.add_combobox(provider)
+    combobox.object.post()
+    assert combobox._provider_task is None
+    assert combobox.values == ["a", "b"]
+    assert provider.calls == 1
+
+
+def test_provided_values_should_fill_empty_combobox_and_open_dropdown():
+    PROVIDER_CACHE.clear()
+    window = easytk.Window("Selection", testing=True)
+    combobox = window.add_combobox(Provider(["a", "b"]))
+    assert combobox.get() == ""
+
+    combobox.object.post()
+    assert combobox.object.dropdown_values == ()
+    finish(combobox._provider_task)
+    assert combobox.get() == "a"
+    assert combobox.object.dropdown_values == ("a", "b")
+
+
+def test_failed_provider_should_be_called_again():
+    PROVIDER_CACHE.clear()
+    provider = Provider(RuntimeError("offline"))
+    window = easytk.Window("Selection", testing=True)
+    combobox = window.add_combobox(provider, cache_key="failing")
+    combobox.object.post()
+    finish(combobox._provider_task)
+    assert combobox.loading_label.cget("text") == "Loading failed: offline"
+
+    provider.values = ["x"]
+    combobox.object.post()
+    finish(combobox._provider_task)
+    assert combobox.values == ["x"]
+    assert PROVIDER_CACHE.get("failing") == ["x"]
+
+
+def test_closing_window_should_discard_provided_values():
+    PROVIDER_CACHE.clear()
+    window = easytk.Window("Selection", testing=True)
+    combobox = window.add_combobox(Provider(["a"]))
+    task = combobox.load_values()
+    window.close()
+    assert task.cancelled
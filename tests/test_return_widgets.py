@@ -51,3 +51,20 @@ def test_yes_no_should_return_False():
     returned = window.return_values
     assert returned is False
 
+
+def test_selection_should_return_values_by_name():
+    window = easytk.Window("Selection", testing=True)
+    window.add_entry("Name", default_value="Test")
+    window.add_checkbutton("Active", on=True)
+    window.add_combobox(["a", "b"], "Choice", name="choice")
+    window.add_text("Text", export=True)
+    window.config(result_type="dict")
+    window.show()
+    window.return_widget.get_return_values()
+    assert window.return_values == {"Name": "Test", "Active": 1, "choice": "a", "value_3": "Text"}
+
+    window.result_type = "namedtuple"
+    window.return_widget.get_return_values()
+    assert window.return_values.Name == "Test"
+    assert window.return_values.choice == "a"
+    assert tuple(window.return_values) == ("Test", 1, "a", "Text")
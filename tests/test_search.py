@@ -0,0 +1,117 @@
+"""
+Unit-testing module for the `easytk` search index and the listbox filter.
+"""
+
+# --------------------
+# Imports
+#
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import easytk
+from easytk.search import SearchIndex
+from easytk.widgets import easy_listbox
+
+VALUES = ["Apple", "banana", "Pineapple", "apricot", "grape", "Snapple"]
+
+
+# --------------------
+# Tests
+#
+def test_prefix_search_should_return_original_indices():
+    index = SearchIndex(VALUES)
+    assert index.search("ap") == [0, 3]
+    assert index.search("APP") == [0]
+    assert index.search("x") == []
+    assert index.search("") == list(range(len(VALUES)))
+
+
+def test_limited_prefix_search_should_return_smallest_indices():
+    values = [f"{'ab'[idx % 3 == 0]}{idx}" for idx in range(1000)]
+    index = SearchIndex(values)
+    for query in ("a", "b", "a1", "b99", ""):
+        expected = index.search(query)
+        for limit in (0, 1, 10, 1000):
+            assert index.search(query, limit=limit) == expected[:limit]
+    assert SearchIndex(VALUES).search("apple", mode="substring", limit=2) == [0, 2]
+
+
+def test_substring_search_should_match_index_and_scan():
+    index = SearchIndex(VALUES)
+    for query in ("a", "pp", "app", "apple", "ple", "rap", "zzz"):
+        expected = [idx for idx, value in enumerate(VALUES) if query in value.lower()]
+        assert index.search(query, mode="substring") == expected
+
+
+def test_substring_search_should_narrow_previous_result():
+    index = SearchIndex(VALUES)
+    assert index.substring("a") == [0, 1, 2, 3, 4, 5]
+    assert index.substring("ap") == [0, 2, 3, 4, 5]
+    assert index.substring("b") == [1]
+
+
+def test_listbox_filter_should_keep_original_indices():
+    window = easytk.Window("Selection", testing=True)
+    listbox = window.add_listbox(VALUES, select_mode="multiple", filter_mode="substring")
+    listbox.object.selection_set(0)
+    listbox.object.selection_set(1)
+
+    listbox.filter_var.set("apple")
+    assert listbox.object.get(0, "end") == ("Apple", "Pineapple", "Snapple")
+    assert listbox.visible == [0, 2, 5]
+    assert listbox.object.curselection() == (0, )
+    assert listbox.get() == ["Apple", "banana"]
+
+    listbox.object.selection_set(1)
+    assert listbox.get() == ["Apple", "banana", "Pineapple"]
+
+    listbox.filter_var.set("")
+    assert listbox.object.get(0, "end") == tuple(VALUES)
+    assert listbox.object.curselection() == (0, 1, 2)
+
+
+def test_listbox_filter_should_not_shift_selection():
+    window = easytk.Window("Selection", testing=True)
+    listbox = window.add_listbox(VALUES, filter_mode="substring")
+    listbox.object.selection_set(0)
+
+    listbox.filter_var.set("b")
+    assert listbox.object.curselection() == ()
+    assert listbox.get() == "Apple"
+
+    listbox.filter_var.set("")
+    assert listbox.object.curselection() == (0, )
+    assert listbox.get() == "Apple"
+
+
+def test_listbox_filter_should_cap_shown_rows(monkeypatch):
+    monkeypatch.setattr(easy_listbox, "_MAX_FILTER_ROWS", 3)
+    values = [f"value {idx}" for idx in range(10)]
+    window = easytk.Window("Selection", testing=True)
+    listbox = window.add_listbox(values, select_mode="multiple", filter_mode="prefix")
+    listbox.object.selection_set(5)
+
+    listbox.filter_var.set("val")
+    assert listbox.object.get(0, "end") == tuple(values[:3])
+    listbox.object.selection_set(1)
+    assert listbox.get() == ["value 1", "value 5"]
+
+    listbox.filter_var.set("value 5")
+    assert listbox.object.get(0, "end") == ("value 5", )
+    assert listbox.object.curselection() == (0, )
+
+
+def test_listbox_filter_should_be_reset_on_changes():
+    window = easytk.Window("Selection", testing=True)
+    listbox = window.add_listbox(VALUES, filter_mode="prefix")
+    listbox.filter_var.set("gr")
+    assert listbox.object.get(0, "end") == ("grape", )
+
+    listbox.set("banana")
+    assert listbox.filter_var.get() == ""
+    assert listbox.get() == "banana"
+
+    listbox.insert_values(["graph"])
+    listbox.filter_var.set("gr")
+    assert listbox.object.get(0, "end") == ("grape", "graph")
@@ -0,0 +1,64 @@
+"""
+Unit-testing module for the typed settings of `easytk` windows.
+"""
+
+# --------------------
+# Imports
+#
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import easytk
+from easytk.settings import get_settings
+
+
+# --------------------
+# Tests
+#
+def test_config_should_update_button_texts_of_shown_window():
+    window = easytk.Window("YesNo", testing=True)
+    window.show()
+    window.config(yes_text="Confirm", no_text="Reject", title="Approval")
+
+    assert window.return_widget.yes_button.cget("text") == "Confirm"
+    assert window.return_widget.no_button.cget("text") == "Reject"
+    assert window.master_frame.title() == "Approval"
+
+    window.selection_text = "Unused"
+    window.yes_text = "Accept"
+    assert window.return_widget.yes_button.cget("text") == "Accept"
+    window.close()
+
+
+def test_config_should_apply_buttons_once_per_call(monkeypatch):
+    window = easytk.Window("SelectionFalse", testing=True)
+    window.show()
+    calls = []
+    monkeypatch.setattr(window.return_widget, "update_texts", lambda: calls.append(1))
+    window.config(selection_text="Export", false_text="Abort", result_type="dict")
+    assert calls == [1]
+    assert (window.selection_text, window.false_text, window.result_type) == ("Export", "Abort", "dict")
+    window.close()
+
+
+@pytest.mark.parametrize("settings", [
+    {"unknown_text": "Test"},
+    {"yes_text": 1},
+    {"result_type": "list"},
+    {"no_text": "Valid", "yes_text": None},
+])
+def test_config_should_reject_invalid_settings(settings):
+    window = easytk.Window("YesNo", testing=True)
+    with pytest.raises(ValueError):
+        window.config(**settings)
+    assert (window.yes_text, window.no_text, window.result_type) == ("Yes", "No", "tuple")
+
+
+def test_settings_should_be_collected_once_per_class():
+    settings = get_settings(easytk.Window)
+    assert settings is get_settings(easytk.Window)
+    assert {"title", "yes_text", "no_text", "result_type"} <= set(settings)
+    assert easytk.Window.yes_text.default == "Yes"
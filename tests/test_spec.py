@@ -0,0 +1,91 @@
+"""
+Unit-testing module for the declarative `easytk` window specs.
+"""
+
+# --------------------
+# Imports
+#
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import easytk
+
+
+# --------------------
+# Tests
+#
+def test_compile_spec_should_merge_defaults():
+    template = easytk.compile_spec({
+        "window_type": "Selection",
+        "widgets": [{"type": "entry", "description": "Name"}]
+    })
+    widget_class, kwargs, is_returned = template.widget_calls[0]
+    assert widget_class is easytk.widgets.EasyEntry
+    assert kwargs["description"] == "Name"
+    assert kwargs["default_value"] == ""
+    assert is_returned is True
+
+
+def test_template_should_return_values_by_name():
+    template = easytk.compile_spec({
+        "window_type": "Selection",
+        "settings": {"result_type": "dict"},
+        "widgets": [{"type": "entry", "name": "user", "default_value": "Test"}]
+    })
+    window = template.instantiate(testing=True)
+    window.show()
+    window.return_widget.get_return_values()
+    assert window.return_values == {"user": "Test"}
+
+
+def test_compile_spec_should_accept_json():
+    template = easytk.compile_spec('{"window_type": "YesNo", "widgets": [{"type": "label", "text": "Test"}]}')
+    assert template.window_type == "YesNo"
+    assert template.widget_calls[0][2] is False
+
+
+@pytest.mark.parametrize("spec", [
+    {"window_type": "Unknown"},
+    {"settings": {"unknown_text": "Test"}},
+    {"settings": {"yes_text": 1}},
+    {"widgets": [{"type": "unknown"}]},
+    {"widgets": [{"type": "combobox"}]},
+    {"widgets": [{"type": "entry", "unknown_option": 1}]},
+    {"widgets": [{"type": "listbox", "values": [], "select_mode": "unknown"}]},
+    {"widgets": [{"type": "entry", "name": 1}]},
+    {"settings": {"result_type": "list"}},
+])
+def test_compile_spec_should_reject_invalid_specs(spec):
+    with pytest.raises(ValueError):
+        easytk.compile_spec(spec)
+
+
+def test_template_should_instantiate_windows_repeatedly():
+    template = easytk.compile_spec(easytk.WindowSpec(
+        window_type="Selection",
+        widgets=[easytk.WidgetSpec("entry", {"default_value": "Test123"})]
+    ))
+    for _ in range(2):
+        window = template.instantiate(testing=True)
+        window.show()
+        window.return_widget.get_return_values()
+        assert window.return_values == ("Test123", )
+
+
+def test_template_windows_should_not_share_values():
+    template = easytk.compile_spec({
+        "window_type": "Selection",
+        "widgets": [{"type": "virtual_listbox", "values": ["a", "b"]}]
+    })
+    first = template.instantiate(testing=True).return_objects[0]
+    second = template.instantiate(testing=True).return_objects[0]
+
+    first._values.append("c")
+    first.refresh()
+    second.refresh()
+    assert first.length == 3
+    assert second.length == 2
+    assert template.widget_calls[0][1]["values"] == ["a", "b"]
@@ -0,0 +1,309 @@
+"""
+Unit-testing module for the `easytk` text widget.
+"""
+
+# --------------------
+# Imports
+#
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import easytk
+from easytk.root import ROOT_MANAGER
+from easytk.widgets.file_view import FileTail
+
+
+# --------------------
+# Helpers
+#
+def advance(ms=16):
+    ROOT_MANAGER.get_root().advance(ms)
+
+
+def new_text(**kwargs):
+    window = easytk.Window("Selection", testing=True)
+    return window.add_text(**kwargs)
+
+
+def to_offset(text, index):
+    line, column = map(int, index.split("."))
+    position = 0
+    for _ in range(line - 1):
+        position = text.index("\n", position) + 1
+    return position + column
+
+
+def apply_changes(text, changes):
+    for change in changes:
+        start = to_offset(text, change.start)
+        if change.operation == "insert":
+            text = text[:start] + change.text + text[start:]
+        else:
+            text = text[:start] + change.text + text[to_offset(text, change.end):]
+    return text
+
+
+# --------------------
+# Tests
+#
+def test_appended_text_should_be_inserted_once_per_frame():
+    text = new_text(text="start\n")
+    for idx in range(100):
+        text.append(f"line {idx}\n")
+    assert text.get() == "start\n"
+    assert text._flush_id is not None
+
+    advance()
+    assert text.get() == "start\n" + "".join(f"line {idx}\n" for idx in range(100))
+    assert text._flush_id is None
+
+
+def test_closing_window_should_cancel_pending_flush():
+    text = new_text(text="")
+    scheduler = ROOT_MANAGER.get_root().scheduler
+    pending = scheduler.pending()
+    text.append("line\n")
+    assert scheduler.pending() == pending + 1
+
+    text.main_window.close()
+    assert text._flush_id is None
+    assert scheduler.pending() == pending
+
+
+def test_append_should_fail_while_file_is_shown(tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_text("line\n")
+    text = new_text(text="")
+    text.open_file(str(path))
+    with pytest.raises(RuntimeError):
+        text.append("more\n")
+
+    text.close_file()
+    text.append("more\n")
+    advance()
+    assert text.get() == "more\n"
+
+
+def test_append_lines_should_trim_oldest_lines():
+    text = new_text(max_lines=3)
+    text.append_lines(["a", "b"])
+    text.flush()
+    text.append_lines(["c", "d"])
+    text.flush()
+    assert text.get() == "b\nc\nd\n"
+
+    text.append_lines(str(idx) for idx in range(10))
+    text.append("partial")
+    text.flush()
+    assert text.get() == "7\n8\n9\npartial"
+
+
+def test_autoscroll_should_only_follow_at_bottom():
+    text = new_text()
+    text.object.view = (0.2, 0.7)
+    text.append("new\n")
+    text.flush()
+    assert text.object.view == (0.2, 0.7)
+
+    text.object.view = (0.5, 1.0)
+    text.append("more\n")
+    text.object.view = (0.4, 0.9)
+    text.flush()
+    assert text.object.view == (0.4, 0.9)
+
+    text.object.view = (0.5, 1.0)
+    text.append("more\n")
+    text.flush()
+    assert text.object.view == (0.5, 1.0)
+
+
+def write_lines(path, count):
+    path.write_text("".join(f"line {idx}\n" for idx in range(count)))
+    return str(path)
+
+
+def test_file_view_should_only_show_viewport(tmp_path):
+    path = write_lines(tmp_path / "large.log", 1000)
+    text = new_text(file_path=path)
+    text.object.config(height=10)
+    text.show_file_position(0)
+    assert text.get() == "".join(f"line {idx}\n" for idx in range(10))
+
+    text.scroll_file("moveto", 0.5)
+    first_line = int(text.get().split("\n")[0].split()[1])
+    assert 480 < first_line < 520
+
+    text.scroll_file("scroll", 1, "pages")
+    assert text.get().split("\n")[0] == f"line {first_line + 10}"
+
+    text.scroll_file("moveto", 1.0)
+    assert text.get().split("\n")[-2] == "line 999"
+    assert text.get().count("\n") == 10
+
+
+def test_file_view_should_index_lines_in_background(tmp_path):
+    path = write_lines(tmp_path / "large.log", 1000)
+    text = new_text(file_path=path)
+    text.file_view.index_done.wait(timeout=5)
+    assert text.file_view.line_count == 1000
+
+    assert text.goto_line(123)
+    assert text.get().startswith("line 123\n")
+    assert text.file_view.line_number(text.file_position) == 123
+
+    file_view = text.file_view
+    text.main_window.close()
+    assert text.file_view is None
+    assert file_view.map.closed
+
+
+def test_follow_file_should_append_new_data(tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_bytes(b"first\n")
+    text = new_text(text="")
+    tail = text.follow_file(str(path), interval=100)
+    advance()
+    assert text.get() == "first\n"
+
+    # A character split between two writes is decoded once complete
+    euro = "€".encode("utf-8")
+    with open(path, "ab") as file:
+        file.write(b"second " + euro[:1])
+    advance(100)
+    with open(path, "ab") as file:
+        file.write(euro[1:] + b"\n")
+    advance(100)
+    advance()
+    assert text.get() == "first\nsecond €\n"
+    assert tail.offset == path.stat().st_size
+
+    text.stop_following()
+    assert text.file_tail is None
+
+
+def test_open_file_should_stop_following(tmp_path):
+    log_path = tmp_path / "log.txt"
+    log_path.write_text("log\n")
+    file_path = tmp_path / "file.txt"
+    file_path.write_text("file\n")
+    text = new_text(text="")
+    tail = text.follow_file(str(log_path), interval=100)
+    advance()
+
+    text.open_file(str(file_path))
+    assert text.file_tail is None
+    assert tail._file is None
+
+    with open(log_path, "a") as file:
+        file.write("more\n")
+    advance(100)
+    assert text.object.get("1.0", "end-1c") == "file\n"
+    text.close_file()
+
+
+def test_follow_file_should_restart_after_truncation_and_rotation(tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_text("old line\n")
+    text = new_text(text="")
+    text.follow_file(str(path), interval=100, from_end=True)
+    advance()
+    assert text.get() == ""
+
+    path.write_text("new\n")
+    advance(100)
+    advance()
+    assert text.get() == "new\n"
+
+    with open(path, "a") as file:
+        file.write("rest\n")
+    os.rename(path, tmp_path / "log.1.txt")
+    path.write_text("rotated\n")
+    advance(100)
+    advance()
+    assert text.get() == "new\nrest\nrotated\n"
+
+
+def test_file_tail_should_drain_rotated_file_before_switching(tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_text("")
+    tail = FileTail(str(path), max_read=4)
+
+    with open(path, "a") as file:
+        file.write("0123456789\n")
+    os.rename(path, tmp_path / "log.1.txt")
+    path.write_text("new\n")
+
+    chunks = []
+    while True:
+        chunk = tail.read()
+        if not chunk:
+            break
+        chunks.append(chunk)
+    tail.close()
+
+    assert all(len(chunk) <= 4 for chunk in chunks)
+    assert "".join(chunks) == "0123456789\nnew\n"
+
+
+def test_get_should_only_copy_changed_text():
+    text = new_text(text="some text")
+    assert text.modified
+    assert text.get() == "some text"
+    assert not text.modified
+
+    def fail(*_):
+        raise AssertionError("The text should not be copied")
+
+    original_get = text.object.get
+    text.object.get = fail
+    assert text.get() == "some text"
+
+    text.object.get = original_get
+    text.object.insert("end", "!")
+    assert text.modified
+    assert text.get() == "some text!"
+
+
+def test_get_changes_should_require_previous_export():
+    text = new_text(text="some text")
+    assert text.get_changes() is None
+    text.object.insert("end", "!")
+    assert text.get_changes() == [easytk.widgets.TextChange("insert", "1.9", "1.10", "!")]
+
+
+def test_get_changes_should_return_edits_since_export():
+    text = new_text(text="first\nsecond\n")
+    exported = text.get()
+
+    text.object.insert("2.0", "new\n")
+    text.object.delete("1.0", "1.end")
+    text.append("third\n")
+    advance()
+    changes = text.get_changes()
+    assert [change.operation for change in changes] == ["insert", "delete", "insert"]
+    assert apply_changes(exported, changes) == text.get() == "\nnew\nsecond\nthird\n"
+    assert text.get_changes() == []
+
+    # Too many changes are not tracked
+    for _ in range(1001):
+        text.object.insert("end", "x")
+    assert text.get_changes() is None
+    assert text.get().endswith("x" * 1001)
+
+
+def test_ignored_edits_should_not_be_recorded():
+    text = new_text(text="content")
+    text.get()
+    text.object.insert("end", "")
+    text.object.delete("1.3", "1.1")
+    text.object.config(state="disabled")
+    text.object.insert("end", "!")
+    text.object.delete("1.0", "end")
+    text.object.config(state="normal")
+
+    assert not text.modified
+    assert text.get_changes() == []
+    assert text.get() == "content"
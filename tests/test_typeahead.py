@@ -0,0 +1,59 @@
+"""
+Unit-testing module for the typeahead mode of the `easytk` combobox.
+"""
+
+# --------------------
+# Imports
+#
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import easytk
+from easytk.root import ROOT_MANAGER
+from easytk.search import SearchIndex
+
+VALUES = ["apple", "banana", "pineapple", "Application", "maple syrup", "a-p-l"]
+
+
+# --------------------
+# Helpers
+#
+def type_text(combobox, text):
+    for idx in range(1, len(text) + 1):
+        combobox.object.set(text[:idx])
+        combobox.object.event_generate("<KeyRelease>", keysym=text[idx - 1])
+
+
+# --------------------
+# Tests
+#
+def test_rank_should_order_prefix_substring_and_fuzzy_matches():
+    index = SearchIndex(VALUES)
+    assert index.rank("apl") == [4, 0, 3, 2, 5]
+    assert index.rank("app", limit=2) == [0, 3]
+    assert index.rank("") == list(range(len(VALUES)))
+    assert index.rank("xyz") == []
+
+
+def test_typeahead_should_list_best_matches_after_debounce():
+    window = easytk.Window("Selection", testing=True)
+    combobox = window.add_combobox(VALUES, typeahead=True, max_results=3, debounce=100)
+    assert combobox.object.cget("values") == ("apple", "banana", "pineapple")
+
+    type_text(combobox, "apl")
+    ROOT_MANAGER.get_root().advance(50)
+    assert combobox.object.cget("values") == ("apple", "banana", "pineapple")
+
+    ROOT_MANAGER.get_root().advance(50)
+    assert combobox.object.cget("values") == ("maple syrup", "apple", "Application")
+    assert combobox.get() == "apl"
+
+
+def test_typeahead_should_update_matches_when_posted():
+    window = easytk.Window("Selection", testing=True)
+    combobox = window.add_combobox(VALUES, typeahead=True, max_results=2)
+    type_text(combobox, "ban")
+    combobox.object.post()
+    assert combobox.object.cget("values") == ("banana", )
+    assert combobox._pending_update is None
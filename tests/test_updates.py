@@ -0,0 +1,88 @@
+"""
+Unit-testing module for the thread-safe update queue of `easytk` windows.
+"""
+
+# --------------------
+# Imports
+#
+import sys
+import os
+import threading
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import easytk
+from easytk.root import ROOT_MANAGER
+
+
+# --------------------
+# Helpers
+#
+def advance(ms=16):
+    ROOT_MANAGER.get_root().advance(ms)
+
+
+def run_threads(target, count=4):
+    threads = [threading.Thread(target=target, args=(idx,)) for idx in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+# --------------------
+# Tests
+#
+def test_set_threadsafe_should_only_apply_latest_value():
+    window = easytk.Window("Selection", testing=True)
+    label = window.add_label("start")
+    window.show()
+    applied = []
+    original_set = label.set
+    label.set = lambda value: (applied.append(value), original_set(value))
+
+    def work(idx):
+        for step in range(100):
+            label.set_threadsafe(f"{idx}-{step}")
+
+    run_threads(work)
+    assert label.get() == "start"
+
+    advance()
+    assert len(applied) == 1
+    assert label.get() == applied[0]
+    assert applied[0].endswith("-99")
+    window.close()
+
+
+def test_post_should_run_calls_in_order_on_event_loop():
+    window = easytk.Window("Selection", testing=True)
+    text = window.add_text()
+    window.show()
+    threads = []
+
+    def work(idx):
+        for step in range(10):
+            window.post(text.append, f"{idx}.{step}\n")
+        threads.append(threading.get_ident())
+
+    run_threads(work, count=2)
+    window.post(lambda: threads.append(threading.get_ident()))
+    advance()
+    advance()
+    lines = text.get().splitlines()
+    assert len(lines) == 20
+    for idx in range(2):
+        assert [line for line in lines if line.startswith(f"{idx}.")] == [f"{idx}.{step}" for step in range(10)]
+    assert threads[-1] == threading.get_ident()
+    window.close()
+
+
+def test_post_after_close_should_be_discarded():
+    window = easytk.Window("Selection", testing=True)
+    calls = []
+    window.post(calls.append, 1)
+    window.close()
+    window.post(calls.append, 2)
+    advance(100)
+    assert calls == []
+    assert not window.updates._queue
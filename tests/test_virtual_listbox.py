@@ -0,0 +1,148 @@
+"""
+Unit-testing module for the `easytk` virtual listbox.
+"""
+
+# --------------------
+# Imports
+#
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import easytk
+
+
+# --------------------
+# Helpers
+#
+def slot_values(listbox):
+    return list(listbox.object.get(0, "end"))
+
+
+# --------------------
+# Tests
+#
+def test_only_visible_rows_should_be_materialized():
+    requested = []
+
+    def get_row(idx):
+        requested.append(idx)
+        return f"Item {idx}"
+
+    window = easytk.Window("Selection", testing=True)
+    listbox = window.add_virtual_listbox(get_row, length=500000, rows=10, overscan=2)
+    assert slot_values(listbox) == [f"Item {idx}" for idx in range(12)]
+    assert len(requested) == 12
+
+
+def test_scrolling_should_recycle_slots():
+    values = [f"Item {idx}" for idx in range(1000)]
+    window = easytk.Window("Selection", testing=True)
+    listbox = window.add_virtual_listbox(values, rows=10, overscan=2)
+
+    listbox.scroll("scroll", 3, "units")
+    assert listbox.top == 3
+    assert slot_values(listbox) == values[3:15]
+
+    listbox.scroll("scroll", -2, "units")
+    assert slot_values(listbox) == values[1:13]
+
+    listbox.scroll("moveto", 0.5)
+    assert slot_values(listbox) == values[500:512]
+
+    listbox.scroll("moveto", 1.0)
+    assert listbox.top == 990
+    assert slot_values(listbox) == values[990:]
+
+
+def test_selection_should_survive_scrolling():
+    values = [f"Item {idx}" for idx in range(1000)]
+    window = easytk.Window("Selection", testing=True)
+    listbox = window.add_virtual_listbox(values, select_mode="multiple")
+
+    listbox.object.selection_set(1)
+    listbox.object.event_generate("<<ListboxSelect>>")
+    listbox.scroll("moveto", 0.5)
+    listbox.object.selection_set(0)
+    listbox.object.event_generate("<<ListboxSelect>>")
+
+    assert listbox.get() == ["Item 1", "Item 500"]
+    listbox.scroll("moveto", 0.0)
+    assert listbox.object.curselection() == (1, )
+
+
+def test_set_should_select_and_show_value():
+    values = [f"Item {idx}" for idx in range(1000)]
+    window = easytk.Window("Selection", testing=True)
+    listbox = window.add_virtual_listbox(values)
+
+    listbox.set("Item 700")
+    assert listbox.get() == "Item 700"
+    assert listbox.top <= 700 < listbox.top + listbox.rows
+    with pytest.raises(ValueError):
+        listbox.set("Unknown")
+
+
+def test_select_should_not_fetch_other_values():
+    requested = []
+
+    def get_row(idx):
+        requested.append(idx)
+        return f"Item {idx}"
+
+    window = easytk.Window("Selection", testing=True)
+    listbox = window.add_virtual_listbox(get_row, length=500000, rows=10, overscan=2)
+    requested.clear()
+    listbox.select(400000)
+    assert listbox.get() == "Item 400000"
+    assert len(requested) <= 13
+    with pytest.raises(IndexError):
+        listbox.select(500000)
+
+
+def test_description_should_be_second_positional_argument():
+    window = easytk.Window("Selection", testing=True)
+    listbox = window.add_virtual_listbox(["a", "b"], "Letters")
+    assert listbox.label_string_var.get() == "Letters"
+    assert listbox.length == 2
+
+
+def test_refresh_should_show_appended_values():
+    values = ["Item 0", "Item 1"]
+    window = easytk.Window("Selection", testing=True)
+    listbox = window.add_virtual_listbox(values, rows=10, overscan=2)
+
+    values.extend(["Item 2", "Item 3"])
+    listbox.refresh()
+    assert listbox.length == 4
+    assert slot_values(listbox) == values
+
+
+def test_keys_should_scroll_rows_at_the_edges():
+    values = [f"Item {idx}" for idx in range(1000)]
+    window = easytk.Window("Selection", testing=True)
+    listbox = window.add_virtual_listbox(values, rows=10, overscan=2)
+
+    for _ in range(10):
+        listbox.object.event_generate("<Down>", keysym="Down")
+    assert listbox.get() == "Item 10"
+    assert listbox.top == 1
+    assert listbox.object.curselection() == (9, )
+    assert listbox.object.yview()[0] == 0
+
+    listbox.object.event_generate("<Next>", keysym="Next")
+    assert listbox.get() == "Item 20"
+    assert listbox.top == 11
+
+    listbox.scroll("moveto", 0.5)
+    listbox.set("Item 500")
+    listbox.object.event_generate("<Up>", keysym="Up")
+    assert listbox.get() == "Item 499"
+    assert listbox.top == 499
+    assert listbox.object.curselection() == (0, )
+
+    listbox.object.event_generate("<Prior>", keysym="Prior")
+    assert listbox.get() == "Item 489"
+    assert listbox.top == 489